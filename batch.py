@@ -0,0 +1,620 @@
+import bpy
+import json
+import re
+import sys
+import time
+from .core import parse_channel, channel_name
+from .core_functions import (
+    CLAMP_MODES, build_source_path, ensure_euler_targets, run_driver_jobs,
+    get_source_owner_limits, apply_source_limits, get_driver_source, build_driver_jobs,
+    iter_easydriver_drivers, get_driver_source_channel, profile_drivers,
+    run_hub_driver_jobs, collect_hub_drivers, get_hub_reader_key, HUB_PROPERTY_PREFIX,
+    get_easydriver_limit_constraints, get_limit_constraint_axes
+)
+
+#---------------------------------------
+# Driver Setup Specs
+#---------------------------------------
+# A spec describes driver setups without any panel state:
+#
+# {
+#   "version": 1,
+#   "setups": [{
+#     "name": "jaw_open",
+#     "source": {"armature": "Rig", "bone": "jaw_ctrl"},     or {"object": "Empty"}
+#     "channel": "LOC Z", "range": [0.0, 0.05],
+#     "clamp_mode": "DRIVER",                                 DRIVER, CONSTRAINT or BOTH
+#     "hub": false,                                           optional, targets read one 0-1 hub property
+#     "targets": {
+#       "pose": [{"armature": "Rig", "bone": "jaw", "channel": "ROT X", "range": [0.0, 0.4]}],
+#       "shapekeys": [{"object": "Face", "shapekey": "jawOpen", "range": [0.0, 1.0]}],
+#       "paths": [{"path": "Face.data.shape_keys.key_blocks[\"A\"].value", "range": [0.0, 1.0]}]
+#     }
+#   }]
+# }
+SPEC_VERSION = 1
+
+def load_spec(path):
+    """Load a spec from a .json or .toml file."""
+    if path.lower().endswith('.toml'):
+        import tomllib  # Python 3.11+, bundled with Blender 4.x
+        with open(path, 'rb') as spec_file:
+            return tomllib.load(spec_file)
+
+    with open(path, 'r', encoding='utf-8') as spec_file:
+        return json.load(spec_file)
+
+def save_spec(spec, path):
+    """Write a spec as JSON."""
+    with open(path, 'w', encoding='utf-8') as spec_file:
+        json.dump(spec, spec_file, indent=2)
+
+def is_number(value):
+    """True for ints and floats; JSON true/false are not numbers here."""
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+def is_name(value):
+    return isinstance(value, str) and bool(value)
+
+def get_range(entry):
+    """Return an entry's (min, max) range, or None when it is missing or not numeric."""
+    value_range = entry.get('range')
+    if not isinstance(value_range, (list, tuple)) or len(value_range) != 2:
+        return None
+    if not all(is_number(value) for value in value_range):
+        return None
+    return float(value_range[0]), float(value_range[1])
+
+def build_name_index():
+    """Index object, bone and shape key names once so large batches avoid per-item lookups.
+
+    Returns {'objects': {name: object}, 'bones': {armature: {bone names}}, 'shapekeys': {object: {key names}}}.
+    Creating drivers never renames anything, so one index can serve any number of specs.
+    """
+    objects = {obj.name: obj for obj in bpy.data.objects}
+    bones = {name: set(obj.pose.bones.keys()) for name, obj in objects.items() if obj.type == 'ARMATURE'}
+    shapekeys = {}
+    for name, obj in objects.items():
+        shape_keys = getattr(obj.data, 'shape_keys', None)
+        if shape_keys:
+            shapekeys[name] = set(shape_keys.key_blocks.keys())
+    return {'objects': objects, 'bones': bones, 'shapekeys': shapekeys}
+
+def validate_setup(setup, name_index=None):
+    """Return a list of problems with one setup; an empty list means it can be applied."""
+    if not isinstance(setup, dict):
+        return ["setup must be an object"]
+    name_index = name_index or build_name_index()
+    objects, bones, shapekeys = name_index['objects'], name_index['bones'], name_index['shapekeys']
+    errors = []
+
+    if 'name' in setup and not isinstance(setup['name'], str):
+        errors.append("'name' must be a string")
+
+    source = setup.get('source')
+    if not isinstance(source, dict):
+        errors.append("source must be an object with 'bone' and 'armature', or 'object'")
+    elif 'bone' in source:
+        armature_name = source.get('armature')
+        if not is_name(armature_name) or not is_name(source['bone']):
+            errors.append("source 'armature' and 'bone' must be names")
+        elif armature_name not in bones:
+            errors.append(f"source armature '{armature_name}' not found")
+        elif source['bone'] not in bones[armature_name]:
+            errors.append(f"source bone '{source['bone']}' not found in '{armature_name}'")
+    elif 'object' in source:
+        if not is_name(source['object']):
+            errors.append("source 'object' must be a name")
+        elif source['object'] not in objects:
+            errors.append(f"source object '{source['object']}' not found")
+    else:
+        errors.append("source needs 'bone' and 'armature', or 'object'")
+
+    if not parse_channel(setup.get('channel')):
+        errors.append(f"invalid source channel '{setup.get('channel')}'")
+    source_range = get_range(setup)
+    if not source_range:
+        errors.append("source 'range' must be [min, max]")
+    elif abs(source_range[1] - source_range[0]) < 0.000001:
+        errors.append("source range is empty")
+
+    clamp_mode = setup.get('clamp_mode', 'DRIVER')
+    if not isinstance(clamp_mode, str) or clamp_mode not in CLAMP_MODES:
+        errors.append(f"invalid clamp_mode '{clamp_mode}'")
+    if not isinstance(setup.get('hub', False), bool):
+        errors.append("'hub' must be true or false")
+
+    # Only well-formed target lists are checked further
+    spec_targets = setup.get('targets', {})
+    if not isinstance(spec_targets, dict):
+        errors.append("'targets' must be an object")
+        spec_targets = {}
+    targets = {}
+    for kind in ('pose', 'shapekeys', 'paths'):
+        entries = spec_targets.get(kind, [])
+        if not isinstance(entries, list):
+            errors.append(f"'{kind}' targets must be a list")
+            entries = []
+        elif not all(isinstance(target, dict) for target in entries):
+            errors.append(f"every '{kind}' target must be an object")
+        targets[kind] = [target for target in entries if isinstance(target, dict)]
+
+    for target in targets.get('pose', []):
+        armature_name = target.get('armature')
+        if not is_name(armature_name) or not is_name(target.get('bone')):
+            errors.append("pose target 'armature' and 'bone' must be names")
+        elif armature_name not in bones:
+            errors.append(f"target armature '{armature_name}' not found")
+        elif target['bone'] not in bones[armature_name]:
+            errors.append(f"target bone '{target['bone']}' not found in '{armature_name}'")
+        if not parse_channel(target.get('channel')):
+            errors.append(f"invalid target channel '{target.get('channel')}' for '{target.get('bone')}'")
+        if not get_range(target):
+            errors.append(f"target '{target.get('bone')}' needs a [min, max] range")
+
+    for target in targets.get('shapekeys', []):
+        if not is_name(target.get('object')) or not is_name(target.get('shapekey')):
+            errors.append("shape key target 'object' and 'shapekey' must be names")
+        elif target['shapekey'] not in shapekeys.get(target['object'], ()):
+            errors.append(f"shape key '{target['shapekey']}' not found on '{target['object']}'")
+        if not get_range(target):
+            errors.append(f"shape key '{target.get('shapekey')}' needs a [min, max] range")
+
+    for target in targets.get('paths', []):
+        if not is_name(target.get('path')):
+            errors.append("path target without 'path'")
+        if not get_range(target):
+            errors.append(f"path '{target.get('path')}' needs a [min, max] range")
+
+    if not any(targets.get(kind) for kind in ('pose', 'shapekeys', 'paths')):
+        errors.append("setup has no targets")
+
+    return errors
+
+def setup_to_jobs(setup):
+    """Convert a validated setup into (source, jobs) for run_driver_jobs."""
+    source_spec = setup['source']
+    prop, axis = parse_channel(setup['channel'])
+    from_min, from_max = get_range(setup)
+
+    if 'bone' in source_spec:
+        source = {'kind': 'bone', 'owner': source_spec['bone'], 'armature_name': source_spec['armature']}
+    else:
+        source = {'kind': 'object', 'owner': source_spec['object'], 'armature_name': source_spec['object']}
+    source.update({'property': prop, 'axis': axis, 'from_min': from_min, 'from_max': from_max})
+    source['from_path'] = build_source_path(source)
+
+    targets = setup.get('targets') or {}
+    jobs = []
+    for target in targets.get('pose', []):
+        to_prop, to_axis = parse_channel(target['channel'])
+        to_min, to_max = get_range(target)
+        jobs.append({
+            'kind': 'bone',
+            'armature': target['armature'],
+            'bone': target['bone'],
+            'property': to_prop,
+            'axis': to_axis,
+            'to_path': f"{target['armature']}.pose.bones[\"{target['bone']}\"].{to_prop}[{to_axis}]",
+            'to_min': to_min,
+            'to_max': to_max,
+        })
+    for target in targets.get('shapekeys', []):
+        to_min, to_max = get_range(target)
+        jobs.append({
+            'kind': 'shapekey',
+            'object': target['object'],
+            'shapekey': target['shapekey'],
+            'to_path': f"{target['object']}.data.shape_keys.key_blocks[\"{target['shapekey']}\"].value",
+            'to_min': to_min,
+            'to_max': to_max,
+        })
+    for target in targets.get('paths', []):
+        to_min, to_max = get_range(target)
+        jobs.append({'kind': 'path', 'to_path': target['path'], 'to_min': to_min, 'to_max': to_max})
+
+    return source, jobs
+
+def apply_spec(spec, fail_fast=True, name_index=None):
+    """Create every driver in a spec in one batch and return a JSON-serializable report.
+
+    All setups are validated first; with fail_fast, nothing is changed when any setup is
+    invalid. Otherwise invalid setups are skipped and the rest are applied. The view layer
+    is updated once at the end. Pass a build_name_index() result to reuse it across specs.
+    """
+    start_time = time.perf_counter()
+    report = {'version': SPEC_VERSION, 'ok': True, 'created': 0, 'expected': 0, 'setups': []}
+
+    if not isinstance(spec, dict):
+        report['ok'] = False
+        report['error'] = "spec must be an object with 'version' and 'setups'"
+        return report
+
+    version = spec.get('version', SPEC_VERSION)
+    if not isinstance(version, int) or isinstance(version, bool):
+        report['ok'] = False
+        report['error'] = f"spec version must be an integer, got {version!r}"
+        return report
+    if version > SPEC_VERSION:
+        report['ok'] = False
+        report['error'] = f"spec version {version} is newer than supported version {SPEC_VERSION}"
+        return report
+
+    setups = spec.get('setups', [])
+    if not isinstance(setups, list):
+        report['ok'] = False
+        report['error'] = "'setups' must be a list"
+        return report
+
+    name_index = name_index or build_name_index()
+    results = []
+    for index, setup in enumerate(setups):
+        name = setup.get('name') if isinstance(setup, dict) else None
+        results.append({'name': name if isinstance(name, str) else f"setup_{index}",
+                        'errors': validate_setup(setup, name_index), 'created': 0, 'expected': 0})
+    report['setups'] = results
+
+    if any(result['errors'] for result in results):
+        report['ok'] = False
+        if fail_fast:
+            report['elapsed_ms'] = (time.perf_counter() - start_time) * 1000.0
+            return report
+
+    for setup, result in zip(setups, results):
+        if result['errors']:
+            continue
+        source, jobs = setup_to_jobs(setup)
+        clamp_mode = setup.get('clamp_mode', 'DRIVER')
+
+        ensure_euler_targets(jobs)
+        result['expected'] = len(jobs)
+        run_jobs = run_hub_driver_jobs if setup.get('hub') else run_driver_jobs
+        result['created'] = run_jobs(source, jobs, clamp_mode != 'CONSTRAINT')
+        if clamp_mode in ('CONSTRAINT', 'BOTH'):
+            apply_source_limits(get_source_owner_limits(source))
+
+        if result['created'] < result['expected']:
+            result['errors'].append(f"{result['expected'] - result['created']} drivers failed (see console)")
+            report['ok'] = False
+        report['created'] += result['created']
+        report['expected'] += result['expected']
+
+    bpy.context.view_layer.update()
+    report['elapsed_ms'] = (time.perf_counter() - start_time) * 1000.0
+    return report
+
+#---------------------------------------
+# Spec Export
+#---------------------------------------
+# createDriver pads toMax by this much, so it is stripped again when reading drivers back
+TO_MAX_BUFFER = 0.0001
+
+# ID types whose drivers can be written back as bpy.data paths parse_target_path understands
+PATH_ID_COLLECTIONS = {
+    'Object': 'objects', 'Armature': 'armatures', 'Camera': 'cameras', 'Light': 'lights', 'Material': 'materials',
+}
+
+def new_spec(setups=()):
+    """Return an empty spec of the current version, optionally holding setups."""
+    return {'version': SPEC_VERSION, 'setups': list(setups)}
+
+def setup_from_jobs(name, source, jobs, clamp_mode='DRIVER', hub=False):
+    """Build a spec setup from a source dict and job list as used by run_driver_jobs."""
+    if source['kind'] == 'bone':
+        source_spec = {'armature': source['armature_name'], 'bone': source['owner']}
+    else:
+        source_spec = {'object': source['owner']}
+
+    targets = {'pose': [], 'shapekeys': [], 'paths': []}
+    for job in jobs:
+        value_range = [job['to_min'], job['to_max']]
+        if job['kind'] == 'bone':
+            targets['pose'].append({'armature': job['armature'], 'bone': job['bone'],
+                                    'channel': channel_name(job['property'], job['axis']), 'range': value_range})
+        elif job['kind'] == 'shapekey':
+            targets['shapekeys'].append({'object': job['object'], 'shapekey': job['shapekey'], 'range': value_range})
+        else:
+            targets['paths'].append({'path': job['to_path'], 'range': value_range})
+
+    return {
+        'name': name,
+        'source': source_spec,
+        'channel': channel_name(source['property'], source['axis']),
+        'range': [source['from_min'], source['from_max']],
+        'clamp_mode': clamp_mode,
+        'hub': hub,
+        'targets': {kind: entries for kind, entries in targets.items() if entries},
+    }
+
+def setup_from_props(props, name=""):
+    """Build a spec setup from the recorded panel state, or (None, error message)."""
+    source, error = get_driver_source(props)
+    if not source:
+        return None, error
+
+    jobs, error = build_driver_jobs(props)
+    if jobs is None:
+        return None, error
+    if not jobs:
+        return None, "No complete targets to export"
+
+    name = name or f"{source['owner']} {channel_name(source['property'], source['axis'])}"
+    return setup_from_jobs(name, source, jobs, props.clamp_mode, props.use_hub_property), None
+
+def get_driver_target(id_block, fcurve, key_owners):
+    """Describe what an EasyDriver fcurve drives as ('pose'|'shapekeys'|'paths', entry), or None.
+
+    key_owners maps shape key datablock names to the object using them.
+    """
+    data_path, index = fcurve.data_path, fcurve.array_index
+
+    if isinstance(id_block, bpy.types.Key):
+        match = re.match(r'^key_blocks\["(.+)"\]\.value$', data_path)
+        obj_name = key_owners.get(id_block.name)
+        if match and obj_name:
+            return 'shapekeys', {'object': obj_name, 'shapekey': match.group(1)}
+        return None
+
+    if isinstance(id_block, bpy.types.Object) and id_block.type == 'ARMATURE':
+        match = re.match(r'^pose\.bones\["(.+)"\]\.(location|rotation_euler|scale)$', data_path)
+        if match:
+            return 'pose', {'armature': id_block.name, 'bone': match.group(1),
+                            'channel': channel_name(match.group(2), index)}
+
+    collection_name = next((name for type_name, name in PATH_ID_COLLECTIONS.items()
+                            if isinstance(id_block, getattr(bpy.types, type_name))), None)
+    if not collection_name:
+        return None
+    try:
+        value = id_block.path_resolve(data_path)
+    except ValueError:
+        return None
+    path = f'bpy.data.{collection_name}["{id_block.name}"].{data_path}' if not data_path.startswith('[') \
+        else f'bpy.data.{collection_name}["{id_block.name}"]{data_path}'
+    if hasattr(value, '__len__') and not isinstance(value, str):
+        path += f"[{index}]"
+    return 'paths', {'path': path}
+
+def get_limited_channels(owner):
+    """Return {(transform, index)} for the channels an active EasyDriver Limit constraint on owner limits."""
+    limited = set()
+    for constraint, transform in get_easydriver_limit_constraints(owner):
+        if constraint.mute or constraint.influence <= 0.0:
+            continue
+        limited.update((transform, index) for index in get_limit_constraint_axes(constraint))
+    return limited
+
+def get_clamp_mode(clamped, limited):
+    """Map an expression clamp and a source Limit constraint to a clamp_mode."""
+    if clamped:
+        return 'BOTH' if limited else 'DRIVER'
+    # An unclamped expression was made to sit behind a constraint
+    return 'CONSTRAINT'
+
+def collect_file_setups():
+    """Rebuild spec setups from every EasyDriver driver in the file.
+
+    Drivers reading the same source channel over the same range become one setup.
+    Returns (setups, skipped) where skipped counts drivers that could not be described.
+    """
+    key_owners = {}
+    for obj in bpy.data.objects:
+        shape_keys = getattr(obj.data, 'shape_keys', None)
+        if shape_keys:
+            key_owners.setdefault(shape_keys.name, obj.name)
+
+    hubs = collect_hub_drivers()
+    limited_channels = {}
+    setups = {}
+    skipped = 0
+    for id_block, fcurve, mapping in iter_easydriver_drivers():
+        if HUB_PROPERTY_PREFIX in fcurve.data_path:
+            # Hub drivers are recreated from the setups of the targets reading them
+            continue
+
+        # Targets reading a hub take the hub's source channel, range and clamp
+        hub = hubs.get(get_hub_reader_key(fcurve))
+        channel = hub['channel'] if hub else get_driver_source_channel(fcurve)
+        source_mapping = hub['mapping'] if hub else mapping
+        target = get_driver_target(id_block, fcurve, key_owners)
+        if not channel or not target:
+            skipped += 1
+            continue
+
+        owner, is_bone, transform, index = channel
+        if is_bone:
+            source_spec = {'armature': owner.id_data.name, 'bone': owner.name}
+        else:
+            source_spec = {'object': owner.name}
+        source_range = [source_mapping['from_min'], source_mapping['from_max']]
+        owner_key = owner.as_pointer()
+        if owner_key not in limited_channels:
+            limited_channels[owner_key] = get_limited_channels(owner)
+        clamp_mode = get_clamp_mode(source_mapping['clamped'], (transform, index) in limited_channels[owner_key])
+        key = (tuple(source_spec.values()), transform, index, tuple(source_range), clamp_mode, bool(hub))
+
+        setup = setups.get(key)
+        if setup is None:
+            setup = setups[key] = {
+                'name': f"{owner.name} {transform} {'XYZ'[index]}",
+                'source': source_spec,
+                'channel': f"{transform} {'XYZ'[index]}",
+                'range': source_range,
+                'clamp_mode': clamp_mode,
+                'hub': bool(hub),
+                'targets': {},
+            }
+
+        kind, entry = target
+        entry['range'] = [mapping['to_min'], round(mapping['to_max'] - TO_MAX_BUFFER, 9)]
+        setup['targets'].setdefault(kind, []).append(entry)
+
+    return list(setups.values()), skipped
+
+#---------------------------------------
+# Name Remapping
+#---------------------------------------
+REMAP_MODES = ('PREFIX', 'REGEX', 'TABLE')
+
+# Replaced with the character's object name, so one preset can be rolled out per armature
+OBJECT_PLACEHOLDER = "{object}"
+
+def parse_rename_table(text):
+    """Parse 'old=new' lines into a dict, ignoring blank lines and # comments."""
+    table = {}
+    for line in text.splitlines():
+        line = line.strip()
+        if not line or line.startswith('#') or '=' not in line:
+            continue
+        old, new = line.split('=', 1)
+        table[old.strip()] = new.strip()
+    return table
+
+def make_renamer(mode, find="", replace="", table=None, object_name=""):
+    """Return a cached function mapping an old name to a new one.
+
+    PREFIX swaps a leading find for replace, REGEX runs re.sub(find, replace) and TABLE looks
+    names up in table. Names that don't match are returned unchanged. OBJECT_PLACEHOLDER in
+    replace (or in table values) becomes object_name. Raises re.error for a bad REGEX pattern.
+    """
+    replace = replace.replace(OBJECT_PLACEHOLDER, object_name)
+
+    if mode == 'PREFIX':
+        def rename(name):
+            return replace + name[len(find):] if find and name.startswith(find) else name
+    elif mode == 'REGEX':
+        pattern = re.compile(find)
+        def rename(name):
+            return pattern.sub(replace, name)
+    elif mode == 'TABLE':
+        table = {old: new.replace(OBJECT_PLACEHOLDER, object_name) for old, new in (table or {}).items()}
+        def rename(name):
+            return table.get(name, name)
+    else:
+        raise ValueError(f"Unknown remap mode '{mode}'")
+
+    cache = {}
+    def cached_rename(name):
+        if name not in cache:
+            cache[name] = rename(name)
+        return cache[name]
+    return cached_rename
+
+def remap_path(path, rename):
+    """Rename the quoted names in a data path, plus the leading object name of short paths."""
+    path = re.sub(r'\["([^"]+)"\]', lambda match: f'["{rename(match.group(1))}"]', path)
+    if not path.startswith('bpy.') and '.' in path:
+        owner, rest = path.split('.', 1)
+        path = f"{rename(owner)}.{rest}"
+    return path
+
+def remap_setup(setup, rename):
+    """Return a copy of a setup with every object, bone, shape key and path name renamed."""
+    source = {key: rename(value) for key, value in setup['source'].items()}
+    targets = {}
+    for kind, entries in (setup.get('targets') or {}).items():
+        remapped = []
+        for entry in entries:
+            entry = dict(entry)
+            for key in ('armature', 'bone', 'object', 'shapekey'):
+                if key in entry:
+                    entry[key] = rename(entry[key])
+            if 'path' in entry:
+                entry['path'] = remap_path(entry['path'], rename)
+            remapped.append(entry)
+        targets[kind] = remapped
+    return dict(setup, source=source, targets=targets)
+
+def remap_spec(spec, mode, find="", replace="", table=None, object_names=("",)):
+    """Build one spec holding the setups of spec remapped once per name in object_names."""
+    setups = []
+    for object_name in object_names:
+        rename = make_renamer(mode, find, replace, table, object_name)
+        for setup in spec.get('setups', []):
+            remapped = remap_setup(setup, rename)
+            if object_name:
+                remapped['name'] = f"{setup.get('name', 'setup')} [{object_name}]"
+            setups.append(remapped)
+    return new_spec(setups)
+
+#---------------------------------------
+# Command Line
+#---------------------------------------
+def main(argv=None):
+    """Apply spec files from the command line and return an exit code (0 when everything was created).
+
+    Usage, with the add-on enabled:
+        blender --background rig.blend --python-expr "import sys, <addon>.batch as b; sys.exit(b.main())" -- spec.json [more specs] [--report report.json] [--save] [--keep-going]
+    """
+    import argparse
+
+    if argv is None:
+        argv = sys.argv[sys.argv.index('--') + 1:] if '--' in sys.argv else []
+
+    parser = argparse.ArgumentParser(prog="easydriver-batch", description="Create EasyDriver drivers from spec files")
+    parser.add_argument('specs', nargs='+', help="JSON or TOML spec files")
+    parser.add_argument('--report', help="Write the JSON report to this file instead of stdout")
+    parser.add_argument('--save', action='store_true', help="Save the .blend file when every spec succeeded")
+    parser.add_argument('--keep-going', action='store_true', help="Apply valid setups even when others are invalid")
+    args = parser.parse_args(argv)
+
+    reports = []
+    for path in args.specs:
+        try:
+            spec = load_spec(path)
+        except Exception as e:
+            reports.append({'spec': path, 'ok': False, 'error': f"could not read spec: {e}"})
+            if not args.keep_going:
+                break
+            continue
+
+        try:
+            report = apply_spec(spec, fail_fast=not args.keep_going)
+        except Exception as e:
+            report = {'ok': False, 'error': f"could not apply spec: {e}"}
+        report['spec'] = path
+        reports.append(report)
+        if not report['ok'] and not args.keep_going:
+            break
+
+    ok = len(reports) == len(args.specs) and all(report['ok'] for report in reports)
+    summary = {'ok': ok, 'blend_file': bpy.data.filepath, 'specs': reports}
+
+    if args.report:
+        with open(args.report, 'w', encoding='utf-8') as report_file:
+            json.dump(summary, report_file, indent=2)
+    else:
+        print(json.dumps(summary, indent=2))
+
+    if ok and args.save and bpy.data.filepath:
+        bpy.ops.wm.save_mainfile()
+
+    return 0 if ok else 1
+
+def profile_main(argv=None):
+    """Profile the drivers of a .blend from the command line and write the JSON result.
+
+    Usage:
+        blender --background rig.blend --python-expr "import sys, <addon>.batch as b; sys.exit(b.profile_main())" -- profile.json [--frames 48] [--repeats 3] [--easydriver-only]
+    """
+    import argparse
+
+    if argv is None:
+        argv = sys.argv[sys.argv.index('--') + 1:] if '--' in sys.argv else []
+
+    parser = argparse.ArgumentParser(prog="easydriver-profile", description="Profile driver evaluation cost")
+    parser.add_argument('output', help="JSON file to write")
+    parser.add_argument('--frames', type=int, default=24, help="Frames stepped per measurement")
+    parser.add_argument('--repeats', type=int, default=2, help="Passes over the frames per measurement")
+    parser.add_argument('--easydriver-only', action='store_true', help="Only profile drivers created by EasyDriver")
+    args = parser.parse_args(argv)
+
+    profile = profile_drivers(bpy.context.scene, args.frames, args.repeats, easydriver_only=args.easydriver_only)
+    if not profile:
+        print("No unmuted drivers to profile")
+        return 1
+
+    profile['blend_file'] = bpy.data.filepath
+    with open(args.output, 'w', encoding='utf-8') as profile_file:
+        json.dump(profile, profile_file, indent=2)
+    return 0
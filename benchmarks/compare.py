@@ -0,0 +1,103 @@
+"""Compare two benchmark runs from the history and flag regressions.
+
+    python benchmarks/compare.py [--baseline RUN] [--current RUN] [--threshold 0.10]
+
+RUN is a label or a history index (negative counts from the end). By default the latest
+run is compared with the latest earlier run on the same backend. Exits with 1 when any
+benchmark got slower than the threshold allows.
+"""
+import json
+import os
+import sys
+
+HISTORY_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "history.json")
+
+def find_run(history, key):
+    """Return the index of the run with this label or index, or None."""
+    for i in range(len(history) - 1, -1, -1):
+        if history[i].get('label') == key:
+            return i
+    try:
+        index = int(key)
+    except ValueError:
+        return None
+    if -len(history) <= index < len(history):
+        return index % len(history)
+    return None
+
+def find_baseline(history, current_index):
+    """Return the index of the latest run before current_index on the same backend, or None."""
+    backend = history[current_index].get('backend')
+    for i in range(current_index - 1, -1, -1):
+        if history[i].get('backend') == backend:
+            return i
+    return None
+
+def compare_runs(baseline, current, threshold=0.10):
+    """Return rows of (name, baseline s, current s, ratio, status) for benchmarks both runs have."""
+    rows = []
+    for name, result in current['results'].items():
+        if name not in baseline['results']:
+            rows.append((name, None, result['best_s'], None, 'NEW'))
+            continue
+        before = baseline['results'][name]['best_s']
+        ratio = result['best_s'] / before if before > 0 else float('inf')
+        if ratio > 1.0 + threshold:
+            status = 'REGRESSION'
+        elif ratio < 1.0 - threshold:
+            status = 'FASTER'
+        else:
+            status = 'OK'
+        rows.append((name, before, result['best_s'], ratio, status))
+    return rows
+
+def format_ms(seconds):
+    return "-" if seconds is None else f"{seconds * 1000:.3f} ms"
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="easydriver-bench-compare", description="Flag benchmark regressions")
+    parser.add_argument('--history', default=HISTORY_PATH, help="History file written by run_benchmarks.py")
+    parser.add_argument('--baseline', help="Label or index of the run to compare against")
+    parser.add_argument('--current', default="-1", help="Label or index of the run to check (default: latest)")
+    parser.add_argument('--threshold', type=float, default=0.10, help="Allowed slowdown as a fraction (0.10 = 10%%)")
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(args.history):
+        print(f"No history at {args.history}; run run_benchmarks.py first")
+        return 2
+    with open(args.history, 'r', encoding='utf-8') as history_file:
+        history = json.load(history_file)
+
+    current_index = find_run(history, args.current)
+    if current_index is None:
+        print(f"Run '{args.current}' not found")
+        return 2
+    baseline_index = find_run(history, args.baseline) if args.baseline else find_baseline(history, current_index)
+    if baseline_index is None:
+        print("No baseline run to compare against")
+        return 2
+
+    baseline, current = history[baseline_index], history[current_index]
+    if baseline.get('backend') != current.get('backend'):
+        print(f"Warning: comparing a {baseline.get('backend')} run with a {current.get('backend')} run")
+    print(f"Baseline: {baseline.get('label')} ({baseline.get('timestamp')})")
+    print(f"Current:  {current.get('label')} ({current.get('timestamp')})")
+    print()
+
+    rows = compare_runs(baseline, current, args.threshold)
+    print(f"{'benchmark':<28} {'baseline':>14} {'current':>14} {'change':>9}  status")
+    for name, before, after, ratio, status in rows:
+        change = "-" if ratio is None else f"{(ratio - 1.0) * 100:+.1f}%"
+        print(f"{name:<28} {format_ms(before):>14} {format_ms(after):>14} {change:>9}  {status}")
+
+    regressions = [row[0] for row in rows if row[4] == 'REGRESSION']
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) beyond {args.threshold:.0%}: {', '.join(regressions)}")
+        return 1
+    print(f"\nNo regressions beyond {args.threshold:.0%}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,336 @@
+"""A small stand-in for bpy so the benchmarks run under plain Python.
+
+Only the parts of the API that the benchmarked code and the synthetic rigs touch are
+here. Drivers are recorded but never evaluated.
+"""
+import sys
+import types
+
+#---------------------------------------
+# ID Collections
+#---------------------------------------
+class FakeCollection:
+    """Name-keyed collection like bpy_prop_collection."""
+    def __init__(self, factory=None):
+        self._items = {}
+        self._factory = factory
+
+    def __contains__(self, name):
+        return name in self._items
+
+    def __getitem__(self, key):
+        if isinstance(key, int):
+            return list(self._items.values())[key]
+        return self._items[key]
+
+    def __iter__(self):
+        return iter(self._items.values())
+
+    def __len__(self):
+        return len(self._items)
+
+    def keys(self):
+        return list(self._items.keys())
+
+    def get(self, name, default=None):
+        return self._items.get(name, default)
+
+    def add(self, item):
+        self._items[item.name] = item
+        return item
+
+    def new(self, name, *args, **kwargs):
+        return self.add(self._factory(name, *args, **kwargs))
+
+    def remove(self, item):
+        self._items.pop(item.name, None)
+
+    def clear(self):
+        self._items.clear()
+
+class FakeID:
+    """Anything that can hold custom properties and drivers."""
+    def __init__(self, name):
+        self.name = name
+        self._props = {}
+        self._drivers = {}
+
+    def __contains__(self, key):
+        return key in self._props
+
+    def __getitem__(self, key):
+        return self._props[key]
+
+    def __setitem__(self, key, value):
+        self._props[key] = value
+
+    def keys(self):
+        return list(self._props.keys())
+
+    def driver_add(self, data_path, index=-1):
+        fcurve = FakeFCurve(data_path, max(index, 0))
+        self._drivers[(data_path, index)] = fcurve
+        return fcurve
+
+    def driver_remove(self, data_path, index=-1):
+        return self._drivers.pop((data_path, index), None) is not None
+
+#---------------------------------------
+# Drivers
+#---------------------------------------
+class FakeDriverTarget:
+    def __init__(self):
+        self.id = None
+        self.data_path = ""
+        self.bone_target = ""
+        self.transform_type = 'LOC_X'
+        self.transform_space = 'WORLD_SPACE'
+        self.rotation_mode = 'AUTO'
+
+class FakeDriverVariable:
+    def __init__(self):
+        self.name = "var"
+        self.type = 'SINGLE_PROP'
+        self.targets = [FakeDriverTarget(), FakeDriverTarget()]
+
+class FakeDriverVariables(list):
+    def new(self):
+        variable = FakeDriverVariable()
+        self.append(variable)
+        return variable
+
+class FakeDriver:
+    def __init__(self):
+        self.type = 'SCRIPTED'
+        self.expression = ""
+        self.variables = FakeDriverVariables()
+        self.is_valid = True
+
+class FakeFCurve:
+    def __init__(self, data_path, array_index):
+        self.data_path = data_path
+        self.array_index = array_index
+        self.driver = FakeDriver()
+        self.modifiers = []
+        self.mute = False
+
+#---------------------------------------
+# Data Blocks
+#---------------------------------------
+class FakeEditBone:
+    def __init__(self, name):
+        self.name = name
+        self.head = (0.0, 0.0, 0.0)
+        self.tail = (0.0, 0.0, 1.0)
+        self.parent = None
+
+class FakePoseBone:
+    def __init__(self, name):
+        self.name = name
+        self.location = [0.0, 0.0, 0.0]
+        self.rotation_euler = [0.0, 0.0, 0.0]
+        self.rotation_mode = 'XYZ'
+        self.scale = [1.0, 1.0, 1.0]
+        self.constraints = FakeCollection()
+
+class FakeArmature(FakeID):
+    def __init__(self, name):
+        super().__init__(name)
+        self.edit_bones = FakeCollection(FakeEditBone)
+
+class FakePose:
+    def __init__(self, armature):
+        self.bones = FakeCollection()
+        for edit_bone in armature.edit_bones:
+            self.bones.add(FakePoseBone(edit_bone.name))
+
+class FakeKeyBlock:
+    def __init__(self, name):
+        self.name = name
+        self.value = 0.0
+        self.slider_min = 0.0
+        self.slider_max = 1.0
+
+class FakeKey(FakeID):
+    def __init__(self, name):
+        super().__init__(name)
+        self.key_blocks = FakeCollection(FakeKeyBlock)
+
+class FakeMesh(FakeID):
+    def __init__(self, name):
+        super().__init__(name)
+        self.shape_keys = None
+
+class FakeCamera(FakeID):
+    def __init__(self, name):
+        super().__init__(name)
+        self.lens = 50.0
+        self.dof = types.SimpleNamespace(focus_distance=10.0, aperture_fstop=2.8)
+
+class FakeLight(FakeID):
+    def __init__(self, name, type='POINT'):
+        super().__init__(name)
+        self.type = type
+        self.energy = 1000.0
+        self.color = [1.0, 1.0, 1.0]
+
+class FakeSocket:
+    def __init__(self, name, default_value=0.0):
+        self.name = name
+        self.default_value = default_value
+
+class FakeRampElement:
+    def __init__(self, position):
+        self.position = position
+        self.color = [position, position, position, 1.0]
+
+# Node type: (name, input count, output count, has color ramp)
+FAKE_NODE_TYPES = {
+    'ShaderNodeBsdfPrincipled': ("Principled BSDF", 27, 1, False),
+    'ShaderNodeOutputMaterial': ("Material Output", 3, 0, False),
+    'ShaderNodeValToRGB': ("Color Ramp", 1, 2, True),
+    'ShaderNodeValue': ("Value", 0, 1, False),
+}
+
+class FakeNode:
+    def __init__(self, name, node_type):
+        label, input_count, output_count, has_ramp = FAKE_NODE_TYPES[node_type]
+        self.name = name
+        self.type = node_type
+        self.inputs = [FakeSocket(f"Input {i}") for i in range(input_count)]
+        self.outputs = [FakeSocket(f"Output {i}") for i in range(output_count)]
+        if has_ramp:
+            self.color_ramp = types.SimpleNamespace(elements=[FakeRampElement(0.0), FakeRampElement(1.0)])
+
+class FakeNodes(FakeCollection):
+    def new(self, type):
+        name = base = FAKE_NODE_TYPES[type][0]
+        suffix = 1
+        while name in self:
+            name = f"{base}.{suffix:03d}"
+            suffix += 1
+        return self.add(FakeNode(name, type))
+
+class FakeNodeTree(FakeID):
+    def __init__(self, name):
+        super().__init__(name)
+        self.nodes = FakeNodes()
+
+class FakeMaterial(FakeID):
+    def __init__(self, name):
+        super().__init__(name)
+        self.node_tree = None
+        self.diffuse_color = [0.8, 0.8, 0.8, 1.0]
+        self.roughness = 0.5
+
+    @property
+    def use_nodes(self):
+        return self.node_tree is not None
+
+    @use_nodes.setter
+    def use_nodes(self, value):
+        if value and self.node_tree is None:
+            self.node_tree = FakeNodeTree(f"{self.name} Tree")
+            self.node_tree.nodes.new('ShaderNodeBsdfPrincipled')
+            self.node_tree.nodes.new('ShaderNodeOutputMaterial')
+
+# Constraint type: default name
+FAKE_CONSTRAINT_NAMES = {
+    'COPY_LOCATION': "Copy Location",
+    'COPY_ROTATION': "Copy Rotation",
+    'LIMIT_LOCATION': "Limit Location",
+    'LIMIT_ROTATION': "Limit Rotation",
+}
+
+class FakeConstraint:
+    def __init__(self, name, type):
+        self.name = name
+        self.type = type
+        self.influence = 1.0
+        self.mute = False
+
+class FakeConstraints(FakeCollection):
+    def new(self, type):
+        return self.add(FakeConstraint(FAKE_CONSTRAINT_NAMES[type], type))
+
+class FakeObject(FakeID):
+    def __init__(self, name, data=None):
+        super().__init__(name)
+        self.data = data
+        self.location = [0.0, 0.0, 0.0]
+        self.rotation_euler = [0.0, 0.0, 0.0]
+        self.rotation_mode = 'XYZ'
+        self.scale = [1.0, 1.0, 1.0]
+        self.constraints = FakeConstraints()
+        if isinstance(data, FakeArmature):
+            self.type = 'ARMATURE'
+        elif isinstance(data, FakeMesh):
+            self.type = 'MESH'
+        elif isinstance(data, FakeCamera):
+            self.type = 'CAMERA'
+        elif isinstance(data, FakeLight):
+            self.type = 'LIGHT'
+        else:
+            self.type = 'EMPTY'
+        self._pose = None
+
+    @property
+    def pose(self):
+        # Built on first access, after the rig builder has added its edit bones
+        if self.type != 'ARMATURE':
+            return None
+        if self._pose is None:
+            self._pose = FakePose(self.data)
+        return self._pose
+
+    def shape_key_add(self, name="Key", from_mix=False):
+        if self.data.shape_keys is None:
+            self.data.shape_keys = FakeKey("Key")
+        return self.data.shape_keys.key_blocks.new(name)
+
+#---------------------------------------
+# Module
+#---------------------------------------
+def reset():
+    """Empty every collection of the installed fake bpy."""
+    data = sys.modules['bpy'].data
+    for collection_name in ('objects', 'armatures', 'meshes', 'materials', 'cameras', 'lights', 'shape_keys', 'node_groups'):
+        getattr(data, collection_name).clear()
+
+def install():
+    """Register the fake as the bpy module and return it."""
+    scene_objects = FakeCollection()
+    scene = types.SimpleNamespace(
+        name="Scene",
+        collection=types.SimpleNamespace(objects=types.SimpleNamespace(link=scene_objects.add)),
+        frame_current=1,
+    )
+    view_layer = types.SimpleNamespace(
+        objects=types.SimpleNamespace(active=None),
+        update=lambda: None,
+    )
+
+    bpy = types.ModuleType('bpy')
+    bpy.is_fake = True
+    bpy.app = types.SimpleNamespace(
+        version=(0, 0, 0), version_string="fake", background=True,
+        handlers=types.SimpleNamespace(persistent=lambda func: func, depsgraph_update_post=[]),
+    )
+    bpy.data = types.SimpleNamespace(
+        objects=FakeCollection(FakeObject),
+        armatures=FakeCollection(FakeArmature),
+        meshes=FakeCollection(FakeMesh),
+        materials=FakeCollection(FakeMaterial),
+        cameras=FakeCollection(FakeCamera),
+        lights=FakeCollection(FakeLight),
+        shape_keys=FakeCollection(FakeKey),
+        node_groups=FakeCollection(FakeNodeTree),
+        filepath="",
+    )
+    bpy.context = types.SimpleNamespace(scene=scene, view_layer=view_layer)
+    bpy.ops = types.SimpleNamespace(object=types.SimpleNamespace(mode_set=lambda mode='OBJECT': {'FINISHED'}))
+    bpy.types = types.SimpleNamespace(Object=FakeObject, PoseBone=FakePoseBone)
+    bpy.props = types.SimpleNamespace()
+
+    sys.modules['bpy'] = bpy
+    return bpy
@@ -0,0 +1,99 @@
+"""Synthetic scenes for the benchmarks.
+
+Built through the regular bpy API, so the same code runs against fake_bpy and inside
+blender --background.
+"""
+
+BENCH_PREFIX = "Bench"
+RIG_NAME = "BenchRig"
+FACE_NAME = "BenchFace"
+CTRL_NAME = "BenchCtrl"
+LIMITED_NAME = "BenchLimited"
+CAMERA_NAME = "BenchCam"
+LIGHT_NAME = "BenchLamp"
+MATERIAL_NAME = "BenchMat"
+CUSTOM_PROP = "bench_prop"
+CONTROL_BONE = "ctrl"
+
+# One target path per form parse_target_path supports, with the handler it should pick
+TARGET_PATH_FORMS = (
+    ('colorramp_long', f'bpy.data.materials["{MATERIAL_NAME}"].node_tree.nodes["Color Ramp"].color_ramp.elements[1].position'),
+    ('material_node_long', f'bpy.data.materials["{MATERIAL_NAME}"].node_tree.nodes["Principled BSDF"].inputs[2].default_value'),
+    ('constraint_long', f'bpy.data.objects["{CTRL_NAME}"].constraints["Copy Location"].influence'),
+    ('shapekey_long', f'bpy.data.objects["{FACE_NAME}"].data.shape_keys.key_blocks["key_000"].value'),
+    ('bone_long', f'bpy.data.objects["{RIG_NAME}"].pose.bones["bone_0000"].rotation_euler[0]'),
+    ('object_custom_prop_long', f'bpy.data.objects["{CTRL_NAME}"]["{CUSTOM_PROP}"]'),
+    ('camera_long', f'bpy.data.cameras["{CAMERA_NAME}"].lens'),
+    ('light_long', f'bpy.data.lights["{LIGHT_NAME}"].energy'),
+    ('material_long', f'bpy.data.materials["{MATERIAL_NAME}"].diffuse_color[0]'),
+    ('armature_long', f'bpy.data.armatures["{RIG_NAME}"].display_type'),
+    ('object_long', f'bpy.data.objects["{CTRL_NAME}"].location[2]'),
+    ('shapekey_short', f'{FACE_NAME}.data.shape_keys.key_blocks["key_001"].value'),
+    ('bone_short', f'{RIG_NAME}.pose.bones["bone_0001"].location[1]'),
+    ('constraint_short', f'{CTRL_NAME}.constraints["Copy Location"].influence'),
+    ('material_node_short', f'{MATERIAL_NAME}.node_tree.nodes["Principled BSDF"].inputs[0].default_value'),
+    ('custom_prop_short', f'{CTRL_NAME}["{CUSTOM_PROP}"]'),
+    ('general_short', f'{CTRL_NAME}.scale[1]'),
+)
+
+def remove_bench_data(bpy):
+    """Remove everything a previous build_scene created."""
+    for collection_name in ('objects', 'armatures', 'meshes', 'materials', 'cameras', 'lights'):
+        collection = getattr(bpy.data, collection_name)
+        for block in [block for block in collection if block.name.startswith(BENCH_PREFIX)]:
+            collection.remove(block)
+
+def link_object(bpy, name, data):
+    obj = bpy.data.objects.new(name, data)
+    bpy.context.scene.collection.objects.link(obj)
+    return obj
+
+def build_scene(bpy, bone_count=200, shapekey_count=50):
+    """Build the rig, face mesh, control empties, camera, light and material the benchmarks use."""
+    remove_bench_data(bpy)
+
+    # Armature with a control bone plus bone_count driven bones
+    armature = bpy.data.armatures.new(RIG_NAME)
+    rig = link_object(bpy, RIG_NAME, armature)
+    bpy.context.view_layer.objects.active = rig
+    bpy.ops.object.mode_set(mode='EDIT')
+    for name in [CONTROL_BONE] + [f"bone_{i:04d}" for i in range(bone_count)]:
+        bone = armature.edit_bones.new(name)
+        bone.head = (0.0, 0.0, 0.0)
+        bone.tail = (0.0, 0.0, 1.0)
+    bpy.ops.object.mode_set(mode='OBJECT')
+
+    # Mesh with shape keys
+    face = link_object(bpy, FACE_NAME, bpy.data.meshes.new(FACE_NAME))
+    face.shape_key_add(name="Basis")
+    for i in range(shapekey_count):
+        face.shape_key_add(name=f"key_{i:03d}")
+
+    # Empty with a custom property and a constraint
+    ctrl = link_object(bpy, CTRL_NAME, None)
+    ctrl[CUSTOM_PROP] = 0.0
+    ctrl.constraints.new('COPY_LOCATION')
+
+    # Empty whose Limit constraint clamps it, as a CONSTRAINT-mode object source
+    limited = link_object(bpy, LIMITED_NAME, None)
+    limited.constraints.new('LIMIT_LOCATION')
+    
+    link_object(bpy, CAMERA_NAME, bpy.data.cameras.new(CAMERA_NAME))
+    link_object(bpy, LIGHT_NAME, bpy.data.lights.new(LIGHT_NAME, type='POINT'))
+
+    material = bpy.data.materials.new(MATERIAL_NAME)
+    material.use_nodes = True
+    material.node_tree.nodes.new('ShaderNodeValToRGB')
+
+    return rig
+
+def build_driver_jobs(bone_count=200, shapekey_count=50):
+    """createDriver arguments for every driven channel of the scene, as (to_path, to_min, to_max)."""
+    jobs = [(f'{RIG_NAME}.pose.bones["bone_{i:04d}"].rotation_euler[0]', 0.0, 0.5) for i in range(bone_count)]
+    jobs += [(f'bpy.data.objects["{FACE_NAME}"].data.shape_keys.key_blocks["key_{i:03d}"].value', 0.0, 1.0)
+             for i in range(shapekey_count)]
+    jobs.append((f'{CTRL_NAME}["{CUSTOM_PROP}"]', 0.0, 1.0))
+    return jobs
+
+def get_control_path():
+    return f'{RIG_NAME}.pose.bones["{CONTROL_BONE}"].location[2]'
@@ -0,0 +1,301 @@
+"""Micro-benchmarks for EasyDriver's hot paths.
+
+Plain Python, with the fake bpy from fake_bpy.py:
+    python benchmarks/run_benchmarks.py [--label NAME] [--repeat N] [--only NAME ...] [--no-save]
+
+Inside Blender, against the real bpy:
+    blender --background --factory-startup --python benchmarks/run_benchmarks.py -- [same options]
+
+Each run is appended to benchmarks/history.json; compare runs with compare.py.
+"""
+import gc
+import importlib
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+import types
+from contextlib import redirect_stdout
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+ADDON_DIR = os.path.dirname(BENCH_DIR)
+HISTORY_PATH = os.path.join(BENCH_DIR, "history.json")
+PACKAGE_NAME = "easydriver_bench"
+
+if BENCH_DIR not in sys.path:
+    sys.path.insert(0, BENCH_DIR)
+
+import fake_bpy
+import rigs
+
+#---------------------------------------
+# Loading
+#---------------------------------------
+def load_bpy():
+    """Return (bpy, backend name), installing the fake when not running inside Blender."""
+    try:
+        import bpy
+        return bpy, 'fake' if getattr(bpy, 'is_fake', False) else 'blender'
+    except ImportError:
+        return fake_bpy.install(), 'fake'
+
+def load_addon_module(name):
+    """Import an add-on module without running the add-on's __init__ (which registers UI classes)."""
+    if PACKAGE_NAME not in sys.modules:
+        package = types.ModuleType(PACKAGE_NAME)
+        package.__path__ = [ADDON_DIR]
+        sys.modules[PACKAGE_NAME] = package
+    return importlib.import_module(f"{PACKAGE_NAME}.{name}")
+
+def get_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ADDON_DIR,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except Exception:
+        return None
+
+#---------------------------------------
+# Benchmarks
+#---------------------------------------
+# Each benchmark builds its inputs once and returns (callable, operations per call)
+
+def bench_target_path_match(env):
+    """core.match_target_path over every supported path form (regex layer only)."""
+    match_target_path = env['core'].match_target_path
+    paths = [path for _, path in rigs.TARGET_PATH_FORMS] * 100
+
+    def run():
+        for path in paths:
+            match_target_path(path)
+    return run, len(paths)
+
+def bench_target_path_parse(env):
+    """parse_target_path over every supported path form, including the data block lookups."""
+    parse_target_path = env['core_functions'].parse_target_path
+    paths = [path for _, path in rigs.TARGET_PATH_FORMS] * 20
+
+    def run():
+        with redirect_stdout(env['sink']):
+            for path in paths:
+                parse_target_path(path)
+    return run, len(paths)
+
+def bench_mirror_names(env):
+    """get_mirrored_name over 10k names with a cold cache."""
+    get_mirrored_name = env['core'].get_mirrored_name
+    pairs = env['core'].MIRROR_NAME_PAIRS
+    generator = random.Random(0)
+    names = []
+    for i in range(10000):
+        left, right = pairs[generator.randrange(len(pairs))]
+        side = left if i % 2 else right
+        # Roughly a fifth have no side at all, the worst case (every length is tried twice)
+        if i % 5 == 0:
+            names.append(f"spine{i:05d}")
+        elif side[0].isalnum():
+            names.append(f"{side}arm{i:05d}")
+        else:
+            names.append(f"arm{i:05d}{side}")
+
+    def run():
+        get_mirrored_name.cache_clear()
+        for name in names:
+            get_mirrored_name(name)
+    return run, len(names)
+
+def bench_detect_changes(env):
+    """detect_significant_changes over 1000 bones."""
+    detect_significant_changes = env['core'].detect_significant_changes
+    generator = random.Random(0)
+
+    def random_values():
+        return {key: [generator.uniform(-1.0, 1.0) for _ in range(3)] for key in ('location', 'rotation', 'scale')}
+    bones = [(random_values(), random_values()) for _ in range(1000)]
+
+    def run():
+        for min_vals, max_vals in bones:
+            detect_significant_changes(min_vals, max_vals)
+    return run, len(bones)
+
+def bench_target_storage(env):
+    """JSON round-trips of the stored pose, shape key and path target lists."""
+    core_functions = env['core_functions']
+    core = env['core']
+    generator = random.Random(0)
+    bones = {}
+    for i in range(1000):
+        min_vals = {key: [0.0, 0.0, 0.0] for key in ('location', 'rotation', 'scale')}
+        max_vals = {key: [generator.uniform(-1.0, 1.0) for _ in range(3)] for key in ('location', 'rotation', 'scale')}
+        bones[f"bone_{i:04d}"] = {
+            'armature': rigs.RIG_NAME,
+            'min_values': min_vals,
+            'max_values': max_vals,
+            'detected_changes': core.build_detected_changes(min_vals, max_vals),
+        }
+    shapekeys = {f"{rigs.FACE_NAME}:key_{i:03d}": {'object': rigs.FACE_NAME, 'shapekey': f"key_{i:03d}",
+                                                     'min_value': 0.0, 'max_value': 1.0} for i in range(500)}
+    paths = {f"path_{i}": {'path': path, 'min_value': 0.0, 'max_value': 1.0}
+             for i, (_, path) in enumerate(rigs.TARGET_PATH_FORMS * 12)}
+    props = types.SimpleNamespace(to_bones_data="{}", shapekey_list_data="{}", path_list_data="{}")
+
+    def run():
+        core_functions.set_to_bones_data(props, bones)
+        core_functions.get_to_bones_data(props)
+        core_functions.set_shapekey_list_data(props, shapekeys)
+        core_functions.get_shapekey_list_data(props)
+        core_functions.set_path_list_data(props, paths)
+        core_functions.get_path_list_data(props)
+    return run, 3
+
+def bench_create_driver(env):
+    """createDriver end-to-end on the synthetic rig, one view layer update per batch."""
+    createDriver = env['core_functions'].createDriver
+    bpy = env['bpy']
+    jobs = rigs.build_driver_jobs()
+    from_path = rigs.get_control_path()
+
+    def run():
+        with redirect_stdout(env['sink']):
+            for to_path, to_min, to_max in jobs:
+                createDriver(rigs.RIG_NAME, from_path, 0.0, 0.1, to_path, to_min, to_max, update=False)
+        bpy.context.view_layer.update()
+    return run, len(jobs)
+
+BENCHMARKS = (
+    ('target_path_match', bench_target_path_match),
+    ('target_path_parse', bench_target_path_parse),
+    ('mirror_names_10k', bench_mirror_names),
+    ('detect_changes_1000_bones', bench_detect_changes),
+    ('target_storage_json', bench_target_storage),
+    ('create_driver', bench_create_driver),
+)
+
+#---------------------------------------
+# Running
+#---------------------------------------
+def time_callable(func, repeat):
+    """Run func repeat times with the garbage collector off, returning the timings in seconds."""
+    func()  # warm up
+    timings = []
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - start)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return timings
+
+def check_path_forms(env):
+    """Make sure every path form still resolves to the handler it is meant to exercise."""
+    for handler_name, path in rigs.TARGET_PATH_FORMS:
+        matched = env['core'].match_target_path(path)
+        if not matched or matched[0] != handler_name:
+            raise RuntimeError(f"{path} matched {matched[0] if matched else None}, expected {handler_name}")
+        with redirect_stdout(env['sink']):
+            data_block, _, _ = env['core_functions'].parse_target_path(path)
+        if data_block is None:
+            raise RuntimeError(f"{path} did not resolve in the benchmark scene")
+
+def check_bake_readers(env):
+    """Make sure baking reads each source the way its driver does, before or after constraints."""
+    core_functions = env['core_functions']
+    limited = env['bpy'].data.objects[rigs.LIMITED_NAME]
+    bone = env['bpy'].data.objects[rigs.RIG_NAME].pose.bones[rigs.CONTROL_BONE]
+    cases = (
+        ("CONSTRAINT-mode object source", limited, True, core_functions.read_evaluated_object_channels),
+        ("DRIVER-mode object source", limited, False, core_functions.read_transform_channels),
+        ("unconstrained bone source", bone, False, core_functions.read_transform_channels),
+    )
+    for label, owner, reads_constrained, expected in cases:
+        reader = core_functions.get_channel_reader(owner, reads_constrained)
+        if reader is not expected:
+            raise RuntimeError(f"{label} is baked with {reader.__name__}, expected {expected.__name__}")
+
+def run_benchmarks(names=None, repeat=7):
+    """Run the benchmarks and return a history entry."""
+    bpy, backend = load_bpy()
+    with open(os.devnull, 'w') as sink:
+        env = {
+            'bpy': bpy,
+            'core': load_addon_module('core'),
+            'core_functions': load_addon_module('core_functions'),
+            'sink': sink,
+        }
+        rigs.build_scene(bpy)
+        check_path_forms(env)
+        check_bake_readers(env)
+
+        results = {}
+        for name, setup in BENCHMARKS:
+            if names and name not in names:
+                continue
+            func, operations = setup(env)
+            timings = time_callable(func, repeat)
+            best = min(timings)
+            results[name] = {
+                'operations': operations,
+                'repeat': repeat,
+                'best_s': best,
+                'median_s': statistics.median(timings),
+                'per_op_us': best / operations * 1e6,
+            }
+            print(f"{name:<28} {best * 1000:10.3f} ms  {results[name]['per_op_us']:10.3f} us/op  ({operations} ops)")
+
+        if backend == 'blender':
+            rigs.remove_bench_data(bpy)
+
+    return {
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'commit': get_commit(),
+        'backend': backend,
+        'blender': bpy.app.version_string,
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'results': results,
+    }
+
+def load_history(path=HISTORY_PATH):
+    if not os.path.exists(path):
+        return []
+    with open(path, 'r', encoding='utf-8') as history_file:
+        return json.load(history_file)
+
+def save_history(history, path=HISTORY_PATH):
+    with open(path, 'w', encoding='utf-8') as history_file:
+        json.dump(history, history_file, indent=2)
+
+def main(argv=None):
+    import argparse
+
+    if argv is None:
+        # Blender passes script arguments after '--'
+        argv = sys.argv[sys.argv.index('--') + 1:] if '--' in sys.argv else sys.argv[1:]
+
+    parser = argparse.ArgumentParser(prog="easydriver-bench", description="Time EasyDriver's hot paths")
+    parser.add_argument('--label', default="", help="Name for this run in the history")
+    parser.add_argument('--repeat', type=int, default=7, help="Timed runs per benchmark (the best one is kept)")
+    parser.add_argument('--only', nargs='+', choices=[name for name, _ in BENCHMARKS], help="Run only these benchmarks")
+    parser.add_argument('--history', default=HISTORY_PATH, help="History file to append to")
+    parser.add_argument('--no-save', action='store_true', help="Print results without adding them to the history")
+    args = parser.parse_args(argv)
+
+    entry = run_benchmarks(args.only, max(1, args.repeat))
+    entry['label'] = args.label or entry['commit'] or entry['timestamp']
+
+    if not args.no_save:
+        history = load_history(args.history)
+        history.append(entry)
+        save_history(history, args.history)
+        print(f"Saved run '{entry['label']}' to {args.history} ({len(history)} runs)")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,16 +2,37 @@ import bpy
 import re
 import bpy_extras.view3d_utils
 import math
+import json
+import time
+from .core import parse_axis_info
 from .core_functions import (
-    get_selected_pose_bones, ensure_euler_rotation, ensure_object_euler_rotation,
-    detect_significant_changes, get_to_bones_data, set_to_bones_data,
+    get_selected_pose_bones, read_euler_rotation,
+    detect_significant_changes, build_detected_changes, get_to_bones_data, set_to_bones_data,
     get_shapekey_list_data, set_shapekey_list_data, get_path_list_data,
-    set_path_list_data, validate_custom_path, createDriver, update_shapekey_value, auto_detect_path_type,
+    set_path_list_data, validate_custom_path, update_shapekey_value, auto_detect_path_type,
     update_fine_tune_min_value, update_fine_tune_max_value, update_fine_tune_axis, 
     update_fine_tune_object_min_value, update_fine_tune_object_max_value, 
     update_fine_tune_object_axis, parse_target_path, get_mirrored_name, mirror_source, mirror_pose_targets, mirror_shapekey_targets,
-    auto_apply_armature_source, auto_apply_bone_source, auto_apply_object_source
+    auto_apply_armature_source, auto_apply_bone_source, auto_apply_object_source,
+    TRANSFORM_CHANNELS, can_sample_from_fcurves, make_fcurve_channel_sampler, make_scene_channel_sampler,
+    stream_transform_range, detect_range_channel,
+    POSE_RESTORE_PROP, capture_pose_snapshot, store_pose_snapshot, load_pose_snapshot,
+    delete_pose_snapshot, apply_pose_snapshot, get_snapshot_bone_transforms, get_pose_snapshot_items,
+    read_visual_bone_transforms, get_driver_source, build_driver_jobs, run_driver_jobs,
+    mirror_driver_source, mirror_driver_jobs,
+    ensure_limit_constraint, set_limit_constraint_axis, remove_constraint_if_present, apply_axis_locks,
+    collect_file_source_limits, apply_source_limits,
+    get_easydriver_limit_constraints, consolidate_limit_constraints, audit_limit_constraints,
+    get_source_owner_limits, probe_clamp_costs, ensure_euler_targets, bone_symmetry_depsgraph_update,
+    optimize_drivers, time_frame_steps, profile_drivers,
+    check_planned_cycles, collect_driver_edges, analyze_driver_graph, DRIVER_FANOUT_THRESHOLD,
+    run_hub_driver_jobs, get_bake_ids, bake_easydriver_drivers
 )
+from .batch import (
+    load_spec, save_spec, new_spec, apply_spec, setup_from_props, collect_file_setups,
+    build_name_index, parse_rename_table, remap_spec, OBJECT_PLACEHOLDER
+)
+from bpy_extras.io_utils import ExportHelper, ImportHelper
 
 #---------------------------------------
 # List Properties/Variables here
@@ -157,8 +178,89 @@ class DriverRecorderProperties(bpy.types.PropertyGroup):
         default='CUSTOM_POSE'
     )
     
+    # Rest-position fallback when bone names have no left/right pattern
+    mirror_tolerance: bpy.props.FloatProperty(
+        name="Mirror Tolerance",
+        description="Maximum distance between a bone and its X-mirrored partner when pairing bones by position",
+        default=0.001,
+        min=0.0,
+        soft_max=0.1,
+        precision=4,
+        unit='LENGTH'
+    )
+    
+    clamp_mode: bpy.props.EnumProperty(
+        name="Clamp",
+        description="Where the source range is clamped when drivers are created",
+        items=[
+            ('DRIVER', 'Driver', 'Clamp the input inside the driver expression'),
+            ('CONSTRAINT', 'Constraint', 'Limit the source with a constraint and keep the expression unclamped. Drivers read the constrained transform'),
+            ('BOTH', 'Both', 'Clamp in the expression and limit the source with a constraint')
+        ],
+        default='DRIVER'
+    )
+    
+    use_hub_property: bpy.props.BoolProperty(
+        name="Hub Property",
+        description="Drive a normalized 0-1 property on the source once and have every target read it, "
+                    "instead of one source-reading driver per target",
+        default=False
+    )
+    
+    one_axis_lock_method: bpy.props.EnumProperty(
+        name="Lock Method",
+        description="How Lock to One Axis freezes the other axes of the source",
+        items=[
+            ('CONSTRAINT', 'Constraint', 'Limit constraint on all three axes (evaluated every frame)'),
+            ('LOCK_FLAGS', 'Lock Flags', 'Lock flags for the other axes, constraint on the active axis only'),
+            ('LOCK_FLAGS_ONLY', 'Lock Flags Only', 'Lock flags for the other axes, no constraint (the driver already clamps its input)')
+        ],
+        default='CONSTRAINT'
+    )
+    
+    shapekey_mirror_mode: bpy.props.EnumProperty(
+        name="Shape Key Mirror",
+        description="How opposite shape keys are found when mirroring",
+        items=[
+            ('NAME', 'Name', 'Match left/right naming patterns'),
+            ('TOPOLOGY', 'Topology', 'Match shape keys whose vertex offsets are X-mirror images'),
+            ('AUTO', 'Auto', 'Match by name first, then by topology')
+        ],
+        default='NAME'
+    )
+    
+    # How bone transforms are read when recording
+    recording_mode: bpy.props.EnumProperty(
+        name="Recording Mode",
+        items=[
+            ('CHANNELS', 'Channels', 'Record the bone channel values (IK chains are read from their final pose)'),
+            ('VISUAL', 'Visual', 'Record the evaluated pose, including constraints and drivers, for all bones in one pass')
+        ],
+        default='CHANNELS'
+    )
+    
     # Custom Pose data (JSON string)
     to_bones_data: bpy.props.StringProperty(default="{}")
+    
+    # Pose snapshot library (stored on the armature object)
+    snapshot_name: bpy.props.StringProperty(
+        name="Snapshot Name",
+        description="Name for the next captured pose snapshot",
+        default="Pose"
+    )
+    snapshot_active: bpy.props.EnumProperty(
+        name="Snapshot",
+        description="Pose snapshot stored on the active armature",
+        items=get_pose_snapshot_items
+    )
+    snapshot_blend: bpy.props.FloatProperty(
+        name="Blend",
+        description="How far to blend the current pose towards the snapshot",
+        default=1.0,
+        min=0.0,
+        max=1.0,
+        subtype='FACTOR'
+    )
     # Shapekey data - changed to StringProperty for searchable dropdown
     shapekey_target_object: bpy.props.StringProperty(
         name="Target Object",
@@ -228,6 +330,43 @@ class DriverRecorderProperties(bpy.types.PropertyGroup):
     
     # Path list data (JSON string)
     path_list_data: bpy.props.StringProperty(default="{}")
+    
+    # Driver profiler results (JSON string)
+    profile_data: bpy.props.StringProperty(default="{}")
+    
+    show_profiler: bpy.props.BoolProperty(
+        name="Driver Profiler",
+        default=False
+    )
+    
+    profile_group: bpy.props.EnumProperty(
+        name="Group By",
+        items=[
+            ('driver', "Driver", "Estimated cost of each driver"),
+            ('source', "Source", "Cost of all drivers reading each source"),
+            ('target', "Target", "Cost of all drivers on each datablock"),
+            ('kind', "Type", "Cost of Python, simple expression and other driver types"),
+        ],
+        default='source'
+    )
+    
+    profile_sort: bpy.props.EnumProperty(
+        name="Sort",
+        items=[
+            ('COST', "Cost", "Most expensive first"),
+            ('COUNT', "Count", "Largest groups first"),
+            ('NAME', "Name", "Alphabetical"),
+        ],
+        default='COST'
+    )
+    
+    profile_rows: bpy.props.IntProperty(
+        name="Rows",
+        description="Number of profiler rows shown in the panel",
+        default=10,
+        min=1,
+        max=100
+    )
 
 #---------------------------------------
 # EyeDropper Functions
@@ -441,26 +580,7 @@ class OBJECT_OT_limit_source_transforms(bpy.types.Operator):
 
     def parse_axis_info(self, axis_string):
         """Parse axis string like 'LOC X' or 'ROT Y' into components"""
-        if not axis_string:
-            return None
-        
-        parts = axis_string.split()
-        if len(parts) != 2:
-            return None
-        
-        transform_type = parts[0]  # LOC, ROT, SCALE
-        axis = parts[1]  # X, Y, Z
-        
-        # Map axis to index
-        axis_map = {'X': 0, 'Y': 1, 'Z': 2}
-        if axis not in axis_map:
-            return None
-        
-        return {
-            'transform': transform_type,
-            'axis': axis,
-            'index': axis_map[axis]
-        }
+        return parse_axis_info(axis_string)
 
     def get_sorted_values(self, min_val, max_val):
         """Ensure min is actually smaller than max, swap if needed"""
@@ -742,7 +862,9 @@ class OBJECT_OT_one_axis_source_limit(bpy.types.Operator):
                 self.report({'ERROR'}, "No source configured. Please record MIN and MAX first.")
                 return {'CANCELLED'}
             
-            if success:
+            if success and props.one_axis_lock_method == 'LOCK_FLAGS_ONLY':
+                self.report({'INFO'}, "Other axes locked with lock flags")
+            elif success:
                 self.report({'INFO'}, "One-axis constraint added successfully")
             else:
                 self.report({'ERROR'}, "Failed to add one-axis constraint")
@@ -781,6 +903,13 @@ class OBJECT_OT_one_axis_source_limit(bpy.types.Operator):
             self.report({'ERROR'}, f"Could not parse axis info: {props.from_detected_axis}")
             return False
         
+        if props.one_axis_lock_method != 'CONSTRAINT':
+            min_values = {'LOC': props.from_min_location, 'ROT': props.from_min_rotation, 'SCALE': props.from_min_scale}
+            max_values = {'LOC': props.from_max_location, 'ROT': props.from_max_rotation, 'SCALE': props.from_max_scale}
+            transform = axis_info['transform']
+            return self.lock_with_flags(pose_bone, axis_info, min_values[transform], max_values[transform],
+                                        props.one_axis_lock_method, True)
+        
         if axis_info['transform'] == 'LOC':
             return self.add_bone_location_lock(pose_bone, axis_info, props.from_min_location, props.from_max_location)
         elif axis_info['transform'] == 'ROT':
@@ -811,6 +940,13 @@ class OBJECT_OT_one_axis_source_limit(bpy.types.Operator):
             self.report({'ERROR'}, f"Could not parse axis info: {props.from_object_detected_axis}")
             return False
         
+        if props.one_axis_lock_method != 'CONSTRAINT':
+            min_values = {'LOC': props.from_object_min_location, 'ROT': props.from_object_min_rotation, 'SCALE': props.from_object_min_scale}
+            max_values = {'LOC': props.from_object_max_location, 'ROT': props.from_object_max_rotation, 'SCALE': props.from_object_max_scale}
+            transform = axis_info['transform']
+            return self.lock_with_flags(obj, axis_info, min_values[transform], max_values[transform],
+                                        props.one_axis_lock_method, False)
+        
         if axis_info['transform'] == 'LOC':
             return self.add_object_location_lock(obj, axis_info, props.from_object_min_location, props.from_object_max_location)
         elif axis_info['transform'] == 'ROT':
@@ -822,25 +958,7 @@ class OBJECT_OT_one_axis_source_limit(bpy.types.Operator):
 
     def parse_axis_info(self, axis_string):
         """Parse axis string like 'LOC X' or 'ROT Y' into components"""
-        if not axis_string:
-            return None
-        
-        parts = axis_string.split()
-        if len(parts) != 2:
-            return None
-        
-        transform_type = parts[0]  # LOC, ROT, SCALE
-        axis = parts[1]  # X, Y, Z
-        
-        axis_map = {'X': 0, 'Y': 1, 'Z': 2}
-        if axis not in axis_map:
-            return None
-        
-        return {
-            'transform': transform_type,
-            'axis': axis,
-            'index': axis_map[axis]
-        }
+        return parse_axis_info(axis_string)
 
     def get_sorted_values(self, min_val, max_val):
         """Ensure min is actually smaller than max"""
@@ -1298,8 +1416,133 @@ class OBJECT_OT_one_axis_source_limit(bpy.types.Operator):
         print(f"Locked {obj.name} to {axis_info['axis']} scale only (range: {actual_min:.3f} to {actual_max:.3f})")
         return True
 
+    def lock_with_flags(self, owner, axis_info, min_values, max_values, method, is_bone):
+        """Freeze the other axes with lock flags; clamp the active axis with a constraint only for LOCK_FLAGS"""
+        transform = axis_info['transform']
+        index = axis_info['index']
+        constraint_name = f"OneAxis_{transform}_{axis_info['axis']}"
+        
+        apply_axis_locks(owner, transform, index)
+        
+        if method == 'LOCK_FLAGS':
+            constraint = ensure_limit_constraint(owner, constraint_name, transform, is_bone)
+            set_limit_constraint_axis(constraint, index, min_values[index], max_values[index])
+            print(f"Locked {owner.name} to {axis_info['axis']} with lock flags, {transform} {axis_info['axis']} clamped by constraint")
+        else:
+            # The driver clamps its input, so the active axis needs no constraint at all
+            remove_constraint_if_present(owner, constraint_name)
+            print(f"Locked {owner.name} to {axis_info['axis']} with lock flags only")
+        
+        return True
+
+
 
 
+class OBJECT_OT_limit_sources_batch(bpy.types.Operator):
+    """Apply limit constraints to many sources at once, reusing existing constraints"""
+    bl_idname = "object.limit_sources_batch"
+    bl_label = "Limit All Sources"
+    bl_description = "Limit every source channel to its driven range, one constraint per transform type"
+    bl_options = {'REGISTER', 'UNDO'}
+    
+    scope: bpy.props.EnumProperty(
+        name="Scope",
+        items=[
+            ('SETUP', "Current Setup", "Limit the source recorded in the panel"),
+            ('FILE', "Whole File", "Limit every source read by EasyDriver drivers in the file")
+        ],
+        default='FILE'
+    )
+    
+    def execute(self, context):
+        props = context.scene.driver_recorder_props
+        
+        if self.scope == 'SETUP':
+            source, error = get_driver_source(props)
+            if not source:
+                self.report({'ERROR'}, error)
+                return {'CANCELLED'}
+            
+            limits = get_source_owner_limits(source)
+        else:
+            limits = collect_file_source_limits()
+        
+        if not limits:
+            self.report({'WARNING'}, "No EasyDriver sources found")
+            return {'CANCELLED'}
+        
+        created, updated, removed = apply_source_limits(limits)
+        
+        # Relations are rebuilt once for the whole batch
+        context.view_layer.update()
+        
+        message = f"Limited {len(limits)} sources: {created} constraints added, {updated} updated"
+        if removed:
+            message += f", {removed} per-axis constraints merged"
+        self.report({'INFO'}, message)
+        return {'FINISHED'}
+
+class OBJECT_OT_consolidate_limits(bpy.types.Operator):
+    """Merge EasyDriver limit constraints and audit what is left"""
+    bl_idname = "object.consolidate_limits"
+    bl_label = "Consolidate Limits"
+    bl_description = "Collapse EasyDriver limit constraints into one per transform type and report removable ones"
+    bl_options = {'REGISTER', 'UNDO'}
+    
+    scope: bpy.props.EnumProperty(
+        name="Scope",
+        items=[
+            ('SELECTED', "Selected", "Selected objects, or selected bones in Pose Mode"),
+            ('FILE', "Whole File", "Every object and pose bone in the file")
+        ],
+        default='FILE'
+    )
+    audit_only: bpy.props.BoolProperty(
+        name="Audit Only",
+        description="Only report, without changing any constraint",
+        default=False
+    )
+    
+    def execute(self, context):
+        owners = self.get_owners(context)
+        
+        removed = 0
+        if not self.audit_only:
+            for owner, is_bone in owners:
+                if get_easydriver_limit_constraints(owner):
+                    removed += consolidate_limit_constraints(owner, is_bone)
+            context.view_layer.update()
+        
+        findings = []
+        for owner, _ in owners:
+            findings.extend(audit_limit_constraints(owner))
+        
+        print(f"=== LIMIT AUDIT ({len(findings)} findings) ===")
+        for finding in findings:
+            print(f"  {finding}")
+        
+        message = f"Checked {len(owners)} owners"
+        if not self.audit_only:
+            message += f", removed {removed} redundant constraints"
+        if findings:
+            message += f", {len(findings)} audit findings (see console): {findings[0]}"
+        self.report({'INFO'}, message)
+        return {'FINISHED'}
+    
+    def get_owners(self, context):
+        """Return [(owner, is_bone)] for the chosen scope."""
+        if self.scope == 'SELECTED':
+            obj = context.object
+            if obj and obj.type == 'ARMATURE' and obj.mode == 'POSE':
+                return [(bone, True) for bone in context.selected_pose_bones or []]
+            return [(obj, False) for obj in context.selected_objects]
+        
+        owners = []
+        for obj in bpy.data.objects:
+            owners.append((obj, False))
+            if obj.type == 'ARMATURE' and obj.pose:
+                owners.extend((bone, True) for bone in obj.pose.bones)
+        return owners
 
 #---------------------------------------
 # Fine Tuning Operators
@@ -1469,10 +1712,16 @@ class ANIM_OT_record_from_min(bpy.types.Operator):
         # Set as FROM bone and record min
         props.from_armature = obj.name
         props.from_bone = bone.name
-        props.from_min_location = bone.location[:]
-        props.from_min_scale = bone.scale[:]
-        euler = ensure_euler_rotation(bone)
-        props.from_min_rotation = (euler.x, euler.y, euler.z)
+        if props.recording_mode == 'VISUAL':
+            location, rotation, scale = read_visual_bone_transforms(context, obj, [bone.name])[bone.name]
+            props.from_min_location = location
+            props.from_min_scale = scale
+            props.from_min_rotation = rotation
+        else:
+            props.from_min_location = bone.location[:]
+            props.from_min_scale = bone.scale[:]
+            euler = read_euler_rotation(bone)
+            props.from_min_rotation = (euler.x, euler.y, euler.z)
         props.from_has_min = True
         
         # Clear max and detected axis since we have a new bone
@@ -1491,7 +1740,7 @@ class ANIM_OT_record_from_min(bpy.types.Operator):
         props.from_object = obj.name
         props.from_object_min_location = obj.location[:]
         props.from_object_min_scale = obj.scale[:]
-        euler = ensure_object_euler_rotation(obj)
+        euler = read_euler_rotation(obj)
         props.from_object_min_rotation = (euler.x, euler.y, euler.z)
         props.from_object_has_min = True
         
@@ -1558,10 +1807,16 @@ class ANIM_OT_record_from_max(bpy.types.Operator):
             return {'CANCELLED'}
         
         # Record max values
-        props.from_max_location = bone.location[:]
-        props.from_max_scale = bone.scale[:]
-        euler = ensure_euler_rotation(bone)
-        props.from_max_rotation = (euler.x, euler.y, euler.z)
+        if props.recording_mode == 'VISUAL':
+            location, rotation, scale = read_visual_bone_transforms(context, obj, [bone.name])[bone.name]
+            props.from_max_location = location
+            props.from_max_scale = scale
+            props.from_max_rotation = rotation
+        else:
+            props.from_max_location = bone.location[:]
+            props.from_max_scale = bone.scale[:]
+            euler = read_euler_rotation(bone)
+            props.from_max_rotation = (euler.x, euler.y, euler.z)
         props.from_has_max = True
         
         # Detect primary axis
@@ -1583,7 +1838,7 @@ class ANIM_OT_record_from_max(bpy.types.Operator):
         # Record max values
         props.from_object_max_location = obj.location[:]
         props.from_object_max_scale = obj.scale[:]
-        euler = ensure_object_euler_rotation(obj)
+        euler = read_euler_rotation(obj)
         props.from_object_max_rotation = (euler.x, euler.y, euler.z)
         props.from_object_has_max = True
         
@@ -1692,10 +1947,10 @@ class POSE_OT_record_to_min_pose(bpy.types.Operator):
             return {'CANCELLED'}
         
         to_data = get_to_bones_data(props)
+        transforms = self.read_bone_transforms(context, obj, selected_bones)
         
         for bone in selected_bones:
-            # Use IK-aware bone transform recording
-            location, rotation, scale = self.get_bone_transforms(bone)
+            location, rotation, scale = transforms[bone.name]
             
             bone_data = to_data.get(bone.name, {
                 'armature': obj.name,
@@ -1722,6 +1977,13 @@ class POSE_OT_record_to_min_pose(bpy.types.Operator):
         self.report({'INFO'}, f"Recorded MIN pose for {len(selected_bones)} bones")
         return {'FINISHED'}
     
+    def read_bone_transforms(self, context, obj, bones):
+        """Read transforms for many bones at once, using the scene's recording mode."""
+        if context.scene.driver_recorder_props.recording_mode == 'VISUAL':
+            return read_visual_bone_transforms(context, obj, [bone.name for bone in bones])
+        # Use IK-aware bone transform recording
+        return {bone.name: self.get_bone_transforms(bone) for bone in bones}
+    
     def get_bone_transforms(self, bone):
         """Get bone transforms, handling IK constraints."""
         # Check if bone has IK constraints or is affected by IK
@@ -1733,9 +1995,10 @@ class POSE_OT_record_to_min_pose(bpy.types.Operator):
             location, rotation, scale = self.get_ik_bone_transforms(bone)
         else:
             # Standard method for non-IK bones
+            # Read-only: the bone is switched to Euler only when a rotation driver is created
             location = list(bone.location)
             scale = list(bone.scale)
-            euler = ensure_euler_rotation(bone, True)
+            euler = read_euler_rotation(bone)
             rotation = list(euler)
         
         return location, rotation, scale
@@ -1833,18 +2096,15 @@ class POSE_OT_record_to_max_pose(bpy.types.Operator):
             return {'CANCELLED'}
         
         bones_processed = 0
-        bones_not_found = []
+        bones_not_found = [name for name in bones_with_min if name not in armature_obj.pose.bones]
+        found_bones = [armature_obj.pose.bones[name] for name in bones_with_min if name in armature_obj.pose.bones]
+        transforms = self.read_bone_transforms(context, armature_obj, found_bones)
         
-        for bone_name in bones_with_min:
-            bone = armature_obj.pose.bones.get(bone_name)
-            if not bone:
-                bones_not_found.append(bone_name)
-                continue
-            
+        for bone in found_bones:
+            bone_name = bone.name
             bone_data = to_data[bone_name]
             
-            # Record max values using IK-aware method
-            location, rotation, scale = self.get_bone_transforms(bone)
+            location, rotation, scale = transforms[bone_name]
             
             bone_data['max_location'] = location
             bone_data['max_rotation'] = rotation
@@ -1863,25 +2123,7 @@ class POSE_OT_record_to_max_pose(bpy.types.Operator):
                 'scale': bone_data['max_scale']
             }
             
-            changes = detect_significant_changes(min_vals, max_vals)
-            bone_data['detected_changes'] = []
-            
-            for transform_type, axis, min_val, max_val in changes:
-                axis_names = ['X', 'Y', 'Z']
-                if transform_type == 'location':
-                    change_str = f"LOC {axis_names[axis]}"
-                elif transform_type == 'rotation_euler':
-                    change_str = f"ROT {axis_names[axis]}"
-                elif transform_type == 'scale':
-                    change_str = f"SCALE {axis_names[axis]}"
-
-                bone_data['detected_changes'].append({
-                    'type': transform_type,
-                    'axis': axis,
-                    'display': change_str,
-                    'min_val': min_val,
-                    'max_val': max_val
-                })
+            bone_data['detected_changes'] = build_detected_changes(min_vals, max_vals)
             
             bones_processed += 1
         
@@ -1895,6 +2137,8 @@ class POSE_OT_record_to_max_pose(bpy.types.Operator):
         
         return {'FINISHED'}
     
+    read_bone_transforms = POSE_OT_record_to_min_pose.read_bone_transforms
+    
     def get_bone_transforms(self, bone):
         """Get bone transforms, handling IK constraints."""
         # Check if bone has IK constraints or is affected by IK
@@ -1906,9 +2150,10 @@ class POSE_OT_record_to_max_pose(bpy.types.Operator):
             location, rotation, scale = self.get_ik_bone_transforms(bone)
         else:
             # Standard method for non-IK bones
+            # Read-only: the bone is switched to Euler only when a rotation driver is created
             location = list(bone.location)
             scale = list(bone.scale)
-            euler = ensure_euler_rotation(bone, True)
+            euler = read_euler_rotation(bone)
             rotation = list(euler)
         
         return location, rotation, scale
@@ -1976,6 +2221,398 @@ class POSE_OT_record_to_max_pose(bpy.types.Operator):
         
         return list(location), list(euler), list(scale)
 
+#---------------------------------------
+# Target>Pose Snapshot Operators
+#---------------------------------------
+def get_snapshot_armature(context):
+    """Return the active armature object, or None."""
+    obj = context.object
+    if obj and obj.type == 'ARMATURE':
+        return obj
+    return None
+
+class POSE_OT_snapshot_capture(bpy.types.Operator):
+    bl_idname = "pose.snapshot_capture"
+    bl_label = "Capture Pose Snapshot"
+    bl_description = "Store the current pose on the armature as a named snapshot"
+    bl_options = {'REGISTER', 'UNDO'}
+    
+    selected_only: bpy.props.BoolProperty(
+        name="Selected Only",
+        description="Only capture the selected bones",
+        default=False
+    )
+    
+    def execute(self, context):
+        props = context.scene.driver_recorder_props
+        armature_obj = get_snapshot_armature(context)
+        
+        if not armature_obj:
+            self.report({'ERROR'}, "Select an armature")
+            return {'CANCELLED'}
+        
+        name = props.snapshot_name.strip()
+        if not name:
+            self.report({'ERROR'}, "Enter a snapshot name")
+            return {'CANCELLED'}
+        
+        bone_names = None
+        if self.selected_only:
+            _, selected_bones = get_selected_pose_bones(context)
+            if not selected_bones:
+                self.report({'ERROR'}, "Please select bones in Pose Mode")
+                return {'CANCELLED'}
+            bone_names = [bone.name for bone in selected_bones]
+        
+        snapshot = capture_pose_snapshot(armature_obj, bone_names)
+        store_pose_snapshot(armature_obj, name, snapshot)
+        props.snapshot_active = name
+        
+        self.report({'INFO'}, f"Captured snapshot '{name}' ({len(snapshot['bones'])} bones, {snapshot['data'].nbytes} bytes)")
+        return {'FINISHED'}
+
+class POSE_OT_snapshot_apply(bpy.types.Operator):
+    bl_idname = "pose.snapshot_apply"
+    bl_label = "Apply Pose Snapshot"
+    bl_description = "Blend the pose towards the selected snapshot (the previous pose can be restored)"
+    bl_options = {'REGISTER', 'UNDO'}
+    
+    def execute(self, context):
+        props = context.scene.driver_recorder_props
+        armature_obj = get_snapshot_armature(context)
+        
+        if not armature_obj:
+            self.report({'ERROR'}, "Select an armature")
+            return {'CANCELLED'}
+        
+        snapshot = load_pose_snapshot(armature_obj, props.snapshot_active)
+        if snapshot is None:
+            self.report({'ERROR'}, "No pose snapshot selected")
+            return {'CANCELLED'}
+        
+        start_time = time.perf_counter()
+        
+        # Keep the pose we are replacing so it can be restored
+        store_pose_snapshot(armature_obj, "restore", capture_pose_snapshot(armature_obj, snapshot['bones']), POSE_RESTORE_PROP)
+        count = apply_pose_snapshot(armature_obj, snapshot, props.snapshot_blend)
+        context.view_layer.update()
+        
+        elapsed = time.perf_counter() - start_time
+        self.report({'INFO'}, f"Applied '{props.snapshot_active}' at {props.snapshot_blend:.2f} to {count} bones in {elapsed * 1000:.1f} ms")
+        return {'FINISHED'}
+
+class POSE_OT_snapshot_restore(bpy.types.Operator):
+    bl_idname = "pose.snapshot_restore"
+    bl_label = "Restore Pose"
+    bl_description = "Restore the pose from before the last snapshot was applied"
+    bl_options = {'REGISTER', 'UNDO'}
+    
+    def execute(self, context):
+        armature_obj = get_snapshot_armature(context)
+        
+        if not armature_obj:
+            self.report({'ERROR'}, "Select an armature")
+            return {'CANCELLED'}
+        
+        snapshot = load_pose_snapshot(armature_obj, "restore", POSE_RESTORE_PROP)
+        if snapshot is None:
+            self.report({'ERROR'}, "Nothing to restore")
+            return {'CANCELLED'}
+        
+        count = apply_pose_snapshot(armature_obj, snapshot)
+        del armature_obj[POSE_RESTORE_PROP]
+        context.view_layer.update()
+        
+        self.report({'INFO'}, f"Restored {count} bones")
+        return {'FINISHED'}
+
+class POSE_OT_snapshot_delete(bpy.types.Operator):
+    bl_idname = "pose.snapshot_delete"
+    bl_label = "Delete Pose Snapshot"
+    bl_description = "Delete the selected pose snapshot"
+    bl_options = {'REGISTER', 'UNDO'}
+    
+    def execute(self, context):
+        props = context.scene.driver_recorder_props
+        armature_obj = get_snapshot_armature(context)
+        name = props.snapshot_active
+        
+        if not armature_obj or not delete_pose_snapshot(armature_obj, name):
+            self.report({'ERROR'}, "No pose snapshot selected")
+            return {'CANCELLED'}
+        
+        self.report({'INFO'}, f"Deleted snapshot '{name}'")
+        return {'FINISHED'}
+
+class POSE_OT_snapshot_to_targets(bpy.types.Operator):
+    bl_idname = "pose.snapshot_to_targets"
+    bl_label = "Use Snapshot As Target"
+    bl_description = "Use the selected snapshot as the MIN or MAX pose of the target bones"
+    bl_options = {'REGISTER', 'UNDO'}
+    
+    slot: bpy.props.EnumProperty(
+        name="Slot",
+        items=[
+            ('MIN', "MIN", "Record the snapshot as MIN for the selected bones"),
+            ('MAX', "MAX", "Record the snapshot as MAX for bones with MIN recorded"),
+        ],
+        default='MIN'
+    )
+    
+    def execute(self, context):
+        props = context.scene.driver_recorder_props
+        armature_obj = get_snapshot_armature(context)
+        
+        if not armature_obj:
+            self.report({'ERROR'}, "Select an armature")
+            return {'CANCELLED'}
+        
+        snapshot = load_pose_snapshot(armature_obj, props.snapshot_active)
+        if snapshot is None:
+            self.report({'ERROR'}, "No pose snapshot selected")
+            return {'CANCELLED'}
+        
+        to_data = get_to_bones_data(props)
+        in_snapshot = set(snapshot['bones'])
+        
+        if self.slot == 'MIN':
+            _, selected_bones = get_selected_pose_bones(context)
+            bone_names = [bone.name for bone in selected_bones if bone.name in in_snapshot]
+        else:
+            bone_names = [name for name, data in to_data.items()
+                          if data.get('has_min') and data.get('armature') == armature_obj.name and name in in_snapshot]
+        
+        if not bone_names:
+            if self.slot == 'MIN':
+                self.report({'ERROR'}, "Select bones that are stored in the snapshot")
+            else:
+                self.report({'ERROR'}, "No bones with MIN recorded are stored in the snapshot")
+            return {'CANCELLED'}
+        
+        for bone_name in bone_names:
+            location, rotation, scale = get_snapshot_bone_transforms(snapshot, bone_name)
+            
+            if self.slot == 'MIN':
+                bone_data = to_data.get(bone_name, {
+                    'armature': armature_obj.name,
+                    'has_min': False,
+                    'has_max': False,
+                    'min_location': [0, 0, 0],
+                    'max_location': [0, 0, 0],
+                    'min_rotation': [0, 0, 0],
+                    'max_rotation': [0, 0, 0],
+                    'detected_changes': []
+                })
+                bone_data['min_location'] = location
+                bone_data['min_rotation'] = rotation
+                bone_data['min_scale'] = scale
+                bone_data['has_min'] = True
+                bone_data['has_max'] = False  # Reset max when recording new min
+                bone_data['detected_changes'] = []
+            else:
+                bone_data = to_data[bone_name]
+                bone_data['max_location'] = location
+                bone_data['max_rotation'] = rotation
+                bone_data['max_scale'] = scale
+                bone_data['has_max'] = True
+                
+                min_vals = {
+                    'location': bone_data['min_location'],
+                    'rotation': bone_data['min_rotation'],
+                    'scale': bone_data.get('min_scale', [1, 1, 1])
+                }
+                max_vals = {'location': location, 'rotation': rotation, 'scale': scale}
+                bone_data['detected_changes'] = build_detected_changes(min_vals, max_vals)
+            
+            to_data[bone_name] = bone_data
+        
+        set_to_bones_data(props, to_data)
+        
+        self.report({'INFO'}, f"Recorded snapshot '{props.snapshot_active}' as {self.slot} for {len(bone_names)} bones")
+        return {'FINISHED'}
+
+#---------------------------------------
+# Source>Action Sampling Operators
+#---------------------------------------
+class ANIM_OT_record_from_action(bpy.types.Operator):
+    """Record MIN/MAX by streaming the source through its animation"""
+    bl_idname = "anim.record_from_action"
+    bl_label = "Record From Action"
+    bl_description = "Sample the active bone/object over a frame range and record its MIN/MAX automatically (optionally the selected bones as pose targets)"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    frame_start: bpy.props.IntProperty(name="Start Frame")
+    frame_end: bpy.props.IntProperty(name="End Frame")
+    frame_step: bpy.props.IntProperty(name="Step", default=1, min=1)
+    include_targets: bpy.props.BoolProperty(
+        name="Record Pose Targets",
+        description="Also record the other selected bones as pose targets at the MIN/MAX frames",
+        default=False
+    )
+
+    # IK-aware target reading is shared with the pose recording operators
+    read_bone_transforms = POSE_OT_record_to_min_pose.read_bone_transforms
+    get_bone_transforms = POSE_OT_record_to_min_pose.get_bone_transforms
+    bone_has_ik_influence = POSE_OT_record_to_min_pose.bone_has_ik_influence
+    get_ik_bone_transforms = POSE_OT_record_to_min_pose.get_ik_bone_transforms
+    clear_bone_data = ANIM_OT_record_from_min.clear_bone_data
+    clear_object_data = ANIM_OT_record_from_min.clear_object_data
+
+    def invoke(self, context, event):
+        owner = self.get_source_owner(context)
+        if owner is None:
+            self.report({'ERROR'}, "Select an object, or an active bone in Pose Mode")
+            return {'CANCELLED'}
+        
+        # Default to the action's range, falling back to the scene range
+        animation_data = owner.id_data.animation_data
+        if animation_data and animation_data.action:
+            frame_start, frame_end = animation_data.action.frame_range
+        else:
+            frame_start, frame_end = context.scene.frame_start, context.scene.frame_end
+        self.frame_start = int(frame_start)
+        self.frame_end = int(frame_end)
+        
+        return context.window_manager.invoke_props_dialog(self)
+
+    def execute(self, context):
+        props = context.scene.driver_recorder_props
+        scene = context.scene
+        obj = context.object
+        owner = self.get_source_owner(context)
+        
+        if owner is None:
+            self.report({'ERROR'}, "Select an object, or an active bone in Pose Mode")
+            return {'CANCELLED'}
+        
+        if self.frame_end < self.frame_start:
+            self.report({'ERROR'}, "End frame must be after start frame")
+            return {'CANCELLED'}
+        
+        # Close fine tune mode when recording new values
+        context.scene.source_fine_tune_mode = False
+        
+        original_frame = scene.frame_current
+        frames = range(self.frame_start, self.frame_end + 1, self.frame_step)
+        
+        # Evaluate only the source's F-curves when nothing else can change its channels
+        if can_sample_from_fcurves(owner):
+            sampler = make_fcurve_channel_sampler(owner)
+            method = "F-curves"
+        else:
+            sampler = make_scene_channel_sampler(scene, owner)
+            method = "scene evaluation"
+        
+        start_time = time.perf_counter()
+        try:
+            tracker = stream_transform_range(sampler, frames)
+        finally:
+            if method == "scene evaluation":
+                scene.frame_set(original_frame)
+        elapsed = time.perf_counter() - start_time
+        
+        if tracker is None:
+            self.report({'ERROR'}, "Frame range is empty")
+            return {'CANCELLED'}
+        
+        channel = detect_range_channel(tracker)
+        if channel is None:
+            self.report({'ERROR'}, "No significant change detected in frame range")
+            return {'CANCELLED'}
+        
+        transform_type, axis = TRANSFORM_CHANNELS[channel]
+        display_prefix = {'location': 'LOC', 'rotation_euler': 'ROT', 'scale': 'SCALE'}[transform_type]
+        axis_display = f"{display_prefix} {['X', 'Y', 'Z'][axis]}"
+        min_sample = tracker['min_sample'][channel]
+        max_sample = tracker['max_sample'][channel]
+        min_frame = tracker['min_frame'][channel]
+        max_frame = tracker['max_frame'][channel]
+        
+        if isinstance(owner, bpy.types.PoseBone):
+            self.clear_object_data(props)
+            props.from_armature = obj.name
+            props.from_bone = owner.name
+            props.from_min_location = min_sample[0:3]
+            props.from_min_rotation = min_sample[3:6]
+            props.from_min_scale = min_sample[6:9]
+            props.from_max_location = max_sample[0:3]
+            props.from_max_rotation = max_sample[3:6]
+            props.from_max_scale = max_sample[6:9]
+            props.from_has_min = True
+            props.from_has_max = True
+            props.from_detected_axis = axis_display
+        else:
+            self.clear_bone_data(props)
+            props.from_object = owner.name
+            props.from_object_min_location = min_sample[0:3]
+            props.from_object_min_rotation = min_sample[3:6]
+            props.from_object_min_scale = min_sample[6:9]
+            props.from_object_max_location = max_sample[0:3]
+            props.from_object_max_rotation = max_sample[3:6]
+            props.from_object_max_scale = max_sample[6:9]
+            props.from_object_has_min = True
+            props.from_object_has_max = True
+            props.from_object_detected_axis = axis_display
+        
+        message = f"Detected {axis_display}: MIN at frame {min_frame}, MAX at frame {max_frame} ({len(frames)} frames via {method} in {elapsed * 1000:.1f} ms)"
+        
+        if self.include_targets:
+            recorded = self.record_targets(context, props, owner, min_frame, max_frame, original_frame)
+            message += f", recorded {recorded} pose targets"
+        
+        self.report({'INFO'}, message)
+        return {'FINISHED'}
+    
+    def get_source_owner(self, context):
+        """Return the active pose bone in Pose Mode, otherwise the active object."""
+        obj = context.object
+        if not obj:
+            return None
+        if obj.type == 'ARMATURE' and obj.mode == 'POSE':
+            return context.active_pose_bone
+        return obj
+    
+    def record_targets(self, context, props, owner, min_frame, max_frame, original_frame):
+        """Record the selected bones at the MIN and MAX frames (two scene evaluations in total)."""
+        obj, selected_bones = get_selected_pose_bones(context)
+        target_bones = [bone for bone in selected_bones if bone != owner]
+        if not target_bones:
+            return 0
+        
+        scene = context.scene
+        to_data = get_to_bones_data(props)
+        
+        try:
+            scene.frame_set(min_frame)
+            min_transforms = self.read_bone_transforms(context, obj, target_bones)
+            scene.frame_set(max_frame)
+            max_transforms = self.read_bone_transforms(context, obj, target_bones)
+        finally:
+            scene.frame_set(original_frame)
+        
+        for bone in target_bones:
+            min_location, min_rotation, min_scale = min_transforms[bone.name]
+            max_location, max_rotation, max_scale = max_transforms[bone.name]
+            
+            to_data[bone.name] = {
+                'armature': obj.name,
+                'has_min': True,
+                'has_max': True,
+                'min_location': min_location,
+                'max_location': max_location,
+                'min_rotation': min_rotation,
+                'max_rotation': max_rotation,
+                'min_scale': min_scale,
+                'max_scale': max_scale,
+                'detected_changes': build_detected_changes(
+                    {'location': min_location, 'rotation': min_rotation, 'scale': min_scale},
+                    {'location': max_location, 'rotation': max_rotation, 'scale': max_scale}
+                )
+            }
+        
+        set_to_bones_data(props, to_data)
+        return len(target_bones)
+
 #---------------------------------------
 # Target>Shapekey Operators
 #---------------------------------------
@@ -3286,208 +3923,619 @@ class ANIM_OT_create_drivers(bpy.types.Operator):
     bl_idname = "anim.create_drivers"
     bl_label = "Create Drivers"
     bl_description = "Create drivers from FROM source to all targets"
+    
+    ignore_cycles: bpy.props.BoolProperty(
+        name="Ignore Cycles",
+        description="Create the drivers even when they would form a dependency cycle",
+        default=False
+    )
+    
     def execute(self, context):
         props = context.scene.driver_recorder_props
         
-        # Initialize variables
-        from_path = None
-        source_name = None
-        from_min = None
-        from_max = None
+        source, error = get_driver_source(props)
+        if not source:
+            self.report({'ERROR'}, error)
+            return {'CANCELLED'}
         
-        # Determine source - check what's actually configured
-        # Priority: Check if we have valid recorded data first
-        if props.from_bone and props.from_has_min and props.from_has_max and props.from_detected_axis:
-            # Using bone source - verify it still exists
-            armature = bpy.data.objects.get(props.from_armature)
-            if not armature or props.from_bone not in armature.pose.bones:
-                self.report({'ERROR'}, f"Source bone '{props.from_bone}' not found in armature '{props.from_armature}'")
-                return {'CANCELLED'}
-            
-            # Get FROM bone values
-            from_axis_type, from_axis_name = props.from_detected_axis.split(' ')
-            from_axis_index = ['X', 'Y', 'Z'].index(from_axis_name)
-            
-            if from_axis_type == 'LOC':
-                from_min = props.from_min_location[from_axis_index]
-                from_max = props.from_max_location[from_axis_index]
-                from_prop = 'location'
-            elif from_axis_type == 'ROT':
-                from_min = props.from_min_rotation[from_axis_index]
-                from_max = props.from_max_rotation[from_axis_index]
-                from_prop = 'rotation_euler'
-            elif from_axis_type == 'SCALE':
-                from_min = props.from_min_scale[from_axis_index]
-                from_max = props.from_max_scale[from_axis_index]
-                from_prop = 'scale'
-            
-            from_path = f"{props.from_armature}.pose.bones[\"{props.from_bone}\"].{from_prop}[{from_axis_index}]"
-            source_name = props.from_armature
-            
-        elif props.from_object and props.from_object_has_min and props.from_object_has_max and props.from_object_detected_axis:
-            # Using object source - verify it still exists
-            obj = bpy.data.objects.get(props.from_object)
-            if not obj:
-                self.report({'ERROR'}, f"Source object '{props.from_object}' not found")
+        jobs, error = build_driver_jobs(props)
+        if jobs is None:
+            self.report({'ERROR'}, error)
+            return {'CANCELLED'}
+        
+        if not self.ignore_cycles and not self.check_cycles([(source, jobs)]):
+            return {'CANCELLED'}
+        
+        ensure_euler_targets(jobs)
+        run_jobs = run_hub_driver_jobs if props.use_hub_property else run_driver_jobs
+        drivers_created = run_jobs(source, jobs, props.clamp_mode != 'CONSTRAINT')
+        
+        if props.clamp_mode in ('CONSTRAINT', 'BOTH'):
+            apply_source_limits(get_source_owner_limits(source))
+        
+        # One depsgraph update for the whole batch
+        context.view_layer.update()
+        
+        self.report({'INFO'}, f"Created {drivers_created} drivers")
+        return {'FINISHED'}
+    
+    def check_cycles(self, plans):
+        """Report the dependency cycles the planned drivers would create. Returns False if there are any."""
+        cycles = check_planned_cycles(plans)
+        if not cycles:
+            return True
+        
+        print("=== DRIVER CYCLES ===")
+        for cycle in cycles:
+            print(f"  {' -> '.join(cycle)} -> {cycle[0]}")
+        self.report({'ERROR'}, f"These drivers would form {len(cycles)} dependency cycles, "
+                               f"e.g. {' -> '.join(cycles[0])} (see console)")
+        return False
+
+class ANIM_OT_create_drivers_mirrored(bpy.types.Operator):
+    bl_idname = "anim.create_drivers_mirrored"
+    bl_label = "Create Drivers (Both Sides)"
+    bl_description = "Create drivers for the targets and their mirrored opposites in one batch"
+    bl_options = {'REGISTER', 'UNDO'}
+    
+    ignore_cycles: bpy.props.BoolProperty(
+        name="Ignore Cycles",
+        description="Create the drivers even when they would form a dependency cycle",
+        default=False
+    )
+    
+    check_cycles = ANIM_OT_create_drivers.check_cycles
+    
+    def execute(self, context):
+        props = context.scene.driver_recorder_props
+        
+        source, error = get_driver_source(props)
+        if not source:
+            self.report({'ERROR'}, error)
+            return {'CANCELLED'}
+        
+        jobs, error = build_driver_jobs(props)
+        if jobs is None:
+            self.report({'ERROR'}, error)
+            return {'CANCELLED'}
+        
+        mirrored_source = mirror_driver_source(source, props.mirror_tolerance)
+        mirrored_jobs, unmatched = mirror_driver_jobs(jobs, props.mirror_tolerance, props.shapekey_mirror_mode)
+        
+        # Never drive the same channel twice
+        original_paths = {job['to_path'] for job in jobs}
+        mirrored_jobs = [job for job in mirrored_jobs if job['to_path'] not in original_paths]
+        
+        if not self.ignore_cycles and not self.check_cycles([(source, jobs), (mirrored_source, mirrored_jobs)]):
+            return {'CANCELLED'}
+        
+        ensure_euler_targets(jobs + mirrored_jobs)
+        clamp = props.clamp_mode != 'CONSTRAINT'
+        run_jobs = run_hub_driver_jobs if props.use_hub_property else run_driver_jobs
+        drivers_created = run_jobs(source, jobs, clamp)
+        drivers_created += run_jobs(mirrored_source, mirrored_jobs, clamp)
+        
+        if props.clamp_mode in ('CONSTRAINT', 'BOTH'):
+            apply_source_limits(get_source_owner_limits(source))
+            if mirrored_source['owner'] != source['owner']:
+                apply_source_limits(get_source_owner_limits(mirrored_source))
+        
+        # One depsgraph update for both sides
+        context.view_layer.update()
+        
+        message = f"Created {drivers_created} drivers ({len(mirrored_jobs)} mirrored"
+        if mirrored_source['owner'] == source['owner']:
+            message += ", shared source"
+        message += ")"
+        if unmatched:
+            message += f", no mirror for {len(unmatched)}: {', '.join(unmatched[:3])}"
+            if len(unmatched) > 3:
+                message += f" and {len(unmatched) - 3} more"
+        
+        self.report({'INFO'}, message)
+        return {'FINISHED'}
+
+
+class ANIM_OT_clamp_cost_report(bpy.types.Operator):
+    bl_idname = "anim.clamp_cost_report"
+    bl_label = "Clamp Cost Report"
+    bl_description = "Time frame changes with each clamp mode applied to the file's EasyDriver drivers"
+    
+    frame_count: bpy.props.IntProperty(
+        name="Frames",
+        description="Number of frames stepped per measurement",
+        default=24,
+        min=2
+    )
+    
+    def execute(self, context):
+        results = probe_clamp_costs(context.scene, self.frame_count)
+        if not results:
+            self.report({'WARNING'}, "No EasyDriver drivers found")
+            return {'CANCELLED'}
+        
+        print("=== CLAMP COST REPORT ===")
+        for mode, result in results.items():
+            print(f"  {mode:<10} {result['ms_per_frame']:8.3f} ms/frame  "
+                  f"{result['constraints']} constraints  "
+                  f"{result['simple_drivers']} simple / {result['python_drivers']} python drivers")
+        
+        cheapest = min(results, key=lambda mode: results[mode]['ms_per_frame'])
+        summary = ", ".join(f"{mode} {result['ms_per_frame']:.2f}" for mode, result in results.items())
+        self.report({'INFO'}, f"ms/frame: {summary} - cheapest: {cheapest}")
+        return {'FINISHED'}
+
+class ANIM_OT_optimize_drivers(bpy.types.Operator):
+    bl_idname = "anim.optimize_drivers"
+    bl_label = "Optimize Drivers"
+    bl_description = "Rewrite scripted drivers in the file that need Python into equivalent simple expressions or curve drivers"
+    bl_options = {'REGISTER', 'UNDO'}
+    
+    dry_run: bpy.props.BoolProperty(
+        name="Report Only",
+        description="Analyze and report without changing any driver",
+        default=False
+    )
+    
+    use_curves: bpy.props.BoolProperty(
+        name="Use Curve Drivers",
+        description="Turn drivers with several breakpoints into Averaged Value drivers with linear keyframes",
+        default=True
+    )
+    
+    frame_count: bpy.props.IntProperty(
+        name="Frames",
+        description="Number of frames stepped when measuring the frame time before and after",
+        default=24,
+        min=2
+    )
+    
+    def execute(self, context):
+        scene = context.scene
+        original_frame = scene.frame_current
+        
+        before_ms = time_frame_steps(scene, self.frame_count) if not self.dry_run else None
+        entries = optimize_drivers(apply=not self.dry_run, use_curves=self.use_curves)
+        if not entries:
+            self.report({'WARNING'}, "No drivers found")
+            return {'CANCELLED'}
+        
+        optimized = [entry for entry in entries if entry['status'] == 'OPTIMIZE']
+        after_ms = None
+        if not self.dry_run:
+            context.view_layer.update()
+            after_ms = time_frame_steps(scene, self.frame_count)
+        scene.frame_set(original_frame)
+        
+        lines = self.build_report(entries, before_ms, after_ms)
+        print("\n".join(lines))
+        
+        text = bpy.data.texts.get("EasyDriver Optimizer Report") or bpy.data.texts.new("EasyDriver Optimizer Report")
+        text.from_string("\n".join(lines))
+        
+        fast = sum(1 for entry in entries if entry['status'] == 'FAST')
+        verb = "Can optimize" if self.dry_run else "Optimized"
+        message = f"{verb} {len(optimized)} of {len(entries)} drivers ({fast} already fast)"
+        if after_ms is not None:
+            message += f", {before_ms:.2f} -> {after_ms:.2f} ms/frame"
+        self.report({'INFO'}, message + " - see the 'EasyDriver Optimizer Report' text")
+        return {'FINISHED'}
+    
+    def build_report(self, entries, before_ms, after_ms):
+        lines = ["=== DRIVER OPTIMIZER REPORT ==="]
+        for status in ('OPTIMIZE', 'SKIP', 'FAST'):
+            group = [entry for entry in entries if entry['status'] == status]
+            if not group:
+                continue
+            lines.append(f"\n{status} ({len(group)})")
+            for entry in group:
+                lines.append(f"  {entry['id']} {entry['data_path']}[{entry['index']}]")
+                lines.append(f"    before: {entry['before']}")
+                if entry['after']:
+                    lines.append(f"    after:  {entry['after']} ({entry['form'].lower()})")
+                elif entry['reason']:
+                    lines.append(f"    {entry['reason']}")
+        
+        if after_ms is not None:
+            lines.append(f"\nFrame time: {before_ms:.3f} ms before, {after_ms:.3f} ms after "
+                         f"({after_ms - before_ms:+.3f} ms/frame)")
+        return lines
+
+class ANIM_OT_profile_drivers(bpy.types.Operator):
+    bl_idname = "anim.profile_drivers"
+    bl_label = "Profile Drivers"
+    bl_description = "Step the timeline with groups of drivers muted to find which sources, targets and driver types are expensive"
+    
+    frame_count: bpy.props.IntProperty(
+        name="Frames",
+        description="Number of frames stepped per measurement, from the scene start frame",
+        default=24,
+        min=2
+    )
+    
+    repeats: bpy.props.IntProperty(
+        name="Repeats",
+        description="Times each measurement steps through the frames",
+        default=2,
+        min=1
+    )
+    
+    easydriver_only: bpy.props.BoolProperty(
+        name="EasyDriver Only",
+        description="Profile only drivers created by EasyDriver",
+        default=False
+    )
+    
+    def execute(self, context):
+        props = context.scene.driver_recorder_props
+        
+        profile = profile_drivers(context.scene, self.frame_count, self.repeats, easydriver_only=self.easydriver_only)
+        if not profile:
+            self.report({'WARNING'}, "No unmuted drivers to profile")
+            return {'CANCELLED'}
+        
+        props.profile_data = json.dumps(profile)
+        props.show_profiler = True
+        
+        driver_ms = profile['ms_unmuted'] - profile['ms_all_muted']
+        easydriver_ms = profile['ms_unmuted'] - profile['ms_easydriver_muted']
+        print("=== DRIVER PROFILE ===")
+        print(f"  {profile['ms_unmuted']:.3f} ms/frame, {driver_ms:.3f} ms in {len(profile['drivers'])} drivers, "
+              f"{easydriver_ms:.3f} ms in EasyDriver drivers ({profile['elapsed_s']:.1f} s to profile)")
+        self.report({'INFO'}, f"Drivers cost {driver_ms:.3f} of {profile['ms_unmuted']:.3f} ms/frame "
+                              f"(EasyDriver {easydriver_ms:.3f} ms)")
+        return {'FINISHED'}
+
+class ANIM_OT_export_driver_profile(bpy.types.Operator, ExportHelper):
+    bl_idname = "anim.export_driver_profile"
+    bl_label = "Export Driver Profile"
+    bl_description = "Save the last driver profile as JSON"
+    
+    filename_ext = ".json"
+    filter_glob: bpy.props.StringProperty(default="*.json", options={'HIDDEN'})
+    
+    def execute(self, context):
+        profile = json.loads(context.scene.driver_recorder_props.profile_data or "{}")
+        if not profile:
+            self.report({'ERROR'}, "Run Profile Drivers first")
+            return {'CANCELLED'}
+        
+        with open(self.filepath, 'w', encoding='utf-8') as profile_file:
+            json.dump(profile, profile_file, indent=2)
+        self.report({'INFO'}, f"Saved profile of {len(profile['drivers'])} drivers")
+        return {'FINISHED'}
+
+class ANIM_OT_driver_graph_report(bpy.types.Operator):
+    bl_idname = "anim.driver_graph_report"
+    bl_label = "Driver Graph Report"
+    bl_description = "Check EasyDriver drivers for dependency cycles, long chains and sources driving many targets"
+    
+    fanout_threshold: bpy.props.IntProperty(
+        name="Fan-Out Threshold",
+        description="Flag sources read by at least this many drivers as hub candidates",
+        default=DRIVER_FANOUT_THRESHOLD,
+        min=2
+    )
+    
+    def execute(self, context):
+        edges = collect_driver_edges()
+        if not edges:
+            self.report({'WARNING'}, "No EasyDriver drivers found")
+            return {'CANCELLED'}
+        
+        report = analyze_driver_graph(edges, self.fanout_threshold)
+        hubs = [entry for entry in report['sources'] if entry['hub_candidate']]
+        
+        lines = ["=== DRIVER GRAPH REPORT ===",
+                 f"{report['drivers']} drivers, {report['nodes']} bones/objects, longest chain {report['max_depth']}"]
+        if report['cycles']:
+            lines.append(f"\nCYCLES ({len(report['cycles'])})")
+            for cycle in report['cycles']:
+                lines.append(f"  {' -> '.join(cycle)} -> {cycle[0]}")
+        lines.append("\nSOURCES (fan-out, chain depth)")
+        for entry in report['sources']:
+            depth = "cycle" if entry['depth'] is None else entry['depth']
+            flag = "  <- hub candidate" if entry['hub_candidate'] else ""
+            lines.append(f"  {entry['channel']}: {entry['fanout']} drivers, depth {depth}{flag}")
+        
+        print("\n".join(lines))
+        text = bpy.data.texts.get("EasyDriver Graph Report") or bpy.data.texts.new("EasyDriver Graph Report")
+        text.from_string("\n".join(lines))
+        
+        message = (f"{len(report['cycles'])} cycles, longest chain {report['max_depth']}, "
+                   f"{len(hubs)} hub candidates - see the 'EasyDriver Graph Report' text")
+        self.report({'WARNING'} if report['cycles'] else {'INFO'}, message)
+        return {'FINISHED'}
+
+class ANIM_OT_bake_drivers(bpy.types.Operator):
+    bl_idname = "anim.bake_drivers"
+    bl_label = "Bake Drivers"
+    bl_description = "Bake EasyDriver drivers into action keyframes over a frame range (for game engine export)"
+    bl_options = {'REGISTER', 'UNDO'}
+    
+    scope: bpy.props.EnumProperty(
+        name="Drivers",
+        items=[
+            ('SELECTED', "Selected", "Drivers on the selected objects, their data and shape keys"),
+            ('FILE', "All", "Every EasyDriver driver in the file"),
+        ],
+        default='SELECTED'
+    )
+    
+    frame_start: bpy.props.IntProperty(name="Start Frame")
+    frame_end: bpy.props.IntProperty(name="End Frame")
+    
+    tolerance: bpy.props.FloatProperty(
+        name="Tolerance",
+        description="Largest allowed difference between the kept keys and the per-frame values (0 keeps a key on every frame)",
+        default=0.0001,
+        min=0.0,
+        precision=5
+    )
+    
+    driver_action: bpy.props.EnumProperty(
+        name="Then",
+        items=[
+            ('MUTE', "Mute Drivers", "Keep the drivers but mute them so the baked keys play"),
+            ('REMOVE', "Remove Drivers", "Delete the baked drivers"),
+            ('KEEP', "Keep Drivers", "Leave the drivers active (they override the baked keys)"),
+        ],
+        default='MUTE'
+    )
+    
+    def invoke(self, context, event):
+        self.frame_start = context.scene.frame_start
+        self.frame_end = context.scene.frame_end
+        return context.window_manager.invoke_props_dialog(self)
+    
+    def execute(self, context):
+        if self.frame_end < self.frame_start:
+            self.report({'ERROR'}, "End frame is before start frame")
+            return {'CANCELLED'}
+        
+        ids = get_bake_ids(context, self.scope)
+        report = bake_easydriver_drivers(context.scene, self.frame_start, self.frame_end, ids,
+                                         self.tolerance, self.driver_action)
+        if not report['drivers']:
+            self.report({'WARNING'}, "No EasyDriver drivers to bake")
+            return {'CANCELLED'}
+        
+        print("=== DRIVER BAKE ===")
+        print(f"  {report['drivers']} drivers, frames {self.frame_start}-{self.frame_end}")
+        print(f"  {report['keys']} keys written ({report['dense_keys']} before decimation, "
+              f"{report['ratio']:.1f}x smaller, max error {report['max_error']:.6f})")
+        print(f"  sources: {report['fcurve_sources']} from F-curves, {report['scene_sources']} from scene evaluation")
+        if report['hubs']:
+            print(f"  {report['hubs']} hub drivers {'muted' if self.driver_action == 'MUTE' else 'removed'}")
+        print(f"  {report['elapsed_ms']:.0f} ms")
+        
+        self.report({'INFO'}, f"Baked {report['drivers']} drivers to {report['keys']} keys "
+                              f"({report['ratio']:.1f}x compression, max error {report['max_error']:.6f}) "
+                              f"in {report['elapsed_ms']:.0f} ms")
+        return {'FINISHED'}
+
+class ANIM_OT_export_driver_spec(bpy.types.Operator, ExportHelper):
+    bl_idname = "anim.export_driver_spec"
+    bl_label = "Export Driver Spec"
+    bl_description = "Save driver setups to a versioned JSON spec that can be re-applied to other files"
+    
+    filename_ext = ".json"
+    filter_glob: bpy.props.StringProperty(default="*.json", options={'HIDDEN'})
+    
+    scope: bpy.props.EnumProperty(
+        name="Export",
+        items=[
+            ('SETUP', "Current Setup", "The source and targets recorded in the panel"),
+            ('FILE', "All Drivers", "Every EasyDriver driver in the file, grouped by source channel"),
+        ],
+        default='SETUP'
+    )
+    
+    setup_name: bpy.props.StringProperty(
+        name="Name",
+        description="Name of the exported setup (defaults to the source channel)",
+        default=""
+    )
+    
+    def execute(self, context):
+        props = context.scene.driver_recorder_props
+        
+        if self.scope == 'SETUP':
+            setup, error = setup_from_props(props, self.setup_name)
+            if not setup:
+                self.report({'ERROR'}, error)
                 return {'CANCELLED'}
-            
-            # Get FROM object values
-            from_axis_type, from_axis_name = props.from_object_detected_axis.split(' ')
-            from_axis_index = ['X', 'Y', 'Z'].index(from_axis_name)
-            
-            if from_axis_type == 'LOC':
-                from_min = props.from_object_min_location[from_axis_index]
-                from_max = props.from_object_max_location[from_axis_index]
-                from_prop = 'location'
-            elif from_axis_type == 'ROT':
-                from_min = props.from_object_min_rotation[from_axis_index]
-                from_max = props.from_object_max_rotation[from_axis_index]
-                from_prop = 'rotation_euler'
-            elif from_axis_type == 'SCALE':
-                from_min = props.from_object_min_scale[from_axis_index]
-                from_max = props.from_object_max_scale[from_axis_index]
-                from_prop = 'scale'
-            
-            from_path = f"{props.from_object}.{from_prop}[{from_axis_index}]"
-            source_name = props.from_object
-            
+            setups, skipped = [setup], 0
         else:
-            self.report({'ERROR'}, "No source configured with MIN, MAX, and detected axis. Please record MIN and MAX first.")
+            setups, skipped = collect_file_setups()
+            if not setups:
+                self.report({'WARNING'}, "No EasyDriver drivers found")
+                return {'CANCELLED'}
+        
+        try:
+            save_spec(new_spec(setups), self.filepath)
+        except OSError as e:
+            self.report({'ERROR'}, f"Could not write spec: {e}")
+            return {'CANCELLED'}
+        
+        targets = sum(len(entries) for setup in setups for entries in setup['targets'].values())
+        message = f"Exported {len(setups)} setups ({targets} targets)"
+        if skipped:
+            message += f", skipped {skipped} drivers with unsupported targets"
+        self.report({'INFO'}, message)
+        return {'FINISHED'}
+
+class ANIM_OT_import_driver_spec(bpy.types.Operator, ImportHelper):
+    bl_idname = "anim.import_driver_spec"
+    bl_label = "Import Driver Spec"
+    bl_description = "Rebuild every driver in a JSON spec in one pass"
+    bl_options = {'REGISTER', 'UNDO'}
+    
+    filename_ext = ".json"
+    filter_glob: bpy.props.StringProperty(default="*.json;*.toml", options={'HIDDEN'})
+    
+    keep_going: bpy.props.BoolProperty(
+        name="Skip Invalid Setups",
+        description="Apply the valid setups even when some reference missing bones, objects or shape keys",
+        default=False
+    )
+    
+    def execute(self, context):
+        try:
+            spec = load_spec(self.filepath)
+        except Exception as e:
+            self.report({'ERROR'}, f"Could not read spec: {e}")
             return {'CANCELLED'}
         
-        # Validate that we have all required source data
-        if not all([from_path, source_name, from_min is not None, from_max is not None]):
-            self.report({'ERROR'}, "Failed to configure source data")
+        report = apply_spec(spec, fail_fast=not self.keep_going)
+        if 'error' in report:
+            self.report({'ERROR'}, report['error'])
             return {'CANCELLED'}
         
-        # Rest of the method remains the same...
-        drivers_created = 0
+        failed = [result for result in report['setups'] if result['errors']]
+        for result in failed:
+            print(f"Setup '{result['name']}':")
+            for error in result['errors']:
+                print(f"  - {error}")
         
-        if props.target_type == 'CUSTOM_POSE':
-            # Create drivers for custom pose bones
-            to_data = get_to_bones_data(props)
-            if not to_data:
-                self.report({'ERROR'}, "No TO bones recorded")
+        if failed and not self.keep_going:
+            self.report({'ERROR'}, f"{len(failed)} setups are invalid, nothing was created (see console)")
+            return {'CANCELLED'}
+        
+        message = f"Created {report['created']}/{report['expected']} drivers in {report['elapsed_ms']:.0f} ms"
+        if failed:
+            self.report({'WARNING'}, f"{message}, {len(failed)} setups skipped (see console)")
+        else:
+            self.report({'INFO'}, message)
+        return {'FINISHED'}
+
+class ANIM_OT_apply_driver_preset(bpy.types.Operator):
+    bl_idname = "anim.apply_driver_preset"
+    bl_label = "Apply Preset To Characters"
+    bl_description = "Apply the current setup or a spec file to other characters through a name remap, in one batch"
+    bl_options = {'REGISTER', 'UNDO'}
+    
+    preset_source: bpy.props.EnumProperty(
+        name="Preset",
+        items=[
+            ('SETUP', "Current Setup", "The source and targets recorded in the panel"),
+            ('SPEC', "Spec File", "A spec exported with Export Spec"),
+        ],
+        default='SETUP'
+    )
+    
+    filepath: bpy.props.StringProperty(name="Spec File", subtype='FILE_PATH')
+    
+    remap_mode: bpy.props.EnumProperty(
+        name="Remap",
+        items=[
+            ('PREFIX', "Prefix", "Swap a leading prefix, e.g. 'CHR_Bob:' to 'CHR_Ann:'"),
+            ('REGEX', "Regex", "Replace a regular expression in every name"),
+            ('TABLE', "Table", "Look names up in a text datablock of old=new lines"),
+        ],
+        default='PREFIX'
+    )
+    
+    find: bpy.props.StringProperty(name="Find", description="Prefix or regular expression to replace")
+    replace: bpy.props.StringProperty(
+        name="Replace",
+        description=f"Replacement; {OBJECT_PLACEHOLDER} becomes each character's armature name"
+    )
+    table_text: bpy.props.StringProperty(name="Table", description="Text datablock with old=new lines")
+    
+    per_armature: bpy.props.BoolProperty(
+        name="Each Selected Armature",
+        description=f"Apply once per selected armature, substituting its name for {OBJECT_PLACEHOLDER}",
+        default=True
+    )
+    
+    keep_going: bpy.props.BoolProperty(
+        name="Skip Invalid Setups",
+        description="Apply to the characters that resolve even when others are missing names",
+        default=False
+    )
+    
+    def invoke(self, context, event):
+        return context.window_manager.invoke_props_dialog(self, width=400)
+    
+    def draw(self, context):
+        layout = self.layout
+        layout.prop(self, "preset_source", expand=True)
+        if self.preset_source == 'SPEC':
+            layout.prop(self, "filepath")
+        
+        layout.prop(self, "remap_mode", expand=True)
+        if self.remap_mode == 'TABLE':
+            layout.prop_search(self, "table_text", bpy.data, "texts")
+        else:
+            layout.prop(self, "find")
+        layout.prop(self, "replace")
+        
+        layout.prop(self, "per_armature")
+        layout.prop(self, "keep_going")
+    
+    def execute(self, context):
+        props = context.scene.driver_recorder_props
+        
+        if self.preset_source == 'SETUP':
+            setup, error = setup_from_props(props)
+            if not setup:
+                self.report({'ERROR'}, error)
+                return {'CANCELLED'}
+            spec = new_spec([setup])
+        else:
+            try:
+                spec = load_spec(bpy.path.abspath(self.filepath))
+            except Exception as e:
+                self.report({'ERROR'}, f"Could not read spec: {e}")
                 return {'CANCELLED'}
-            
-            for bone_name, bone_data in to_data.items():
-                if not (bone_data.get('has_min', False) and bone_data.get('has_max', False)):
-                    print(f"Skipping bone {bone_name}: missing min/max data")
-                    continue
-                
-                detected_changes = bone_data.get('detected_changes', [])
-                if not detected_changes:
-                    print(f"Skipping bone {bone_name}: no detected changes")
-                    continue
-                
-                for change in detected_changes:
-                    try:
-                        to_prop = change.get('type')
-                        to_axis = change.get('axis')
-                        to_min = change.get('min_val')
-                        to_max = change.get('max_val')
-                        armature_name = bone_data.get('armature')
-                        
-                        # Validate all required data is present
-                        if None in [to_prop, to_axis, to_min, to_max, armature_name]:
-                            print(f"Skipping change for {bone_name}: missing data - prop:{to_prop}, axis:{to_axis}, min:{to_min}, max:{to_max}, armature:{armature_name}")
-                            continue
-                        
-                        to_path = f"{armature_name}.pose.bones[\"{bone_name}\"].{to_prop}[{to_axis}]"
-                        
-                        print(f"Creating driver: {bone_name} - {to_prop}[{to_axis}]")
-                        
-                        success = createDriver(
-                            armature_name=source_name,
-                            from_path=from_path,
-                            fromMin=from_min,
-                            fromMax=from_max,
-                            to_path=to_path,
-                            toMin=to_min,
-                            toMax=to_max,
-                            selfRotation=False,
-                            isDegrees=False
-                        )
-                        
-                        if success:
-                            drivers_created += 1
-                            print(f"✓ Driver created successfully")
-                        else:
-                            print(f"✗ Driver creation failed")
-                            
-                    except Exception as e:
-                        print(f"Error processing change for bone {bone_name}: {e}")
-                        continue
         
-        elif props.target_type == 'SHAPEKEY_LIST':
-            # Create drivers for shape keys
-            shapekey_data = get_shapekey_list_data(props)
-            if not shapekey_data:
-                self.report({'ERROR'}, "No shape keys in list")
+        table = None
+        if self.remap_mode == 'TABLE':
+            text = bpy.data.texts.get(self.table_text)
+            if not text:
+                self.report({'ERROR'}, "Choose a text datablock with old=new lines")
                 return {'CANCELLED'}
-            
-            for key, sk_data in shapekey_data.items():
-                try:
-                    to_path = f"{sk_data['object']}.data.shape_keys.key_blocks[\"{sk_data['shapekey']}\"].value"
-                    
-                    success = createDriver(
-                        armature_name=source_name,
-                        from_path=from_path,
-                        fromMin=from_min,
-                        fromMax=from_max,
-                        to_path=to_path,
-                        toMin=sk_data['min_value'],
-                        toMax=sk_data['max_value'],
-                        selfRotation=False,
-                        isDegrees=False
-                    )
-                    
-                    if success:
-                        drivers_created += 1
-                        
-                except Exception as e:
-                    print(f"Error creating shapekey driver for {key}: {e}")
-                    continue
+            table = parse_rename_table(text.as_string())
         
-        elif props.target_type == 'PATH_LIST':
-            # Create drivers for custom paths
-            path_data = get_path_list_data(props)
-            if not path_data:
-                self.report({'ERROR'}, "No custom paths in list")
+        if self.per_armature:
+            object_names = [obj.name for obj in context.selected_objects if obj.type == 'ARMATURE']
+            if not object_names:
+                self.report({'ERROR'}, "Select the character armatures to apply to")
                 return {'CANCELLED'}
-            
-            for path, path_info in path_data.items():
-                try:
-                    if path_info['type'] == 'FLOAT':
-                        to_min = path_info['min_value']
-                        to_max = path_info['max_value']
-                    else:  # BOOLEAN
-                        to_min = path_info['false_value']
-                        to_max = path_info['true_value']
-                    
-                    success = createDriver(
-                        armature_name=source_name,
-                        from_path=from_path,
-                        fromMin=from_min,
-                        fromMax=from_max,
-                        to_path=path,
-                        toMin=to_min,
-                        toMax=to_max,
-                        selfRotation=False,
-                        isDegrees=False
-                    )
-                    
-                    if success:
-                        drivers_created += 1
-                        
-                except Exception as e:
-                    print(f"Error creating path driver for {path}: {e}")
-                    continue
+        else:
+            object_names = [context.object.name if context.object else ""]
         
-        self.report({'INFO'}, f"Created {drivers_created} drivers")
+        try:
+            remapped = remap_spec(spec, self.remap_mode, self.find, self.replace, table, object_names)
+        except re.error as e:
+            self.report({'ERROR'}, f"Invalid regular expression: {e}")
+            return {'CANCELLED'}
+        
+        # One name index and one view layer update for every character
+        report = apply_spec(remapped, fail_fast=not self.keep_going, name_index=build_name_index())
+        if 'error' in report:
+            self.report({'ERROR'}, report['error'])
+            return {'CANCELLED'}
+        
+        failed = [result for result in report['setups'] if result['errors']]
+        for result in failed:
+            print(f"Setup '{result['name']}':")
+            for error in result['errors']:
+                print(f"  - {error}")
+        
+        if failed and not self.keep_going:
+            self.report({'ERROR'}, f"{len(failed)} setups did not resolve, nothing was created (see console)")
+            return {'CANCELLED'}
+        
+        message = (f"Created {report['created']}/{report['expected']} drivers for "
+                   f"{len(object_names)} characters in {report['elapsed_ms']:.0f} ms")
+        if failed:
+            self.report({'WARNING'}, f"{message}, {len(failed)} setups skipped (see console)")
+        else:
+            self.report({'INFO'}, message)
         return {'FINISHED'}
 
-
 class ANIM_OT_remove_drivers(bpy.types.Operator):
     bl_idname = "anim.remove_drivers"
     bl_label = "Remove Drivers"
@@ -3749,8 +4797,14 @@ classes = (
     DriverRecorderProperties,
     ANIM_OT_record_from_min,
     ANIM_OT_record_from_max,
+    ANIM_OT_record_from_action,
     POSE_OT_record_to_min_pose,
     POSE_OT_record_to_max_pose,
+    POSE_OT_snapshot_capture,
+    POSE_OT_snapshot_apply,
+    POSE_OT_snapshot_restore,
+    POSE_OT_snapshot_delete,
+    POSE_OT_snapshot_to_targets,
     MESH_OT_add_shapekey_target,
     MESH_OT_remove_shapekey_target,
     SCENE_OT_validate_path,
@@ -3759,6 +4813,16 @@ classes = (
     SCENE_OT_record_path_min,      # NEW
     SCENE_OT_record_path_max,      # NEW
     ANIM_OT_create_drivers,
+    ANIM_OT_create_drivers_mirrored,
+    ANIM_OT_clamp_cost_report,
+    ANIM_OT_optimize_drivers,
+    ANIM_OT_profile_drivers,
+    ANIM_OT_export_driver_profile,
+    ANIM_OT_driver_graph_report,
+    ANIM_OT_bake_drivers,
+    ANIM_OT_export_driver_spec,
+    ANIM_OT_import_driver_spec,
+    ANIM_OT_apply_driver_preset,
     ANIM_OT_remove_drivers,
     SCENE_OT_clear_all,
     SCENE_OT_set_target_type,
@@ -3766,6 +4830,8 @@ classes = (
     SCENE_OT_clear_source,
     OBJECT_OT_limit_source_transforms,
     OBJECT_OT_one_axis_source_limit,
+    OBJECT_OT_limit_sources_batch,
+    OBJECT_OT_consolidate_limits,
     ANIM_OT_path_eyedropper,
     ANIM_OT_object_eyedropper,
     POSE_OT_remove_pose_bone,
@@ -3781,7 +4847,11 @@ classes = (
 def register():
     for cls in classes:
         bpy.utils.register_class(cls)
+    if bone_symmetry_depsgraph_update not in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.append(bone_symmetry_depsgraph_update)
 
 def unregister():
+    if bone_symmetry_depsgraph_update in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(bone_symmetry_depsgraph_update)
     for cls in reversed(classes):
         bpy.utils.unregister_class(cls)
@@ -0,0 +1,20 @@
+"""Driver logic with no bpy dependency.
+
+Everything here works on plain strings, numbers and dicts, so it can be imported
+outside Blender (tests, headless batch tools) by putting the add-on folder on sys.path
+and importing ``core``.
+"""
+from .mapping import (
+    MAPPING_EXPRESSION_PATTERN, create_mapping_expression, parse_mapping_expression,
+    apply_mapping, apply_mapping_array
+)
+from .paths import (
+    TARGET_PATH_PATTERNS, match_target_path, match_transform_channel, match_source_path,
+    extract_array_index, build_source_path
+)
+from .changes import detect_significant_changes, build_detected_changes
+from .mirror import (
+    MIRROR_CHANNEL_SIGNS, MIRROR_NAME_PAIRS, MIRROR_PATTERN_TABLE, MIRROR_PATTERN_LENGTHS,
+    compile_mirror_patterns, get_mirrored_name, get_mirrored_names
+)
+from .axes import AXIS_PROPERTIES, AXIS_NAMES, parse_axis_info, parse_channel, channel_name
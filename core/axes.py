@@ -0,0 +1,39 @@
+#---------------------------------------
+# Axes and Channels
+#---------------------------------------
+AXIS_PROPERTIES = {'LOC': 'location', 'ROT': 'rotation_euler', 'SCALE': 'scale'}
+
+AXIS_NAMES = ('X', 'Y', 'Z')
+
+def parse_axis_info(axis_string):
+    """Parse axis string like 'LOC X' or 'ROT Y' into components"""
+    if not axis_string:
+        return None
+    
+    parts = axis_string.split()
+    if len(parts) != 2:
+        return None
+    
+    transform_type = parts[0]  # LOC, ROT, SCALE
+    axis = parts[1]  # X, Y, Z
+    
+    if axis not in AXIS_NAMES:
+        return None
+    
+    return {
+        'transform': transform_type,
+        'axis': axis,
+        'index': AXIS_NAMES.index(axis)
+    }
+
+def parse_channel(channel):
+    """Turn 'LOC X' into ('location', 0), or None if it isn't a transform channel."""
+    axis_info = parse_axis_info(channel) if isinstance(channel, str) else None
+    if not axis_info or axis_info['transform'] not in AXIS_PROPERTIES:
+        return None
+    return AXIS_PROPERTIES[axis_info['transform']], axis_info['index']
+
+def channel_name(prop, axis):
+    """Turn ('location', 0) into 'LOC X'."""
+    transform = {value: key for key, value in AXIS_PROPERTIES.items()}[prop]
+    return f"{transform} {AXIS_NAMES[axis]}"
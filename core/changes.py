@@ -0,0 +1,43 @@
+#---------------------------------------
+# Change Detection
+#---------------------------------------
+def detect_significant_changes(min_vals, max_vals, threshold_loc=0.001, threshold_rot=0.06, threshold_scale=0.01):
+    """Detect which axes have significant changes between min and max values."""
+    changes = []
+    
+    # Check location changes
+    for i in range(3):
+        diff = abs(max_vals['location'][i] - min_vals['location'][i])
+        if diff > threshold_loc:
+            changes.append(('location', i, min_vals['location'][i], max_vals['location'][i]))
+    
+    # Check rotation changes
+    for i in range(3):
+        diff = abs(max_vals['rotation'][i] - min_vals['rotation'][i])
+        if diff > threshold_rot:
+            changes.append(('rotation_euler', i, min_vals['rotation'][i], max_vals['rotation'][i]))
+    
+    # Check scale changes
+    for i in range(3):
+        diff = abs(max_vals['scale'][i] - min_vals['scale'][i])
+        if diff > threshold_scale:
+            changes.append(('scale', i, min_vals['scale'][i], max_vals['scale'][i]))
+    
+    return changes
+
+def build_detected_changes(min_vals, max_vals):
+    """Run detect_significant_changes and format the result as stored in to_bones_data."""
+    axis_names = ['X', 'Y', 'Z']
+    display_prefix = {'location': 'LOC', 'rotation_euler': 'ROT', 'scale': 'SCALE'}
+    detected_changes = []
+    
+    for transform_type, axis, min_val, max_val in detect_significant_changes(min_vals, max_vals):
+        detected_changes.append({
+            'type': transform_type,
+            'axis': axis,
+            'display': f"{display_prefix[transform_type]} {axis_names[axis]}",
+            'min_val': min_val,
+            'max_val': max_val
+        })
+    
+    return detected_changes
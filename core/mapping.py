@@ -0,0 +1,67 @@
+import re
+
+#---------------------------------------
+# Mapping Expressions
+#---------------------------------------
+def create_mapping_expression(fromMin, fromMax, toMin, toMax, clamp=True):
+    """Create the linear mapping expression with proper range handling (clamp=False leaves the input unclamped).
+
+    Returns None when the source range is too small to divide by.
+    """
+    
+    # Check for division by zero
+    range_diff = fromMax - fromMin
+    if abs(range_diff) < 0.000001:
+        return None
+    
+    # Create clamping bounds (always use min/max correctly)
+    clamp_min = min(fromMin, fromMax)
+    clamp_max = max(fromMin, fromMax)
+    
+    # Create expression with proper linear mapping
+    # This handles reversed ranges correctly by using original values
+    clamped_input = f"max({clamp_min}, min({clamp_max}, drv))" if clamp else "drv"
+    
+    # Linear interpolation: output = toMin + (input - fromMin) * (toMax - toMin) / (fromMax - fromMin)
+    expression = f"({toMin} + (({clamped_input} - ({fromMin})) * ({toMax} - ({toMin})) / ({fromMax} - ({fromMin}))))"
+    
+    return expression
+
+_NUMBER = r"(-?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?)"
+
+# The expression written by create_mapping_expression
+MAPPING_EXPRESSION_PATTERN = re.compile(
+    rf"^\({_NUMBER} \+ \(\((?:max\({_NUMBER}, min\({_NUMBER}, drv\)\)|drv) - \({_NUMBER}\)\) \* "
+    rf"\({_NUMBER} - \({_NUMBER}\)\) / \({_NUMBER} - \({_NUMBER}\)\)\)\)$"
+)
+
+def parse_mapping_expression(expression):
+    """Parse an EasyDriver mapping expression into a dict of its ranges, or None if it isn't one."""
+    match = MAPPING_EXPRESSION_PATTERN.match(expression.strip())
+    if not match:
+        return None
+    
+    to_min, clamp_min, clamp_max, from_min, to_max, _, from_max, _ = match.groups()
+    return {
+        'from_min': float(from_min),
+        'from_max': float(from_max),
+        'to_min': float(to_min),
+        'to_max': float(to_max),
+        'clamped': clamp_min is not None,
+    }
+
+def apply_mapping(value, mapping):
+    """Apply an EasyDriver mapping (as parsed by parse_mapping_expression) to a single source value."""
+    from_min, from_max = mapping['from_min'], mapping['from_max']
+    if mapping['clamped']:
+        value = max(min(from_min, from_max), min(max(from_min, from_max), value))
+    return mapping['to_min'] + (value - from_min) * (mapping['to_max'] - mapping['to_min']) / (from_max - from_min)
+
+def apply_mapping_array(values, mapping):
+    """Apply an EasyDriver mapping (as parsed by parse_mapping_expression) to an array of source values."""
+    import numpy as np
+    
+    from_min, from_max = mapping['from_min'], mapping['from_max']
+    if mapping['clamped']:
+        values = np.clip(values, min(from_min, from_max), max(from_min, from_max))
+    return mapping['to_min'] + (values - from_min) * (mapping['to_max'] - mapping['to_min']) / (from_max - from_min)
@@ -0,0 +1,152 @@
+from functools import lru_cache
+
+#---------------------------------------
+# Mirroring
+#---------------------------------------
+# Channels that change sign when a transform is mirrored across X
+MIRROR_CHANNEL_SIGNS = {
+    ('location', 0): -1.0,
+    ('rotation_euler', 1): -1.0,
+    ('rotation_euler', 2): -1.0,
+}
+
+# Left/right name patterns - order matters (more specific first). Each pattern is tried as a
+# suffix first, then as a prefix; the earliest pair in this table wins.
+MIRROR_NAME_PAIRS = (
+    # Underscores
+    ('_Left', '_Right'), ('_left', '_right'), ('_L', '_R'), ('_l', '_r'),
+    # Dots  
+    ('.Left', '.Right'), ('.left', '.right'), ('.L', '.R'), ('.l', '.r'),
+    # Dashes
+    ('-Left', '-Right'), ('-left', '-right'), ('-L', '-R'), ('-l', '-r'),
+    # Prefixes with underscores
+    ('Left_', 'Right_'), ('left_', 'right_'), ('L_', 'R_'), ('l_', 'r_'),
+    # Prefixes with dots
+    ('Left.', 'Right.'), ('left.', 'right.'), ('L.', 'R.'), ('l.', 'r.'),
+    # Prefixes with dashes
+    ('Left-', 'Right-'), ('left-', 'right-'), ('L-', 'R-'), ('l-', 'r-'),
+    # Plain words
+    ('left', 'right'), ('Left', 'Right'),
+    
+    # Common 3D software patterns
+    ('_lf', '_rt'), ('_LF', '_RT'), ('.lf', '.rt'), ('.LF', '.RT'),
+    ('lf_', 'rt_'), ('LF_', 'RT_'), ('lf.', 'rt.'), ('LF.', 'RT.'),
+    ('lf-', 'rt-'), ('LF-', 'RT-'), ('-lf', '-rt'), ('-LF', '-RT'),
+    
+    # Blender/Maya common patterns
+    ('_side_L', '_side_R'), ('_side_l', '_side_r'), ('.side.L', '.side.R'), ('.side.l', '.side.r'),
+    ('side_L_', 'side_R_'), ('side_l_', 'side_r_'), ('side.L.', 'side.R.'), ('side.l.', 'side.r.'),
+    ('side-L-', 'side-R-'), ('side-l-', 'side-r-'), ('-side_L', '-side_R'), ('-side_l', '-side_r'),
+
+    # Blender-specific patterns
+    ('_L_', '_R_'), ('_l_', '_r_'), ('.L_', '.R_'), ('.l_', '.r_'),
+    ('L_.', 'R_.'), ('l_.', 'r_.'),
+    ('L_-', 'R_-'), ('l_-', 'r_-'),
+    
+   # Anatomical/Medical
+    ('_sin', '_dex'), ('_SIN', '_DEX'), ('sin_', 'dex_'), ('SIN_', 'DEX_'),
+    ('.sin', '.dex'), ('.SIN', '.DEX'), ('sin.', 'dex.'), ('SIN.', 'DEX.'),
+    
+    # Game engine patterns
+    ('_lt', '_rt'), ('_LT', '_RT'), ('lt_', 'rt_'), ('LT_', 'RT_'),
+    ('.lt', '.rt'), ('.LT', '.RT'), ('lt.', 'rt.'), ('LT.', 'RT.'),
+    ('lt-', 'rt-'), ('LT-', 'RT-'), ('-lt', '-rt'), ('-LT', '-RT'),
+
+    # Directional patterns
+    ('_west', '_east'), ('_West', '_East'), ('_WEST', '_EAST'),
+    ('west_', 'east_'), ('West_', 'East_'), ('WEST_', 'EAST_'),
+    ('.west', '.east'), ('.West', '.East'), ('.WEST', '.EAST'),
+    ('west.', 'east.'), ('West.', 'East.'), ('WEST.', 'EAST.'),
+
+    # Port/Starboard (nautical)  ARGGGHH~
+    ('_port', '_starboard'), ('_Port', '_Starboard'), ('_PORT', '_STARBOARD'),
+    ('port_', 'starboard_'), ('Port_', 'Starboard_'), ('PORT_', 'STARBOARD_'),
+    
+    # A/B patterns
+    ('_A', '_B'), ('_a', '_b'), ('A_', 'B_'), ('a_', 'b_'),
+    ('.A', '.B'), ('.a', '.b'), ('A.', 'B.'), ('a.', 'b.'),
+    ('A-', 'B-'), ('a-', 'b-'), ('-A', '-B'), ('-a', '-b'),
+    
+    # X/Y patterns (sometimes used for left/right... probrably shouldn't be, but whatever)
+    ('_X', '_Y'), ('_x', '_y'), ('X_', 'Y_'), ('x_', 'y_'),
+    ('.X', '.Y'), ('.x', '.y'), ('X.', 'Y.'), ('x.', 'y.'),
+    
+    # Parentheses patterns
+    ('(L)', '(R)'), ('(l)', '(r)'), ('(Left)', '(Right)'), ('(left)', '(right)'),
+    
+    # Bracket patterns
+    ('[L]', '[R]'), ('[l]', '[r]'), ('[Left]', '[Right]'), ('[left]', '[right]'),
+    ('[1]', '[2]'), ('[A]', '[B]'), ('[a]', '[b]'),
+    
+    # Colon patterns
+    (':L', ':R'), (':l', ':r'), (':Left', ':Right'), (':left', ':right'),
+    ('L:', 'R:'), ('l:', 'r:'), ('Left:', 'Right:'), ('left:', 'right:'),
+    
+    # Space patterns (less common but possible)
+    (' L', ' R'), (' l', ' r'), (' Left', ' Right'), (' left', ' right'),
+    ('L ', 'R '), ('l ', 'r '), ('Left ', 'Right '), ('left ', 'right '),
+
+    
+    ('*l', '*r'), ('*L', '*R'),  # Asterisk patterns
+    
+    # Mixed case patterns
+    ('_lEFT', '_rIGHT'), ('_LeFt', '_RiGhT'), ('lEFT_', 'rIGHT_'), ('LeFt_', 'RiGhT_'),
+    
+    # Double separator patterns
+    ('__L', '__R'), ('__l', '__r'), ('..L', '..R'), ('..l', '..r'),
+    ('--L', '--R'), ('--l', '--r'), ('L__', 'R__'), ('l__', 'r__'),
+    
+    # Pipe separator patterns
+    ('|L', '|R'), ('|l', '|r'), ('L|', 'R|'), ('l|', 'r|'),
+    ('|Left', '|Right'), ('|left', '|right'), ('Left|', 'Right|'), ('left|', 'right|'),
+    
+    # Hash patterns
+    ('#L', '#R'), ('#l', '#r'), ('L#', 'R#'), ('l#', 'r#'),
+    
+    # At symbol patterns
+    ('@L', '@R'), ('@l', '@r'), ('L@', 'R@'), ('l@', 'r@'),
+
+    ('L', 'R'),  # Very general patterns at the end
+)
+
+def compile_mirror_patterns(pairs):
+    """Compile pattern pairs into {pattern: (replacement, priority)} lookups plus the lengths to try."""
+    table = {}
+    for i, (left_pattern, right_pattern) in enumerate(pairs):
+        # Left is checked before right within a pair, and the first pair wins overall
+        table.setdefault(left_pattern, (right_pattern, 2 * i))
+        table.setdefault(right_pattern, (left_pattern, 2 * i + 1))
+    lengths = sorted({len(pattern) for pattern in table})
+    return table, lengths
+
+MIRROR_PATTERN_TABLE, MIRROR_PATTERN_LENGTHS = compile_mirror_patterns(MIRROR_NAME_PAIRS)
+
+@lru_cache(maxsize=65536)
+def get_mirrored_name(name):
+    """Get the mirrored/opposite name for bones and shape keys following standard naming conventions."""
+    if not name:
+        return None
+    
+    # Only one dictionary lookup per pattern length instead of a scan over every pattern
+    for from_end in (True, False):
+        best = None
+        for length in MIRROR_PATTERN_LENGTHS:
+            if length > len(name):
+                break
+            part = name[-length:] if from_end else name[:length]
+            match = MIRROR_PATTERN_TABLE.get(part)
+            if match and (best is None or match[1] < best[2]):
+                best = (length, match[0], match[1])
+        
+        if best:
+            length, replacement, _ = best
+            if from_end:
+                return name[:-length] + replacement
+            return replacement + name[length:]
+    
+    # No mirror pattern found
+    return None
+
+def get_mirrored_names(names):
+    """Mirror many names at once, returning {name: mirrored name or None}."""
+    return {name: get_mirrored_name(name) for name in names}
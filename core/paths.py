@@ -0,0 +1,143 @@
+import re
+
+#---------------------------------------
+# Path Parsing
+#---------------------------------------
+# (pattern, handler name, debug message) in match order. Handlers ending in '_long' take
+# bpy.data paths; the short ones are skipped for paths that start with bpy.data.
+TARGET_PATH_PATTERNS = [
+    # Long format patterns (bpy.data...)
+    (r'bpy\.data\.materials\["([^"]+)"\]\.node_tree\.nodes\["([^"]+)"\]\.color_ramp\.elements\[(\d+)\]\.(.+)', 
+     'colorramp_long', "✓ COLORRAMP ELEMENT (LONG FORMAT) DETECTED!"),
+    
+    (r'bpy\.data\.materials\["([^"]+)"\]\.node_tree\.nodes\["([^"]+)"\]\.(?:inputs|outputs)\[(\d+)\]\.default_value', 
+     'material_node_long', "✓ MATERIAL NODE (LONG FORMAT) DETECTED!"),
+    
+    (r'bpy\.data\.objects\["([^"]+)"\]\.constraints\["([^"]+)"\]\.(.+)', 
+     'constraint_long', "✓ OBJECT CONSTRAINT (LONG FORMAT) DETECTED!"),
+    
+    (r'bpy\.data\.objects\["([^"]+)"\]\.data\.shape_keys\.key_blocks\["([^"]+)"\]\.value', 
+     'shapekey_long', "✓ SHAPEKEY (LONG FORMAT) DETECTED!"),
+    
+    (r'bpy\.data\.objects\["([^"]+)"\]\.pose\.bones\["([^"]+)"\]\.([a-zA-Z_]+)(?:\[(\d+)\])?', 
+     'bone_long', "✓ BONE TRANSFORM (LONG FORMAT) DETECTED!"),
+    
+    # Custom properties pattern (must be before general object pattern)
+    (r'bpy\.data\.objects\["([^"]+)"\]\["([^"]+)"\]', 
+     'object_custom_prop_long', "✓ OBJECT CUSTOM PROPERTY (LONG FORMAT) DETECTED!"),
+    
+    (r'bpy\.data\.cameras\["([^"]+)"\]\.(.+)', 
+     'camera_long', "✓ CAMERA PROPERTY (LONG FORMAT) DETECTED!"),
+    
+    (r'bpy\.data\.lights\["([^"]+)"\]\.(.+)', 
+     'light_long', "✓ LIGHT PROPERTY (LONG FORMAT) DETECTED!"),
+    
+    (r'bpy\.data\.materials\["([^"]+)"\]\.(.+)', 
+     'material_long', "✓ GENERAL MATERIAL PROPERTY (LONG FORMAT) DETECTED!"),
+    
+    (r'bpy\.data\.armatures\["([^"]+)"\]\.(.+)', 
+     'armature_long', "✓ ARMATURE PROPERTY (LONG FORMAT) DETECTED!"),
+    
+    (r'bpy\.data\.objects\["([^"]+)"\]\.(.+)', 
+     'object_long', "✓ GENERAL OBJECT PROPERTY (LONG FORMAT) DETECTED!"),
+    
+    # Short format patterns (only if not starting with bpy.data.)
+    (r'(.+)\.data\.shape_keys\.key_blocks\["([^"]+)"\]\.value', 
+     'shapekey_short', "✓ SHAPEKEY (SHORT FORMAT) DETECTED!"),
+    
+    (r'(.+)\.pose\.bones\["([^"]+)"\]\.([a-zA-Z_]+)(?:\[(\d+)\])?', 
+     'bone_short', "✓ BONE TRANSFORM (SHORT FORMAT) DETECTED!"),
+    
+    (r'(.+)\.constraints\["([^"]+)"\]\.(.+)', 
+     'constraint_short', "✓ OBJECT CONSTRAINT (SHORT FORMAT) DETECTED!"),
+    
+    (r'(.+)\.node_tree\.nodes\["([^"]+)"\]\.(?:inputs|outputs)\[(\d+)\]\.default_value', 
+     'material_node_short', "✓ MATERIAL NODE (SHORT FORMAT) DETECTED!"),
+    
+    # Custom properties pattern (short format - must be before general pattern)
+    (r'(.+)\["([^"]+)"\]$', 
+     'custom_prop_short', "✓ CUSTOM PROPERTY (SHORT FORMAT) DETECTED!"),
+    
+    (r'(.+)\.(.+)', 
+     'general_short', "✓ GENERAL PROPERTY (SHORT FORMAT) DETECTED!"),
+]
+
+def match_target_path(to_path):
+    """Match a target path against TARGET_PATH_PATTERNS.
+
+    Returns (handler name, groups, debug message) for the first match, or None.
+    """
+    for pattern, handler_name, debug_msg in TARGET_PATH_PATTERNS:
+        # Skip short format patterns if path starts with bpy.data.
+        if not handler_name.endswith('_long') and to_path.startswith('bpy.data.'):
+            continue
+            
+        match = re.match(pattern, to_path)
+        if match:
+            return handler_name, match.groups(), debug_msg
+    return None
+
+TRANSFORM_PROPERTIES = ('location', 'rotation_euler', 'scale')
+
+def match_transform_channel(to_path):
+    """Return (property, index) when a target path drives a bone or object transform channel, else None."""
+    matched = match_target_path(to_path)
+    if not matched:
+        return None
+    handler_name, groups, _ = matched
+    
+    if handler_name in ('bone_long', 'bone_short'):
+        prop_name, index = groups[2], groups[3]
+        index = int(index) if index else -1
+    elif handler_name in ('object_long', 'general_short'):
+        prop_name, index = extract_array_index(groups[1])
+    else:
+        return None
+    
+    if prop_name not in TRANSFORM_PROPERTIES or index < 0:
+        return None
+    return prop_name, index
+
+SOURCE_BONE_PATTERN = re.compile(r'(.+)\.pose\.bones\["([^"]+)"\]\.([a-zA-Z_]+)\[(\d+)\]')
+SOURCE_OBJECT_PATTERN = re.compile(r'(.+)\.([a-zA-Z_]+)\[(\d+)\]')
+
+def match_source_path(from_path):
+    """Split a createDriver from_path into a dict of names, or None if it isn't a transform source.
+
+    Bone sources give {'type': 'bone', 'armature_path', 'bone_name', 'property', 'index'},
+    object sources give {'type': 'object', 'object_name', 'property', 'index'}.
+    """
+    bone_match = SOURCE_BONE_PATTERN.match(from_path)
+    if bone_match:
+        armature_path, bone_name, prop_name, index = bone_match.groups()
+        return {
+            'type': 'bone',
+            'armature_path': armature_path,
+            'bone_name': bone_name,
+            'property': prop_name,
+            'index': int(index)
+        }
+    
+    obj_match = SOURCE_OBJECT_PATTERN.match(from_path)
+    if obj_match:
+        obj_name, prop_name, index = obj_match.groups()
+        return {
+            'type': 'object',
+            'object_name': obj_name,
+            'property': prop_name,
+            'index': int(index)
+        }
+    return None
+
+def extract_array_index(data_path):
+    """Extract array index from data path if present."""
+    array_match = re.match(r'(.+)\[(\d+)\]$', data_path)
+    if array_match:
+        return array_match.group(1), int(array_match.group(2))
+    return data_path, -1
+
+def build_source_path(source):
+    """Build the createDriver from_path for a source dict."""
+    if source['kind'] == 'bone':
+        return f"{source['armature_name']}.pose.bones[\"{source['owner']}\"].{source['property']}[{source['axis']}]"
+    return f"{source['owner']}.{source['property']}[{source['axis']}]"
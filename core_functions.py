@@ -3,13 +3,26 @@ import bpy
 import math
 import re
 import json
+import time
+import zlib
 from math import degrees, radians
+from .core import (
+    create_mapping_expression, parse_mapping_expression, apply_mapping_array,
+    match_target_path, match_transform_channel, match_source_path, extract_array_index, build_source_path,
+    detect_significant_changes, build_detected_changes,
+    MIRROR_CHANNEL_SIGNS, get_mirrored_name, get_mirrored_names,
+    AXIS_PROPERTIES
+)
 
 #---------------------------------------
 # Driver Functions
 #---------------------------------------
-def createDriver(armature_name, from_path, fromMin, fromMax, to_path, toMin, toMax, selfRotation=False, isDegrees=False):
-    """Create a driver from one bone/property to another with linear mapping and clamping."""
+def createDriver(armature_name, from_path, fromMin, fromMax, to_path, toMin, toMax, selfRotation=False, isDegrees=False, update=True, clamp=True):
+    """Create a driver from one bone/property to another with linear mapping and clamping.
+
+    Pass update=False when creating many drivers and update the view layer once afterwards,
+    and clamp=False when a constraint already limits the source.
+    """
     
     print(f"=== DRIVER CREATION START ===")
     print(f"FROM: {from_path}")
@@ -66,16 +79,17 @@ def createDriver(armature_name, from_path, fromMin, fromMax, to_path, toMin, toM
 
         # === CONFIGURE DRIVER ===
         print("\n=== CONFIGURING DRIVER ===")
-        if not configure_driver(fcurve, source_config):
+        # Without the expression clamp the source must be read after its Limit constraint
+        if not configure_driver(fcurve, source_config, read_constrained=not clamp):
             print("ERROR: Failed to configure driver")
             return False
 
         # === CREATE EXPRESSION ===
         print("\n=== CREATING EXPRESSION ===")
-        expression = create_mapping_expression(original_fromMin, original_fromMax, original_toMin, original_toMax)
+        expression = create_mapping_expression(original_fromMin, original_fromMax, original_toMin, original_toMax, clamp)
         
         if not expression:
-            print("ERROR: Failed to create expression")
+            print(f"ERROR: Failed to create expression, source range too small: {original_fromMax - original_fromMin}")
             return False
         
         fcurve.driver.expression = expression
@@ -83,7 +97,8 @@ def createDriver(armature_name, from_path, fromMin, fromMax, to_path, toMin, toM
 
         # === FINALIZE ===
         print("\n=== FINALIZING ===")
-        bpy.context.view_layer.update()
+        if update:
+            bpy.context.view_layer.update()
         
         print(f"✓ SUCCESS: Driver created!")
         print("=== DRIVER CREATION COMPLETE ===")
@@ -125,8 +140,13 @@ def add_new_driver(data_block, data_path, index):
         print(f"ERROR: Failed to add driver: {e}")
         return None
 
-def configure_driver(fcurve, source_config):
-    """Configure the driver with source variable."""
+def configure_driver(fcurve, source_config, read_constrained=False):
+    """Configure the driver with source variable.
+
+    read_constrained reads object sources through a TRANSFORMS variable, which sees the
+    result of constraints; a SINGLE_PROP variable reads the raw property and would bypass
+    the Limit constraint that replaces the expression clamp in CONSTRAINT mode.
+    """
     try:
         driver = fcurve.driver
         driver.type = 'SCRIPTED'
@@ -173,11 +193,30 @@ def configure_driver(fcurve, source_config):
             
         elif source_config['type'] == 'object':
             print("✓ Configuring object source...")
-            var.type = 'SINGLE_PROP'
-            target = var.targets[0]
-            
-            target.id = source_config['object']
-            target.data_path = f"{source_config['property']}[{source_config['index']}]"
+            obj = source_config['object']
+
+            is_rotation = source_config['property'] == 'rotation_euler'
+            if read_constrained or (is_rotation and obj.rotation_mode not in EULER_ROTATION_MODES):
+                # Read through a TRANSFORMS variable when the constrained value is needed, and
+                # for rotation on quaternion/axis-angle objects, where rotation_euler is stale
+                transform = {'location': 'LOC', 'rotation_euler': 'ROT', 'scale': 'SCALE'}.get(source_config['property'])
+                if not transform:
+                    print(f"ERROR: Unsupported transform type: {source_config['property']}")
+                    return False
+                var.type = 'TRANSFORMS'
+                target = var.targets[0]
+
+                target.id = obj
+                target.transform_type = f"{transform}_{'XYZ'[source_config['index']]}"
+                target.transform_space = 'TRANSFORM_SPACE'
+                if is_rotation:
+                    target.rotation_mode = 'AUTO'
+            else:
+                var.type = 'SINGLE_PROP'
+                target = var.targets[0]
+
+                target.id = obj
+                target.data_path = f"{source_config['property']}[{source_config['index']}]"
         
         else:
             print(f"ERROR: Unknown source type: {source_config['type']}")
@@ -190,27 +229,244 @@ def configure_driver(fcurve, source_config):
         print(f"ERROR: Failed to configure driver: {e}")
         return False
 
-def create_mapping_expression(fromMin, fromMax, toMin, toMax):
-    """Create the linear mapping expression with proper range handling."""
-    
-    # Check for division by zero
-    range_diff = fromMax - fromMin
-    if abs(range_diff) < 0.000001:
-        print(f"ERROR: Source range too small: {range_diff}")
-        return None
-    
-    # Create clamping bounds (always use min/max correctly)
-    clamp_min = min(fromMin, fromMax)
-    clamp_max = max(fromMin, fromMax)
+#---------------------------------------
+# Driver Jobs
+#---------------------------------------
+def get_driver_source(props):
+    """Resolve the recorded source into a dict for createDriver, or (None, error message)."""
+    if props.from_bone and props.from_has_min and props.from_has_max and props.from_detected_axis:
+        # Using bone source - verify it still exists
+        armature = bpy.data.objects.get(props.from_armature)
+        if not armature or props.from_bone not in armature.pose.bones:
+            return None, f"Source bone '{props.from_bone}' not found in armature '{props.from_armature}'"
+        
+        axis_type, axis_name = props.from_detected_axis.split(' ')
+        min_values = {'LOC': props.from_min_location, 'ROT': props.from_min_rotation, 'SCALE': props.from_min_scale}
+        max_values = {'LOC': props.from_max_location, 'ROT': props.from_max_rotation, 'SCALE': props.from_max_scale}
+        kind, owner_name, source_name = 'bone', props.from_bone, props.from_armature
+    
+    elif props.from_object and props.from_object_has_min and props.from_object_has_max and props.from_object_detected_axis:
+        # Using object source - verify it still exists
+        if not bpy.data.objects.get(props.from_object):
+            return None, f"Source object '{props.from_object}' not found"
+        
+        axis_type, axis_name = props.from_object_detected_axis.split(' ')
+        min_values = {'LOC': props.from_object_min_location, 'ROT': props.from_object_min_rotation, 'SCALE': props.from_object_min_scale}
+        max_values = {'LOC': props.from_object_max_location, 'ROT': props.from_object_max_rotation, 'SCALE': props.from_object_max_scale}
+        kind, owner_name, source_name = 'object', props.from_object, props.from_object
     
-    # Create expression with proper linear mapping
-    # This handles reversed ranges correctly by using original values
-    clamped_input = f"max({clamp_min}, min({clamp_max}, drv))"
+    else:
+        return None, "No source configured with MIN, MAX, and detected axis. Please record MIN and MAX first."
+    
+    axis = ['X', 'Y', 'Z'].index(axis_name)
+    source = {
+        'kind': kind,
+        'owner': owner_name,
+        'armature_name': source_name,
+        'property': AXIS_PROPERTIES[axis_type],
+        'axis': axis,
+        'from_min': min_values[axis_type][axis],
+        'from_max': max_values[axis_type][axis],
+    }
+    source['from_path'] = build_source_path(source)
+    return source, None
+
+def build_driver_jobs(props):
+    """Build one job per target channel of the current target type, or (None, error message).
+
+    Each job holds the createDriver target arguments plus what mirroring needs:
+    kind ('bone', 'shapekey' or 'path') and the bone/shape key it drives.
+    """
+    jobs = []
     
-    # Linear interpolation: output = toMin + (input - fromMin) * (toMax - toMin) / (fromMax - fromMin)
-    expression = f"({toMin} + (({clamped_input} - ({fromMin})) * ({toMax} - ({toMin})) / ({fromMax} - ({fromMin}))))"
+    if props.target_type == 'CUSTOM_POSE':
+        to_data = get_to_bones_data(props)
+        if not to_data:
+            return None, "No TO bones recorded"
+        
+        for bone_name, bone_data in to_data.items():
+            if not (bone_data.get('has_min', False) and bone_data.get('has_max', False)):
+                print(f"Skipping bone {bone_name}: missing min/max data")
+                continue
+            
+            detected_changes = bone_data.get('detected_changes', [])
+            if not detected_changes:
+                print(f"Skipping bone {bone_name}: no detected changes")
+                continue
+            
+            for change in detected_changes:
+                to_prop = change.get('type')
+                to_axis = change.get('axis')
+                to_min = change.get('min_val')
+                to_max = change.get('max_val')
+                armature_name = bone_data.get('armature')
+                
+                # Validate all required data is present
+                if None in [to_prop, to_axis, to_min, to_max, armature_name]:
+                    print(f"Skipping change for {bone_name}: missing data - prop:{to_prop}, axis:{to_axis}, min:{to_min}, max:{to_max}, armature:{armature_name}")
+                    continue
+                
+                jobs.append({
+                    'kind': 'bone',
+                    'armature': armature_name,
+                    'bone': bone_name,
+                    'property': to_prop,
+                    'axis': to_axis,
+                    'to_path': f"{armature_name}.pose.bones[\"{bone_name}\"].{to_prop}[{to_axis}]",
+                    'to_min': to_min,
+                    'to_max': to_max,
+                })
+    
+    elif props.target_type == 'SHAPEKEY_LIST':
+        shapekey_data = get_shapekey_list_data(props)
+        if not shapekey_data:
+            return None, "No shape keys in list"
+        
+        for sk_data in shapekey_data.values():
+            jobs.append({
+                'kind': 'shapekey',
+                'object': sk_data['object'],
+                'shapekey': sk_data['shapekey'],
+                'to_path': f"{sk_data['object']}.data.shape_keys.key_blocks[\"{sk_data['shapekey']}\"].value",
+                'to_min': sk_data['min_value'],
+                'to_max': sk_data['max_value'],
+            })
+    
+    elif props.target_type == 'PATH_LIST':
+        path_data = get_path_list_data(props)
+        if not path_data:
+            return None, "No custom paths in list"
+        
+        for path, path_info in path_data.items():
+            if path_info['type'] == 'FLOAT':
+                to_min, to_max = path_info['min_value'], path_info['max_value']
+            else:  # BOOLEAN
+                to_min, to_max = path_info['false_value'], path_info['true_value']
+            jobs.append({'kind': 'path', 'to_path': path, 'to_min': to_min, 'to_max': to_max})
+    
+    return jobs, None
+
+def ensure_euler_targets(jobs):
+    """Switch bones driven on rotation_euler to Euler, once per bone (recording never touches rotation_mode)."""
+    converted = set()
+    for job in jobs:
+        if job['kind'] != 'bone' or job['property'] != 'rotation_euler':
+            continue
+        key = (job['armature'], job['bone'])
+        if key in converted:
+            continue
+        converted.add(key)
+        
+        target_armature = bpy.data.objects.get(job['armature'])
+        if target_armature and target_armature.type == 'ARMATURE':
+            target_bone = target_armature.pose.bones.get(job['bone'])
+            if target_bone:
+                ensure_euler_rotation(target_bone, True)
+
+def run_driver_jobs(source, jobs, clamp=True):
+    """Create a driver for every job without per-driver view layer updates. Returns the number created."""
+    created = 0
+    for job in jobs:
+        try:
+            success = createDriver(
+                armature_name=source['armature_name'],
+                from_path=source['from_path'],
+                fromMin=source['from_min'],
+                fromMax=source['from_max'],
+                to_path=job['to_path'],
+                toMin=job['to_min'],
+                toMax=job['to_max'],
+                selfRotation=False,
+                isDegrees=False,
+                update=False,
+                clamp=clamp
+            )
+            if success:
+                created += 1
+        except Exception as e:
+            print(f"Error creating driver for {job['to_path']}: {e}")
+    return created
+
+def mirror_driver_source(source, tolerance=0.001):
+    """Return the opposite-side source, or the same source when it sits on the centre line."""
+    mirrored = dict(source)
+    
+    if source['kind'] == 'bone':
+        armature = bpy.data.objects.get(source['armature_name'])
+        partner = get_bone_symmetry_map(armature, tolerance)['mirror'].get(source['owner']) if armature else None
+    else:
+        partner = get_mirrored_name(source['owner'])
+        if partner not in bpy.data.objects:
+            partner = None
+    
+    if not partner:
+        return mirrored
+    
+    sign = MIRROR_CHANNEL_SIGNS.get((source['property'], source['axis']), 1.0)
+    mirrored['owner'] = partner
+    if source['kind'] == 'object':
+        mirrored['armature_name'] = partner
+    mirrored['from_min'] = source['from_min'] * sign
+    mirrored['from_max'] = source['from_max'] * sign
+    mirrored['from_path'] = build_source_path(mirrored)
+    return mirrored
+
+def mirror_driver_jobs(jobs, tolerance=0.001, shapekey_mode='NAME'):
+    """Build the opposite-side jobs, flipping signs per MIRROR_CHANNEL_SIGNS.
+
+    Targets without an opposite (centre bones, unsided keys) are returned separately
+    so they are not driven twice.
+    """
+    mirrored_jobs = []
+    unmatched = []
+    symmetry_maps = {}
+    shapekey_maps = {}
+    
+    for job in jobs:
+        if job['kind'] == 'bone':
+            if job['armature'] not in symmetry_maps:
+                armature = bpy.data.objects.get(job['armature'])
+                valid = armature and armature.type == 'ARMATURE'
+                symmetry_maps[job['armature']] = get_bone_symmetry_map(armature, tolerance) if valid else None
+            symmetry = symmetry_maps[job['armature']]
+            partner = symmetry['mirror'].get(job['bone']) if symmetry else None
+            if not partner:
+                unmatched.append(job['bone'])
+                continue
+            
+            sign = MIRROR_CHANNEL_SIGNS.get((job['property'], job['axis']), 1.0)
+            mirrored = dict(job, bone=partner, to_min=job['to_min'] * sign, to_max=job['to_max'] * sign)
+            mirrored['to_path'] = f"{job['armature']}.pose.bones[\"{partner}\"].{job['property']}[{job['axis']}]"
+        
+        elif job['kind'] == 'shapekey':
+            if job['object'] not in shapekey_maps:
+                obj = bpy.data.objects.get(job['object'])
+                shapekey_maps[job['object']] = get_shapekey_mirror_map(obj, shapekey_mode, tolerance) if obj else {}
+            partner = shapekey_maps[job['object']].get(job['shapekey'])
+            if not partner:
+                unmatched.append(job['shapekey'])
+                continue
+            
+            mirrored = dict(job, shapekey=partner)
+            mirrored['to_path'] = f"{job['object']}.data.shape_keys.key_blocks[\"{partner}\"].value"
+        
+        else:
+            # Mirror every quoted name in the path, e.g. pose.bones["arm.L"]
+            mirrored_path = re.sub(r'\["([^"]+)"\]', lambda m: f'["{get_mirrored_name(m.group(1)) or m.group(1)}"]', job['to_path'])
+            if mirrored_path == job['to_path']:
+                unmatched.append(job['to_path'])
+                continue
+            mirrored = dict(job, to_path=mirrored_path)
+            
+            # Bone and object transform paths flip sign like bone jobs do
+            channel = match_transform_channel(job['to_path'])
+            if channel:
+                sign = MIRROR_CHANNEL_SIGNS.get(channel, 1.0)
+                mirrored.update(to_min=job['to_min'] * sign, to_max=job['to_max'] * sign)
+        
+        mirrored_jobs.append(mirrored)
     
-    return expression
+    return mirrored_jobs, unmatched
 
 
 #---------------------------------------
@@ -444,13 +700,6 @@ def apply_object_source_internal(props, obj):
 
 
 
-def extract_array_index(data_path):
-    """Extract array index from data path if present."""
-    array_match = re.search(r'(.+)\[(\d+)\]$', data_path)
-    if array_match:
-        return array_match.group(1), int(array_match.group(2))
-    return data_path, -1
-
 def auto_detect_path_type(data_block, data_path, index=-1):
     """Safely detect property type using Blender's path resolution."""
     try:
@@ -486,64 +735,6 @@ def parse_target_path(to_path):
     
     print(f"DEBUG: Parsing path: {to_path}")
     
-    # Pattern definitions with their handlers
-    patterns = [
-        # Long format patterns (bpy.data...)
-        (r'bpy\.data\.materials\["([^"]+)"\]\.node_tree\.nodes\["([^"]+)"\]\.color_ramp\.elements\[(\d+)\]\.(.+)', 
-         'colorramp_long', "✓ COLORRAMP ELEMENT (LONG FORMAT) DETECTED!"),
-        
-        (r'bpy\.data\.materials\["([^"]+)"\]\.node_tree\.nodes\["([^"]+)"\]\.(?:inputs|outputs)\[(\d+)\]\.default_value', 
-         'material_node_long', "✓ MATERIAL NODE (LONG FORMAT) DETECTED!"),
-        
-        (r'bpy\.data\.objects\["([^"]+)"\]\.constraints\["([^"]+)"\]\.(.+)', 
-         'constraint_long', "✓ OBJECT CONSTRAINT (LONG FORMAT) DETECTED!"),
-        
-        (r'bpy\.data\.objects\["([^"]+)"\]\.data\.shape_keys\.key_blocks\["([^"]+)"\]\.value', 
-         'shapekey_long', "✓ SHAPEKEY (LONG FORMAT) DETECTED!"),
-        
-        (r'bpy\.data\.objects\["([^"]+)"\]\.pose\.bones\["([^"]+)"\]\.([a-zA-Z_]+)(?:\[(\d+)\])?', 
-         'bone_long', "✓ BONE TRANSFORM (LONG FORMAT) DETECTED!"),
-        
-        # Custom properties pattern (must be before general object pattern)
-        (r'bpy\.data\.objects\["([^"]+)"\]\["([^"]+)"\]', 
-         'object_custom_prop_long', "✓ OBJECT CUSTOM PROPERTY (LONG FORMAT) DETECTED!"),
-        
-        (r'bpy\.data\.cameras\["([^"]+)"\]\.(.+)', 
-         'camera_long', "✓ CAMERA PROPERTY (LONG FORMAT) DETECTED!"),
-        
-        (r'bpy\.data\.lights\["([^"]+)"\]\.(.+)', 
-         'light_long', "✓ LIGHT PROPERTY (LONG FORMAT) DETECTED!"),
-        
-        (r'bpy\.data\.materials\["([^"]+)"\]\.(.+)', 
-         'material_long', "✓ GENERAL MATERIAL PROPERTY (LONG FORMAT) DETECTED!"),
-        
-        (r'bpy\.data\.armatures\["([^"]+)"\]\.(.+)', 
-         'armature_long', "✓ ARMATURE PROPERTY (LONG FORMAT) DETECTED!"),
-        
-        (r'bpy\.data\.objects\["([^"]+)"\]\.(.+)', 
-         'object_long', "✓ GENERAL OBJECT PROPERTY (LONG FORMAT) DETECTED!"),
-        
-        # Short format patterns (only if not starting with bpy.data.)
-        (r'(.+)\.data\.shape_keys\.key_blocks\["([^"]+)"\]\.value', 
-         'shapekey_short', "✓ SHAPEKEY (SHORT FORMAT) DETECTED!"),
-        
-        (r'(.+)\.pose\.bones\["([^"]+)"\]\.([a-zA-Z_]+)(?:\[(\d+)\])?', 
-         'bone_short', "✓ BONE TRANSFORM (SHORT FORMAT) DETECTED!"),
-        
-        (r'(.+)\.constraints\["([^"]+)"\]\.(.+)', 
-         'constraint_short', "✓ OBJECT CONSTRAINT (SHORT FORMAT) DETECTED!"),
-        
-        (r'(.+)\.node_tree\.nodes\["([^"]+)"\]\.(?:inputs|outputs)\[(\d+)\]\.default_value', 
-         'material_node_short', "✓ MATERIAL NODE (SHORT FORMAT) DETECTED!"),
-        
-        # Custom properties pattern (short format - must be before general pattern)
-        (r'(.+)\["([^"]+)"\]$', 
-         'custom_prop_short', "✓ CUSTOM PROPERTY (SHORT FORMAT) DETECTED!"),
-        
-        (r'(.+)\.(.+)', 
-         'general_short', "✓ GENERAL PROPERTY (SHORT FORMAT) DETECTED!"),
-    ]
-    
     def get_data_block(name, data_type):
         """Get data block by name and type with error checking."""
         collections = {
@@ -751,16 +942,11 @@ def parse_target_path(to_path):
         'general_short': handle_general_short,
     }
     
-    # Process patterns
-    for pattern, handler_name, debug_msg in patterns:
-        # Skip short format patterns if path starts with bpy.data.
-        if not handler_name.endswith('_long') and to_path.startswith('bpy.data.'):
-            continue
-            
-        match = re.match(pattern, to_path)
-        if match:
-            print(debug_msg)
-            return handlers[handler_name](match.groups())
+    matched = match_target_path(to_path)
+    if matched:
+        handler_name, groups, debug_msg = matched
+        print(debug_msg)
+        return handlers[handler_name](groups)
     
     # No pattern matched
     print(f"ERROR: Unsupported target path format: {to_path}")
@@ -774,57 +960,39 @@ def parse_target_path(to_path):
 
 def parse_source_path(from_path, armature_name):
     """Parse the source path and return configuration dict."""
+    parsed = match_source_path(from_path)
+    if not parsed:
+        print("ERROR: Invalid source path format")
+        return None
     
     # Bone transform source
-    bone_match = re.match(r'(.+)\.pose\.bones\["([^"]+)"\]\.([a-zA-Z_]+)\[(\d+)\]', from_path)
-    if bone_match:
+    if parsed['type'] == 'bone':
         print("✓ BONE SOURCE DETECTED!")
-        armature_path, bone_name, prop_name, index = bone_match.groups()
-        index = int(index)
-        
         if armature_name not in bpy.data.objects:
             print(f"ERROR: Source armature '{armature_name}' not found!")
             return None
         
-        armature_obj = bpy.data.objects[armature_name]
-        
         return {
             'type': 'bone',
-            'armature': armature_obj,
-            'bone_name': bone_name,
-            'property': prop_name,
-            'index': index
+            'armature': bpy.data.objects[armature_name],
+            'bone_name': parsed['bone_name'],
+            'property': parsed['property'],
+            'index': parsed['index']
         }
     
     # Object property source
-    obj_match = re.match(r'(.+)\.([a-zA-Z_]+)\[(\d+)\]', from_path)
-    if obj_match:
-        print("✓ OBJECT SOURCE DETECTED!")
-        obj_name, prop_name, index = obj_match.groups()
-        index = int(index)
-        
-        if obj_name not in bpy.data.objects:
-            print(f"ERROR: Source object '{obj_name}' not found!")
-            return None
-        
-        obj = bpy.data.objects[obj_name]
-        
-        return {
-            'type': 'object',
-            'object': obj,
-            'property': prop_name,
-            'index': index
-        }
+    print("✓ OBJECT SOURCE DETECTED!")
+    obj_name = parsed['object_name']
+    if obj_name not in bpy.data.objects:
+        print(f"ERROR: Source object '{obj_name}' not found!")
+        return None
     
-    print("ERROR: Invalid source path format")
-    return None
-
-def extract_array_index(data_path):
-    """Extract array index from data path if present."""
-    array_match = re.match(r'(.+)\[(\d+)\]$', data_path)
-    if array_match:
-        return array_match.group(1), int(array_match.group(2))
-    return data_path, -1
+    return {
+        'type': 'object',
+        'object': bpy.data.objects[obj_name],
+        'property': parsed['property'],
+        'index': parsed['index']
+    }
 
 def get_to_bones_data(props):
     """Get TO bones data from JSON string."""
@@ -861,20 +1029,109 @@ def set_path_list_data(props, data):
 
 
 
+EULER_ROTATION_MODES = ('XYZ', 'XZY', 'YXZ', 'YZX', 'ZXY', 'ZYX')
+
+def read_euler_rotation(owner):
+    """Read the rotation of a pose bone or object as Euler values without writing rotation_mode.
+
+    - Euler modes (any order): the channel values are returned as-is, matching what
+      a TRANSFORMS driver variable reads with rotation_mode 'AUTO'
+    - QUATERNION: converted mathematically to XYZ Euler
+    - AXIS_ANGLE: converted mathematically to XYZ Euler
+    """
+    mode = owner.rotation_mode
+    
+    if mode == 'QUATERNION':
+        return owner.rotation_quaternion.to_euler('XYZ')
+    
+    if mode == 'AXIS_ANGLE':
+        return axis_angle_to_euler(owner.rotation_axis_angle)
+    
+    return owner.rotation_euler.copy()
+
+def axis_angle_to_euler(axis_angle):
+    """Convert an (angle, x, y, z) axis-angle rotation to an XYZ Euler."""
+    import mathutils
+    
+    angle, x, y, z = axis_angle
+    axis = mathutils.Vector((x, y, z))
+    if axis.length < 1e-8:
+        return mathutils.Euler((0.0, 0.0, 0.0), 'XYZ')
+    return mathutils.Quaternion(axis.normalized(), angle).to_euler('XYZ')
+
+def quaternions_to_eulers(w, x, y, z):
+    """Convert arrays of quaternion components to XYZ Euler arrays in one pass.
+
+    Follows mathutils' Quaternion.normalized().to_euler('XYZ'): the quaternion becomes a
+    rotation matrix, and of the two Euler solutions the one with the smaller total angle is kept.
+    """
+    import numpy as np
+    
+    quaternions = np.stack([np.asarray(c, dtype=float) for c in (w, x, y, z)])
+    length = np.sqrt((quaternions ** 2).sum(axis=0))
+    # Blender normalizes a zero quaternion to (0, 1, 0, 0)
+    zero = length == 0.0
+    quaternions[:, zero] = np.array([[0.0], [1.0], [0.0], [0.0]])
+    length[zero] = 1.0
+    q0, q1, q2, q3 = quaternions / length * math.sqrt(2.0)
+    
+    # Matrix entries m[column][row] as in quat_to_mat3
+    m00 = 1.0 - q2 * q2 - q3 * q3
+    m01 = q0 * q3 + q1 * q2
+    m02 = -q0 * q2 + q1 * q3
+    m11 = 1.0 - q1 * q1 - q3 * q3
+    m12 = q0 * q1 + q2 * q3
+    m21 = -q0 * q1 + q2 * q3
+    m22 = 1.0 - q1 * q1 - q2 * q2
+    
+    cy = np.hypot(m00, m01)
+    gimbal = cy <= 16 * np.finfo(np.float32).eps
+    first = np.stack([
+        np.where(gimbal, np.arctan2(-m21, m11), np.arctan2(m12, m22)),
+        np.arctan2(-m02, cy),
+        np.where(gimbal, 0.0, np.arctan2(m01, m00)),
+    ])
+    second = np.stack([
+        np.arctan2(-m12, -m22),
+        np.arctan2(-m02, -cy),
+        np.arctan2(-m01, -m00),
+    ])
+    second[:, gimbal] = first[:, gimbal]
+    use_second = np.abs(first).sum(axis=0) > np.abs(second).sum(axis=0)
+    return np.where(use_second, second, first)
+
+def axis_angles_to_eulers(angle, x, y, z):
+    """Vectorized axis_angle_to_euler over arrays of (angle, x, y, z) components."""
+    import numpy as np
+    
+    angle = np.asarray(angle, dtype=float)
+    axis = np.stack([np.asarray(c, dtype=float) for c in (x, y, z)])
+    length = np.sqrt((axis ** 2).sum(axis=0))
+    degenerate = length < 1e-8
+    axis = axis / np.where(degenerate, 1.0, length)
+    half_sin = np.sin(angle / 2.0)
+    eulers = quaternions_to_eulers(np.cos(angle / 2.0), *(axis * half_sin))
+    eulers[:, degenerate] = 0.0
+    return eulers
+
 def ensure_euler_rotation(bone, override=False):
     """Return current rotation as Euler with optional permanent mode change.
 
-    - If override=False: Return Euler values without permanently changing rotation_mode
-      * Quaternion bones: temporarily convert to read Euler, then restore quaternion
-      * Euler bones: keep as Euler and return values
+    - If override=False: Return Euler values without touching rotation_mode
+      * Quaternion/axis-angle bones are converted mathematically (see read_euler_rotation)
+      * Euler bones: return a copy of the channel values
     
-    - If override=True: Force bone to XYZ Euler mode permanently
+    - If override=True: Force bone to Euler mode permanently
       * Clears keyframes/drivers on rotation_mode
-      * Converts any rotation mode to XYZ Euler
+      * Converts quaternion/axis-angle rotation to XYZ Euler
       * Returns the Euler values
     """
     
-    # Always clear keyframes/drivers on rotation_mode to prevent animation interference
+    if not override:
+        # NON-OVERRIDE MODE: pure read, no RNA writes and no depsgraph tagging
+        return read_euler_rotation(bone)
+    
+    # Clear keyframes/drivers on rotation_mode so they can't switch the mode back
     try:
         obj = bone.id_data  # Armature Object that owns this pose bone
         data_path = bone.path_from_id('rotation_mode')  # e.g., pose.bones["Bone"].rotation_mode
@@ -905,51 +1162,26 @@ def ensure_euler_rotation(bone, override=False):
     except Exception as e:
         print(f"WARNING: Failed to clear keyframes/drivers on {bone.name}.rotation_mode: {e}")
 
-    # Handle based on override flag
-    if override:
-        # OVERRIDE MODE: Permanently change to XYZ Euler
-        original_mode = bone.rotation_mode
-        
-        if original_mode == 'QUATERNION':
-            # Convert quaternion to euler and switch permanently
-            current_euler = bone.rotation_quaternion.to_euler()
-            bone.rotation_mode = 'XYZ'
-            bone.rotation_euler = current_euler
-            print(f"INFO: Converted {bone.name} from Quaternion to XYZ Euler rotation mode")
-            return current_euler
-        else:
-            # Already XYZ Euler
-            print(f"INFO: {bone.name} already in XYZ Euler mode")
-            return bone.rotation_euler.copy()
+    # OVERRIDE MODE: Permanently change to Euler
+    if bone.rotation_mode in EULER_ROTATION_MODES:
+        print(f"INFO: {bone.name} already in {bone.rotation_mode} Euler mode")
+        return bone.rotation_euler.copy()
     
-    else:
-        # NON-OVERRIDE MODE: Preserve original mode
-        original_mode = bone.rotation_mode
-        
-        if original_mode == 'QUATERNION':
-            # Read quaternion as Euler without permanently switching
-            current_euler = bone.rotation_quaternion.to_euler()
-            # Temporarily set to Euler to ensure consistent reading of euler channels
-            bone.rotation_mode = 'XYZ'
-            bone.rotation_euler = current_euler
-            # Immediately restore original mode and value
-            bone.rotation_mode = 'QUATERNION'
-            bone.rotation_quaternion = bone.rotation_quaternion  # no-op to keep value
-            print(f"INFO: Temporarily read {bone.name} quaternion as Euler (mode preserved)")
-            return current_euler
-        else:
-            # Already Euler: just return a copy
-            print(f"INFO: Reading {bone.name} Euler values (mode preserved)")
-            return bone.rotation_euler.copy()
+    original_mode = bone.rotation_mode
+    current_euler = read_euler_rotation(bone)
+    bone.rotation_mode = 'XYZ'
+    bone.rotation_euler = current_euler
+    print(f"INFO: Converted {bone.name} from {original_mode} to XYZ Euler rotation mode")
+    return current_euler
 
 
 def ensure_object_euler_rotation(obj):
     """Ensure an object is using Euler rotation mode and return the current euler values."""
-    if obj.rotation_mode == 'QUATERNION':
-        current_euler = obj.rotation_quaternion.to_euler()
+    if obj.rotation_mode not in EULER_ROTATION_MODES:
+        current_euler = read_euler_rotation(obj)
         obj.rotation_mode = 'XYZ'
         obj.rotation_euler = current_euler
-        print(f"INFO: Converted {obj.name} from Quaternion to Euler rotation mode")
+        print(f"INFO: Converted {obj.name} to Euler rotation mode")
         return current_euler
     else:
         return obj.rotation_euler.copy()
@@ -963,30 +1195,6 @@ def get_selected_pose_bones(context):
     selected_bones = [bone for bone in obj.pose.bones if bone.bone.select]
     return obj, selected_bones
 
-def detect_significant_changes(min_vals, max_vals, threshold_loc=0.001, threshold_rot=0.06, threshold_scale=0.01):
-    """Detect which axes have significant changes between min and max values."""
-    changes = []
-    
-    # Check location changes
-    for i in range(3):
-        diff = abs(max_vals['location'][i] - min_vals['location'][i])
-        if diff > threshold_loc:
-            changes.append(('location', i, min_vals['location'][i], max_vals['location'][i]))
-    
-    # Check rotation changes
-    for i in range(3):
-        diff = abs(max_vals['rotation'][i] - min_vals['rotation'][i])
-        if diff > threshold_rot:
-            changes.append(('rotation_euler', i, min_vals['rotation'][i], max_vals['rotation'][i]))
-    
-    # Check scale changes
-    for i in range(3):
-        diff = abs(max_vals['scale'][i] - min_vals['scale'][i])
-        if diff > threshold_scale:
-            changes.append(('scale', i, min_vals['scale'][i], max_vals['scale'][i]))
-    
-    return changes
-
 def update_shapekey_value(self, context, is_min):
     """Update shape key value when min/max sliders change."""
     if self.shapekey_target_object and self.shapekey_name:
@@ -1047,153 +1255,144 @@ def validate_custom_path(path, context=None):
 
 
 
-# Add these functions to core_functions.py
-
-import bpy
+#---------------------------------------
+# Mirroring
+#---------------------------------------
 
-def get_mirrored_name(name):
-    """Get the mirrored/opposite name for bones and shape keys following standard naming conventions."""
-    if not name:
-        return None
+# {(armature data pointer, revision, bone count, tolerance): symmetry map}
+_bone_symmetry_cache = {}
+# {armature data pointer: revision}, bumped whenever the armature data changes
+_bone_symmetry_revisions = {}
+
+def invalidate_bone_symmetry(armature_data):
+    """Bump an armature data block's revision so its cached symmetry maps are rebuilt."""
+    key = armature_data.as_pointer()
+    _bone_symmetry_revisions[key] = _bone_symmetry_revisions.get(key, 0) + 1
+
+@bpy.app.handlers.persistent
+def bone_symmetry_depsgraph_update(scene, depsgraph):
+    """Invalidate symmetry maps of armatures whose bones were renamed, added, removed or moved."""
+    for update in depsgraph.updates:
+        if isinstance(update.id, bpy.types.Armature):
+            invalidate_bone_symmetry(update.id.original)
+
+def get_bone_symmetry_map(armature, tolerance=0.001):
+    """Return the cached symmetry map of an armature object, rebuilding it when bones change.
+
+    The map holds 'mirror' ({bone: opposite bone} for every pair that exists) and
+    'missing' ({bone: expected opposite name} for sided bones whose partner is absent).
+    Bones that name matching cannot pair are matched geometrically (see
+    find_geometric_bone_pairs). The cache key is the armature data plus a revision that
+    bone_symmetry_depsgraph_update bumps on any change to it, so a hit costs O(1).
+    """
+    pointer = armature.data.as_pointer()
+    key = (pointer, _bone_symmetry_revisions.get(pointer, 0), len(armature.data.bones), tolerance)
+    
+    cached = _bone_symmetry_cache.get(key)
+    if cached:
+        return cached
+    
+    names = tuple(bone.name for bone in armature.pose.bones)
+    existing = set(names)
+    mirror = {}
+    missing = {}
+    for name, mirrored in get_mirrored_names(names).items():
+        if not mirrored:
+            continue
+        if mirrored in existing:
+            mirror[name] = mirrored
+        else:
+            missing[name] = mirrored
+    
+    # Fall back to rest positions for bones the names could not pair
+    unpaired = [name for name in names if name not in mirror]
+    geometric = find_geometric_bone_pairs(armature, unpaired, tolerance)
+    mirror.update(geometric)
+    for name in geometric:
+        missing.pop(name, None)
+    
+    symmetry = {'mirror': mirror, 'missing': missing}
+    # Only the current revision of each armature is kept
+    for stale in [cached_key for cached_key in _bone_symmetry_cache if cached_key[0] == pointer]:
+        del _bone_symmetry_cache[stale]
+    _bone_symmetry_cache[key] = symmetry
+    return symmetry
+
+def find_geometric_bone_pairs(armature, bone_names, tolerance=0.001):
+    """Pair bones whose rest head and tail match another bone's mirrored across armature X.
+
+    A KD-tree over the rest heads gives each bone the X-mirrored heads within tolerance
+    in O(n log n); of those, the one with the closest tail wins. A pair is only kept if
+    the tails match within tolerance and the two bones pick each other. Bones on the centre line are never paired with themselves.
+    Returns {bone: opposite bone} for both directions.
+    """
+    import mathutils
+    import mathutils.kdtree
+    import numpy as np
     
-    # Define left/right patterns - order matters (more specific first)
-    left_patterns = [
-        # Underscores
-        ('_Left', '_Right'), ('_left', '_right'), ('_L', '_R'), ('_l', '_r'),
-        # Dots  
-        ('.Left', '.Right'), ('.left', '.right'), ('.L', '.R'), ('.l', '.r'),
-        # Dashes
-        ('-Left', '-Right'), ('-left', '-right'), ('-L', '-R'), ('-l', '-r'),
-        # Prefixes with underscores
-        ('Left_', 'Right_'), ('left_', 'right_'), ('L_', 'R_'), ('l_', 'r_'),
-        # Prefixes with dots
-        ('Left.', 'Right.'), ('left.', 'right.'), ('L.', 'R.'), ('l.', 'r.'),
-        # Prefixes with dashes
-        ('Left-', 'Right-'), ('left-', 'right-'), ('L-', 'R-'), ('l-', 'r-'),
-        # Plain words
-        ('left', 'right'), ('Left', 'Right'),
-        
-        # Common 3D software patterns
-        ('_lf', '_rt'), ('_LF', '_RT'), ('.lf', '.rt'), ('.LF', '.RT'),
-        ('lf_', 'rt_'), ('LF_', 'RT_'), ('lf.', 'rt.'), ('LF.', 'RT.'),
-        ('lf-', 'rt-'), ('LF-', 'RT-'), ('-lf', '-rt'), ('-LF', '-RT'),
-        
-        # Blender/Maya common patterns
-        ('_side_L', '_side_R'), ('_side_l', '_side_r'), ('.side.L', '.side.R'), ('.side.l', '.side.r'),
-        ('side_L_', 'side_R_'), ('side_l_', 'side_r_'), ('side.L.', 'side.R.'), ('side.l.', 'side.r.'),
-        ('side-L-', 'side-R-'), ('side-l-', 'side-r-'), ('-side_L', '-side_R'), ('-side_l', '-side_r'),
-
-        # Blender-specific patterns
-        ('_L_', '_R_'), ('_l_', '_r_'), ('.L_', '.R_'), ('.l_', '.r_'),
-        ('L_.', 'R_.'), ('l_.', 'r_.'),
-        ('L_-', 'R_-'), ('l_-', 'r_-'),
-        
-       # Anatomical/Medical
-        ('_sin', '_dex'), ('_SIN', '_DEX'), ('sin_', 'dex_'), ('SIN_', 'DEX_'),
-        ('.sin', '.dex'), ('.SIN', '.DEX'), ('sin.', 'dex.'), ('SIN.', 'DEX.'),
-        
-        # Game engine patterns
-        ('_lt', '_rt'), ('_LT', '_RT'), ('lt_', 'rt_'), ('LT_', 'RT_'),
-        ('.lt', '.rt'), ('.LT', '.RT'), ('lt.', 'rt.'), ('LT.', 'RT.'),
-        ('lt-', 'rt-'), ('LT-', 'RT-'), ('-lt', '-rt'), ('-LT', '-RT'),
-
-        # Directional patterns
-        ('_west', '_east'), ('_West', '_East'), ('_WEST', '_EAST'),
-        ('west_', 'east_'), ('West_', 'East_'), ('WEST_', 'EAST_'),
-        ('.west', '.east'), ('.West', '.East'), ('.WEST', '.EAST'),
-        ('west.', 'east.'), ('West.', 'East.'), ('WEST.', 'EAST.'),
-
-        # Port/Starboard (nautical)  ARGGGHH~
-        ('_port', '_starboard'), ('_Port', '_Starboard'), ('_PORT', '_STARBOARD'),
-        ('port_', 'starboard_'), ('Port_', 'Starboard_'), ('PORT_', 'STARBOARD_'),
-        
-        # A/B patterns
-        ('_A', '_B'), ('_a', '_b'), ('A_', 'B_'), ('a_', 'b_'),
-        ('.A', '.B'), ('.a', '.b'), ('A.', 'B.'), ('a.', 'b.'),
-        ('A-', 'B-'), ('a-', 'b-'), ('-A', '-B'), ('-a', '-b'),
-        
-        # X/Y patterns (sometimes used for left/right... probrably shouldn't be, but whatever)
-        ('_X', '_Y'), ('_x', '_y'), ('X_', 'Y_'), ('x_', 'y_'),
-        ('.X', '.Y'), ('.x', '.y'), ('X.', 'Y.'), ('x.', 'y.'),
-        
-        # Parentheses patterns
-        ('(L)', '(R)'), ('(l)', '(r)'), ('(Left)', '(Right)'), ('(left)', '(right)'),
-        
-        # Bracket patterns
-        ('[L]', '[R]'), ('[l]', '[r]'), ('[Left]', '[Right]'), ('[left]', '[right]'),
-        ('[1]', '[2]'), ('[A]', '[B]'), ('[a]', '[b]'),
-        
-        # Colon patterns
-        (':L', ':R'), (':l', ':r'), (':Left', ':Right'), (':left', ':right'),
-        ('L:', 'R:'), ('l:', 'r:'), ('Left:', 'Right:'), ('left:', 'right:'),
-        
-        # Space patterns (less common but possible)
-        (' L', ' R'), (' l', ' r'), (' Left', ' Right'), (' left', ' right'),
-        ('L ', 'R '), ('l ', 'r '), ('Left ', 'Right '), ('left ', 'right '),
-
-        
-        ('*l', '*r'), ('*L', '*R'),  # Asterisk patterns
-        
-        # Mixed case patterns
-        ('_lEFT', '_rIGHT'), ('_LeFt', '_RiGhT'), ('lEFT_', 'rIGHT_'), ('LeFt_', 'RiGhT_'),
-        
-        # Double separator patterns
-        ('__L', '__R'), ('__l', '__r'), ('..L', '..R'), ('..l', '..r'),
-        ('--L', '--R'), ('--l', '--r'), ('L__', 'R__'), ('l__', 'r__'),
-        
-        # Pipe separator patterns
-        ('|L', '|R'), ('|l', '|r'), ('L|', 'R|'), ('l|', 'r|'),
-        ('|Left', '|Right'), ('|left', '|right'), ('Left|', 'Right|'), ('left|', 'right|'),
-        
-        # Hash patterns
-        ('#L', '#R'), ('#l', '#r'), ('L#', 'R#'), ('l#', 'r#'),
-        
-        # At symbol patterns
-        ('@L', '@R'), ('@l', '@r'), ('L@', 'R@'), ('l@', 'r@'),
-
-        ('L', 'R'),  # Very general patterns at the end
-    ]
-
-    
-    # Check for ending patterns first (more specific)
-    for left_pattern, right_pattern in left_patterns:
-        if name.endswith(left_pattern):
-            return name[:-len(left_pattern)] + right_pattern
-        elif name.endswith(right_pattern):
-            return name[:-len(right_pattern)] + left_pattern
-    
-    # Check for starting patterns
-    for left_pattern, right_pattern in left_patterns:
-        if name.startswith(left_pattern):
-            return right_pattern + name[len(left_pattern):]
-        elif name.startswith(right_pattern):
-            return left_pattern + name[len(right_pattern):]
+    data_bones = armature.data.bones
+    count = len(data_bones)
+    if count == 0 or not bone_names:
+        return {}
     
-    # No mirror pattern found
-    return None
+    heads = np.empty(count * 3, dtype=np.float32)
+    tails = np.empty(count * 3, dtype=np.float32)
+    data_bones.foreach_get('head_local', heads)
+    data_bones.foreach_get('tail_local', tails)
+    heads = heads.reshape(count, 3)
+    tails = tails.reshape(count, 3)
+    
+    index = {bone.name: i for i, bone in enumerate(data_bones)}
+    rows = [index[name] for name in bone_names if name in index]
+    
+    tree = mathutils.kdtree.KDTree(len(rows))
+    for row in rows:
+        tree.insert(heads[row], row)
+    tree.balance()
+    
+    flip = np.array((-1.0, 1.0, 1.0), dtype=np.float32)
+    nearest = {}
+    for row in rows:
+        # Centre-line bones mirror onto themselves
+        if abs(heads[row][0]) <= tolerance and abs(tails[row][0]) <= tolerance:
+            continue
+        # Stacked bones (DEF/ORG/MCH, face bones fanning out of one pivot) share a head,
+        # so take every head in range and let the tails decide
+        best, best_distance = None, tolerance
+        for co, other, distance in tree.find_range(heads[row] * flip, tolerance):
+            if other == row:
+                continue
+            tail_distance = np.linalg.norm(tails[row] * flip - tails[other])
+            if tail_distance <= best_distance:
+                best, best_distance = other, tail_distance
+        if best is not None:
+            nearest[row] = best
+    
+    pairs = {}
+    for row, other in nearest.items():
+        if nearest.get(other) == row:
+            pairs[data_bones[row].name] = data_bones[other].name
+    return pairs
 
 def mirror_source(props):
     """Mirror the source configuration to opposite side."""
     if props.from_bone:
         # Mirror bone source
-        mirrored_bone = get_mirrored_name(props.from_bone)
+        armature = bpy.data.objects.get(props.from_armature)
+        if not armature or armature.type != 'ARMATURE':
+            return False, "Armature not found"
+        
+        symmetry = get_bone_symmetry_map(armature, props.mirror_tolerance)
+        mirrored_bone = symmetry['mirror'].get(props.from_bone)
         print(f"DEBUG: Mirroring source bone '{props.from_bone}' → '{mirrored_bone}'")
         
         if mirrored_bone:
-            # Check if mirrored bone exists in the armature
-            armature = bpy.data.objects.get(props.from_armature)
-            if armature and armature.type == 'ARMATURE':
-                if mirrored_bone in armature.pose.bones:
-                    # Update to mirrored bone, keep all recorded values
-                    props.from_bone = mirrored_bone
-                    print(f"DEBUG: ✓ Source mirrored successfully")
-                    return True, f"Mirrored to bone: {mirrored_bone}"
-                else:
-                    available_bones = [b.name for b in armature.pose.bones if mirrored_bone.lower() in b.name.lower()]
-                    print(f"DEBUG: ✗ Mirror bone '{mirrored_bone}' not found. Similar: {available_bones[:3]}")
-                    return False, f"Mirror bone '{mirrored_bone}' not found"
-            else:
-                return False, "Armature not found"
+            # Update to mirrored bone, keep all recorded values
+            props.from_bone = mirrored_bone
+            print(f"DEBUG: ✓ Source mirrored successfully")
+            return True, f"Mirrored to bone: {mirrored_bone}"
+        elif props.from_bone in symmetry['missing']:
+            return False, f"Mirror bone '{symmetry['missing'][props.from_bone]}' not found"
         else:
             return False, f"No mirror pattern found for: {props.from_bone}"
     
@@ -1226,40 +1425,29 @@ def mirror_pose_targets(props):
     skipped_bones = []
     
     print(f"DEBUG: Starting pose target mirror with {len(to_data)} bones")
+    symmetry_maps = {}
     
     for bone_name, bone_data in to_data.items():
-        mirrored_bone = get_mirrored_name(bone_name)
-        print(f"DEBUG: Processing '{bone_name}' → '{mirrored_bone}'")
+        armature_name = bone_data.get('armature')
+        if armature_name not in symmetry_maps:
+            armature = bpy.data.objects.get(armature_name) if armature_name else None
+            valid = armature and armature.type == 'ARMATURE'
+            symmetry_maps[armature_name] = get_bone_symmetry_map(armature, props.mirror_tolerance) if valid else None
+        
+        symmetry = symmetry_maps[armature_name]
+        mirrored_bone = symmetry['mirror'].get(bone_name) if symmetry else None
         
         if mirrored_bone:
-            # Check if mirrored bone exists in the armature
-            armature_name = bone_data.get('armature')
-            armature = bpy.data.objects.get(armature_name) if armature_name else None
-            
-            if armature and armature.type == 'ARMATURE':
-                if mirrored_bone in armature.pose.bones:
-                    # Create mirrored bone data with same values
-                    mirrored_data[mirrored_bone] = bone_data.copy()
-                    mirrored_count += 1
-                    print(f"DEBUG: ✓ Mirrored {bone_name} → {mirrored_bone}")
-                else:
-                    # Keep original if mirror doesn't exist
-                    mirrored_data[bone_name] = bone_data
-                    skipped_bones.append(bone_name)
-                    # Show similar bone names for debugging
-                    similar_bones = [b.name for b in armature.pose.bones 
-                                   if any(part in b.name.lower() for part in mirrored_bone.lower().split('_'))][:3]
-                    print(f"DEBUG: ✗ Mirror bone '{mirrored_bone}' not found. Similar: {similar_bones}")
-            else:
-                # Keep original if armature not found
-                mirrored_data[bone_name] = bone_data
-                skipped_bones.append(bone_name)
-                print(f"DEBUG: ✗ Armature '{armature_name}' not found or invalid")
+            # Create mirrored bone data with same values
+            mirrored_data[mirrored_bone] = bone_data.copy()
+            mirrored_count += 1
         else:
-            # Keep original if no mirror pattern
+            # Keep original if armature, pattern or mirror bone is missing
             mirrored_data[bone_name] = bone_data
             skipped_bones.append(bone_name)
-            print(f"DEBUG: ✗ No mirror pattern found for: {bone_name}")
+    
+    if skipped_bones:
+        print(f"DEBUG: ✗ No mirror bone for: {', '.join(skipped_bones)}")
     
     # Update the data
     set_to_bones_data(props, mirrored_data)
@@ -1283,45 +1471,32 @@ def mirror_shapekey_targets(props):
     mirrored_data = {}
     mirrored_count = 0
     skipped_keys = []
+    mirror_maps = {}
     
-    print(f"DEBUG: Starting shapekey mirror with {len(shapekey_data)} shape keys")
+    print(f"DEBUG: Starting shapekey mirror with {len(shapekey_data)} shape keys ({props.shapekey_mirror_mode})")
     
     for key, sk_data in shapekey_data.items():
         obj_name = sk_data['object']
         shapekey_name = sk_data['shapekey']
         
-        # Try to mirror the shape key name
-        mirrored_shapekey = get_mirrored_name(shapekey_name)
-        print(f"DEBUG: Processing '{shapekey_name}' → '{mirrored_shapekey}'")
+        if obj_name not in mirror_maps:
+            obj = bpy.data.objects.get(obj_name)
+            mirror_maps[obj_name] = get_shapekey_mirror_map(obj, props.shapekey_mirror_mode, props.mirror_tolerance) if obj else {}
+        
+        mirrored_shapekey = mirror_maps[obj_name].get(shapekey_name)
         
         if mirrored_shapekey:
-            # Check if mirrored shape key exists
-            obj = bpy.data.objects.get(obj_name)
-            if (obj and obj.data and hasattr(obj.data, 'shape_keys') and 
-                obj.data.shape_keys and mirrored_shapekey in obj.data.shape_keys.key_blocks):
-                
-                # Create new key for mirrored shape key
-                new_key = f"{obj_name}:{mirrored_shapekey}"
-                mirrored_data[new_key] = sk_data.copy()
-                mirrored_data[new_key]['shapekey'] = mirrored_shapekey
-                mirrored_count += 1
-                print(f"DEBUG: ✓ Mirrored {shapekey_name} → {mirrored_shapekey}")
-            else:
-                # Keep original if mirror doesn't exist
-                mirrored_data[key] = sk_data
-                skipped_keys.append(shapekey_name)
-                # Show available shape keys for debugging
-                if obj and obj.data and hasattr(obj.data, 'shape_keys') and obj.data.shape_keys:
-                    available_keys = [k.name for k in obj.data.shape_keys.key_blocks 
-                                    if mirrored_shapekey.lower() in k.name.lower()][:3]
-                    print(f"DEBUG: ✗ Mirror shape key '{mirrored_shapekey}' not found. Similar: {available_keys}")
-                else:
-                    print(f"DEBUG: ✗ Object '{obj_name}' has no shape keys")
+            # Create new key for mirrored shape key
+            new_key = f"{obj_name}:{mirrored_shapekey}"
+            mirrored_data[new_key] = sk_data.copy()
+            mirrored_data[new_key]['shapekey'] = mirrored_shapekey
+            mirrored_count += 1
+            print(f"DEBUG: ✓ Mirrored {shapekey_name} → {mirrored_shapekey}")
         else:
-            # Keep original if no mirror pattern
+            # Keep original if no mirror exists
             mirrored_data[key] = sk_data
             skipped_keys.append(shapekey_name)
-            print(f"DEBUG: ✗ No mirror pattern found for: {shapekey_name}")
+            print(f"DEBUG: ✗ No mirror shape key found for: {shapekey_name}")
     
     # Update the data
     set_shapekey_list_data(props, mirrored_data)
@@ -1337,3 +1512,2178 @@ def mirror_shapekey_targets(props):
             message += f": {', '.join(skipped_keys[:3])} and {len(skipped_keys) - 3} more"
     
     return mirrored_count > 0, message
+
+
+#---------------------------------------
+# Animation Sampling
+#---------------------------------------
+# Flat channel layout used by the samplers: location XYZ, Euler rotation XYZ, scale XYZ
+TRANSFORM_CHANNELS = (
+    ('location', 0), ('location', 1), ('location', 2),
+    ('rotation_euler', 0), ('rotation_euler', 1), ('rotation_euler', 2),
+    ('scale', 0), ('scale', 1), ('scale', 2),
+)
+
+def read_transform_channels(owner):
+    """Read location, Euler rotation and scale of a pose bone or object as 9 floats."""
+    euler = read_euler_rotation(owner)
+    return list(owner.location) + [euler[0], euler[1], euler[2]] + list(owner.scale)
+
+def get_transform_fcurves(owner):
+    """Return {(property, index): fcurve} for the transform channels of owner keyed in its active action."""
+    animation_data = owner.id_data.animation_data
+    if not animation_data or not animation_data.action:
+        return {}
+    
+    wanted = {}
+    for prop in ('location', 'rotation_euler', 'rotation_quaternion', 'rotation_axis_angle', 'scale'):
+        wanted[owner.path_from_id(prop)] = prop
+    
+    fcurves = {}
+    for fcurve in animation_data.action.fcurves:
+        prop = wanted.get(fcurve.data_path)
+        if prop and not fcurve.mute:
+            fcurves[(prop, fcurve.array_index)] = fcurve
+    return fcurves
+
+def has_active_constraints(owner):
+    """Check if a pose bone or object has any enabled constraint with influence."""
+    return any(not constraint.mute and constraint.influence > 0.0 for constraint in owner.constraints)
+
+def can_sample_from_fcurves(owner):
+    """Check if the value a driver reads from owner is just its active action's F-curves.
+
+    Bone drivers read LOCAL_SPACE transforms, which include constraints, so any active
+    constraint needs a depsgraph evaluation. NLA blending and drivers on the channels
+    change the channels themselves. Parents only matter for world-space reads, which
+    recording never does.
+    """
+    animation_data = owner.id_data.animation_data
+    if not animation_data or not animation_data.action:
+        return False
+    
+    if isinstance(owner, bpy.types.PoseBone) and has_active_constraints(owner):
+        return False
+    
+    if animation_data.action_blend_type != 'REPLACE' or animation_data.action_influence < 1.0:
+        return False
+    
+    for track in animation_data.nla_tracks:
+        if not track.mute and len(track.strips) > 0:
+            return False
+    
+    channel_paths = {owner.path_from_id(prop) for prop in
+                     ('location', 'rotation_euler', 'rotation_quaternion', 'rotation_axis_angle', 'scale', 'rotation_mode')}
+    for fcurve in animation_data.drivers:
+        if fcurve.data_path in channel_paths:
+            return False
+    
+    return True
+
+# Keyframe.interpolation enum values, as read and written by foreach_get/foreach_set
+KEYFRAME_INTERPOLATION_CONSTANT = 0
+KEYFRAME_INTERPOLATION_LINEAR = 1
+
+def sample_fcurve_values(fcurve, frames):
+    """Evaluate an F-curve at many frames at once and return a NumPy array.
+
+    Frames that land exactly on a keyframe use its value, LINEAR and CONSTANT segments
+    and constant extrapolation are computed with NumPy, and only what is left (Bezier
+    segments between keys, linear extrapolation, F-modifiers) goes through fcurve.evaluate.
+    Baked mocap has a key on every frame, so it never reaches the slow path.
+    """
+    import numpy as np
+    
+    frames = np.asarray(frames, dtype=float)
+    keys = fcurve.keyframe_points
+    count = len(keys)
+    
+    if count < 2 or len(fcurve.modifiers) > 0:
+        return np.array([fcurve.evaluate(frame) for frame in frames], dtype=float)
+    
+    co = np.empty(count * 2, dtype=np.float32)
+    keys.foreach_get('co', co)
+    co = co.reshape(count, 2).astype(float)
+    key_x, key_y = co[:, 0], co[:, 1]
+    
+    interpolation = np.empty(count, dtype=np.int32)
+    keys.foreach_get('interpolation', interpolation)
+    segment_linear = interpolation[:-1] == KEYFRAME_INTERPOLATION_LINEAR
+    segment_constant = interpolation[:-1] == KEYFRAME_INTERPOLATION_CONSTANT
+    
+    values = np.zeros(len(frames))
+    resolved = np.zeros(len(frames), dtype=bool)
+    
+    # Outside the keyed range
+    if fcurve.extrapolation == 'CONSTANT':
+        before = frames <= key_x[0]
+        after = frames >= key_x[-1]
+        values[before] = key_y[0]
+        values[after] = key_y[-1]
+        resolved |= before | after
+    
+    # Segment i spans key_x[i] <= frame < key_x[i + 1]
+    segment = np.searchsorted(key_x, frames, side='right') - 1
+    inside = ~resolved & (segment >= 0) & (segment < count - 1)
+    index = np.clip(segment, 0, count - 2)
+    
+    on_key = inside & (frames == key_x[index])
+    values[on_key] = key_y[index[on_key]]
+    resolved |= on_key
+    
+    constant = inside & ~resolved & segment_constant[index]
+    values[constant] = key_y[index[constant]]
+    resolved |= constant
+    
+    linear = inside & ~resolved & segment_linear[index]
+    if linear.any():
+        x0, x1 = key_x[index[linear]], key_x[index[linear] + 1]
+        y0, y1 = key_y[index[linear]], key_y[index[linear] + 1]
+        values[linear] = y0 + (frames[linear] - x0) * (y1 - y0) / (x1 - x0)
+        resolved |= linear
+    
+    for i in np.flatnonzero(~resolved):
+        values[i] = fcurve.evaluate(frames[i])
+    
+    return values
+
+def make_fcurve_channel_sampler(owner):
+    """Build frames -> (n, 9) channel array evaluating only owner's own F-curves (no scene update)."""
+    import numpy as np
+    
+    fcurves = get_transform_fcurves(owner)
+    mode = owner.rotation_mode
+    
+    if mode == 'QUATERNION':
+        rotation_prop, rotation_static = 'rotation_quaternion', list(owner.rotation_quaternion)
+    elif mode == 'AXIS_ANGLE':
+        rotation_prop, rotation_static = 'rotation_axis_angle', list(owner.rotation_axis_angle)
+    else:
+        rotation_prop, rotation_static = 'rotation_euler', list(owner.rotation_euler)
+    
+    # Unkeyed channels keep their current value
+    channels = []
+    for prop, static in (('location', list(owner.location)), (rotation_prop, rotation_static), ('scale', list(owner.scale))):
+        channels.append([(fcurves.get((prop, i)), value) for i, value in enumerate(static)])
+    location_channels, rotation_channels, scale_channels = channels
+    
+    def evaluate(channel_list, frames):
+        return [sample_fcurve_values(fcurve, frames) if fcurve else np.full(len(frames), value)
+                for fcurve, value in channel_list]
+    
+    def sample(frames):
+        rotation = evaluate(rotation_channels, frames)
+        if mode == 'QUATERNION':
+            rotation = list(quaternions_to_eulers(*rotation))
+        elif mode == 'AXIS_ANGLE':
+            rotation = list(axis_angles_to_eulers(*rotation))
+        return np.column_stack(evaluate(location_channels, frames) + rotation + evaluate(scale_channels, frames))
+    
+    return sample
+
+def read_evaluated_local_channels(bone):
+    """Read a pose bone's post-constraint LOCAL_SPACE transform (what a bone driver sees) as 9 floats."""
+    armature = bone.id_data
+    local_matrix = armature.convert_space(pose_bone=bone, matrix=bone.matrix, from_space='POSE', to_space='LOCAL')
+    location, rotation, scale = local_matrix.decompose()
+    order = bone.rotation_mode if bone.rotation_mode in EULER_ROTATION_MODES else 'XYZ'
+    euler = rotation.to_euler(order)
+    return list(location) + [euler[0], euler[1], euler[2]] + list(scale)
+
+def read_evaluated_object_channels(obj):
+    """Read an object's post-constraint transform (what a TRANSFORM_SPACE object driver sees) as 9 floats."""
+    local_matrix = obj.convert_space(matrix=obj.matrix_world, from_space='WORLD', to_space='LOCAL')
+    location, rotation, scale = local_matrix.decompose()
+    order = obj.rotation_mode if obj.rotation_mode in EULER_ROTATION_MODES else 'XYZ'
+    euler = rotation.to_euler(order)
+    return list(location) + [euler[0], euler[1], euler[2]] + list(scale)
+
+def get_channel_reader(owner, reads_constrained=False):
+    """Pick the per-frame reader for a scene pass over owner.
+
+    Bone drivers always see constraints. Object drivers only do when they read through a
+    TRANSFORMS variable (reads_constrained); a SINGLE_PROP variable sees the raw property.
+    """
+    if has_active_constraints(owner):
+        if isinstance(owner, bpy.types.PoseBone):
+            return read_evaluated_local_channels
+        if reads_constrained:
+            return read_evaluated_object_channels
+    return read_transform_channels
+
+def make_scene_channel_sampler(scene, owner):
+    """Build frames -> list of 9 channels using a full scene evaluation per frame."""
+    read = get_channel_reader(owner)
+    
+    def sample(frames):
+        block = []
+        for frame in frames:
+            scene.frame_set(frame)
+            block.append(read(owner))
+        return block
+    
+    return sample
+
+def stream_transform_range(sample, frames, chunk_size=4096):
+    """Stream samples through a running min/max per channel without storing every frame.
+
+    sample(frames) returns one row of 9 channels per frame; frames are fed in chunks
+    so memory stays bounded on long takes. Returns a dict of per-channel lists:
+    'min'/'max' values, 'min_frame'/'max_frame' where they occur, and
+    'min_sample'/'max_sample' with all 9 channels at those frames.
+    """
+    import numpy as np
+    
+    tracker = None
+    
+    for start in range(0, len(frames), chunk_size):
+        chunk = frames[start:start + chunk_size]
+        values = np.asarray(sample(chunk), dtype=float)
+        min_rows = values.argmin(axis=0)
+        max_rows = values.argmax(axis=0)
+        
+        if tracker is None:
+            tracker = {key: [None] * values.shape[1] for key in
+                       ('min', 'max', 'min_frame', 'max_frame', 'min_sample', 'max_sample')}
+        
+        for channel in range(values.shape[1]):
+            row = min_rows[channel]
+            if tracker['min'][channel] is None or values[row, channel] < tracker['min'][channel]:
+                tracker['min'][channel] = float(values[row, channel])
+                tracker['min_frame'][channel] = chunk[row]
+                tracker['min_sample'][channel] = values[row].tolist()
+            
+            row = max_rows[channel]
+            if tracker['max'][channel] is None or values[row, channel] > tracker['max'][channel]:
+                tracker['max'][channel] = float(values[row, channel])
+                tracker['max_frame'][channel] = chunk[row]
+                tracker['max_sample'][channel] = values[row].tolist()
+    
+    return tracker
+
+def detect_range_channel(tracker):
+    """Return the index of the channel with the largest significant range, or None."""
+    min_vals = {'location': tracker['min'][0:3], 'rotation': tracker['min'][3:6], 'scale': tracker['min'][6:9]}
+    max_vals = {'location': tracker['max'][0:3], 'rotation': tracker['max'][3:6], 'scale': tracker['max'][6:9]}
+    
+    changes = detect_significant_changes(min_vals, max_vals)
+    if not changes:
+        return None
+    
+    transform_type, axis, _, _ = max(changes, key=lambda x: abs(x[3] - x[2]))
+    return TRANSFORM_CHANNELS.index((transform_type, axis))
+
+
+#---------------------------------------
+# Pose Snapshots
+#---------------------------------------
+# Snapshots are stored on the armature object so they survive clearing targets and travel with the rig
+POSE_SNAPSHOT_PROP = "easydriver_pose_snapshots"
+POSE_RESTORE_PROP = "easydriver_pose_restore"
+
+# Packed per-bone layout: every rotation representation is kept so no rotation_mode has to change
+POSE_SNAPSHOT_CHANNELS = (
+    ('location', 3),
+    ('rotation_quaternion', 4),
+    ('rotation_axis_angle', 4),
+    ('rotation_euler', 3),
+    ('scale', 3),
+)
+POSE_SNAPSHOT_STRIDE = sum(size for _, size in POSE_SNAPSHOT_CHANNELS)
+
+_pose_snapshot_items = []
+
+def read_pose_channel_arrays(armature_obj):
+    """Read every pose bone channel with foreach_get into a dict of (bone_count, size) float32 arrays."""
+    import numpy as np
+    
+    bones = armature_obj.pose.bones
+    arrays = {}
+    for prop, size in POSE_SNAPSHOT_CHANNELS:
+        values = np.empty(len(bones) * size, dtype=np.float32)
+        bones.foreach_get(prop, values)
+        arrays[prop] = values.reshape(len(bones), size)
+    return arrays
+
+def capture_pose_snapshot(armature_obj, bone_names=None):
+    """Capture pose channels (all bones, or only bone_names) as a snapshot dict with a packed float32 array."""
+    import numpy as np
+    
+    bones = armature_obj.pose.bones
+    arrays = read_pose_channel_arrays(armature_obj)
+    packed = np.hstack([arrays[prop] for prop, _ in POSE_SNAPSHOT_CHANNELS])
+    
+    if bone_names is None:
+        rows = list(range(len(bones)))
+    else:
+        wanted = set(bone_names)
+        rows = [i for i, bone in enumerate(bones) if bone.name in wanted]
+    
+    return {
+        'bones': [bones[i].name for i in rows],
+        'modes': [bones[i].rotation_mode for i in rows],
+        'data': np.ascontiguousarray(packed[rows], dtype=np.float32),
+    }
+
+def store_pose_snapshot(armature_obj, name, snapshot, prop_name=POSE_SNAPSHOT_PROP):
+    """Store a snapshot on the armature object as names plus raw float32 bytes."""
+    if prop_name not in armature_obj:
+        armature_obj[prop_name] = {}
+    armature_obj[prop_name][name] = {
+        'bones': "\n".join(snapshot['bones']),
+        'modes': "\n".join(snapshot['modes']),
+        'data': snapshot['data'].tobytes(),
+    }
+
+def load_pose_snapshot(armature_obj, name, prop_name=POSE_SNAPSHOT_PROP):
+    """Load a stored snapshot back into names plus an (n, stride) float32 array, or None."""
+    import numpy as np
+    
+    library = armature_obj.get(prop_name)
+    if library is None or name not in library:
+        return None
+    
+    entry = library[name]
+    bone_names = entry['bones'].split("\n") if entry['bones'] else []
+    data = entry['data']
+    if isinstance(data, str):
+        data = data.encode('latin-1')
+    
+    return {
+        'bones': bone_names,
+        'modes': entry['modes'].split("\n") if entry['modes'] else [],
+        'data': np.frombuffer(data, dtype=np.float32).reshape(len(bone_names), POSE_SNAPSHOT_STRIDE),
+    }
+
+def list_pose_snapshots(armature_obj):
+    """Return the snapshot names stored on an armature object."""
+    library = armature_obj.get(POSE_SNAPSHOT_PROP) if armature_obj else None
+    return sorted(library.keys()) if library is not None else []
+
+def delete_pose_snapshot(armature_obj, name):
+    """Remove a stored snapshot, returning True if it existed."""
+    library = armature_obj.get(POSE_SNAPSHOT_PROP)
+    if library is None or name not in library:
+        return False
+    del library[name]
+    return True
+
+def apply_pose_snapshot(armature_obj, snapshot, factor=1.0):
+    """Blend the pose towards a snapshot (factor 1 applies it) with one foreach_set per channel.
+
+    Bones missing from the rig are skipped. Quaternions are blended along the shortest path
+    and renormalized. Returns the number of bones affected.
+    """
+    import numpy as np
+    
+    bones = armature_obj.pose.bones
+    index = {bone.name: i for i, bone in enumerate(bones)}
+    pairs = [(index[name], row) for row, name in enumerate(snapshot['bones']) if name in index]
+    if not pairs:
+        return 0
+    
+    bone_rows = np.array([pair[0] for pair in pairs])
+    snapshot_rows = snapshot['data'][[pair[1] for pair in pairs]]
+    arrays = read_pose_channel_arrays(armature_obj)
+    
+    offset = 0
+    for prop, size in POSE_SNAPSHOT_CHANNELS:
+        current = arrays[prop]
+        target = snapshot_rows[:, offset:offset + size]
+        offset += size
+        
+        if factor >= 1.0:
+            current[bone_rows] = target
+        elif prop == 'rotation_quaternion':
+            start = current[bone_rows]
+            signs = np.where(np.sum(start * target, axis=1) < 0.0, -1.0, 1.0)[:, None]
+            blended = start + (target * signs - start) * factor
+            lengths = np.linalg.norm(blended, axis=1)[:, None]
+            current[bone_rows] = blended / np.where(lengths > 0.0, lengths, 1.0)
+        else:
+            start = current[bone_rows]
+            current[bone_rows] = start + (target - start) * factor
+        
+        bones.foreach_set(prop, current.ravel())
+    
+    armature_obj.update_tag()
+    return len(pairs)
+
+def get_snapshot_bone_transforms(snapshot, bone_name):
+    """Return (location, euler rotation, scale) lists for one bone, matching read_euler_rotation."""
+    import mathutils
+    
+    row = snapshot['bones'].index(bone_name)
+    values = [float(v) for v in snapshot['data'][row]]
+    location, quaternion, axis_angle, euler, scale = (
+        values[0:3], values[3:7], values[7:11], values[11:14], values[14:17]
+    )
+    mode = snapshot['modes'][row] if row < len(snapshot['modes']) else 'XYZ'
+    
+    if mode == 'QUATERNION':
+        euler = list(mathutils.Quaternion(quaternion).to_euler('XYZ'))
+    elif mode == 'AXIS_ANGLE':
+        euler = list(axis_angle_to_euler(axis_angle))
+    
+    return location, euler, scale
+
+def get_pose_snapshot_items(self, context):
+    """Enum items listing the snapshots stored on the active armature."""
+    global _pose_snapshot_items
+    obj = context.object if context else None
+    names = list_pose_snapshots(obj) if obj and obj.type == 'ARMATURE' else []
+    # Blender needs the item strings kept alive between calls
+    _pose_snapshot_items = [(name, name, f"Pose snapshot '{name}'") for name in names]
+    if not _pose_snapshot_items:
+        _pose_snapshot_items = [('NONE', "No Snapshots", "No pose snapshots stored on this armature")]
+    return _pose_snapshot_items
+
+#---------------------------------------
+# Visual Transforms
+#---------------------------------------
+def bone_inherits_fully(bone):
+    """Check if a bone uses default parent inheritance, so its local matrix is a plain matrix product."""
+    data_bone = bone.bone
+    return data_bone.use_inherit_rotation and data_bone.inherit_scale == 'FULL' and data_bone.use_local_location
+
+def read_visual_bone_transforms(context, armature_obj, bone_names):
+    """Read evaluated (post-constraint/driver) local transforms for many bones from one depsgraph pass.
+
+    All pose and rest matrices are fetched with one foreach_get each and converted to local
+    space with batched NumPy math. Bones with non-default inheritance use convert_space.
+    Returns {bone_name: (location, euler rotation, scale)} with Euler orders matching
+    read_euler_rotation.
+    """
+    import mathutils
+    import numpy as np
+    
+    depsgraph = context.evaluated_depsgraph_get()
+    evaluated = armature_obj.evaluated_get(depsgraph)
+    pose_bones = evaluated.pose.bones
+    data_bones = armature_obj.data.bones
+    count = len(pose_bones)
+    
+    # RNA matrices are stored column-major
+    pose_matrices = np.empty(count * 16, dtype=np.float32)
+    pose_bones.foreach_get('matrix', pose_matrices)
+    pose_matrices = pose_matrices.reshape(count, 4, 4).transpose(0, 2, 1).astype(float)
+    rest_matrices = np.empty(count * 16, dtype=np.float32)
+    data_bones.foreach_get('matrix_local', rest_matrices)
+    rest_matrices = rest_matrices.reshape(count, 4, 4).transpose(0, 2, 1).astype(float)
+    
+    index = {bone.name: i for i, bone in enumerate(data_bones)}
+    pose_index = {bone.name: i for i, bone in enumerate(pose_bones)}
+    wanted = [name for name in bone_names if name in index and name in pose_index]
+    results = {}
+    batched = []
+    
+    for name in wanted:
+        bone = armature_obj.pose.bones[name]
+        if bone_inherits_fully(bone):
+            batched.append(name)
+        else:
+            matrix = evaluated.convert_space(pose_bone=pose_bones[name], matrix=pose_bones[name].matrix,
+                                             from_space='POSE', to_space='LOCAL')
+            results[name] = matrix
+    
+    if batched:
+        rows = np.array([index[name] for name in batched])
+        parents = [data_bones[name].parent for name in batched]
+        parent_rows = np.array([index[parent.name] if parent else -1 for parent in parents])
+        parent_pose_rows = np.array([pose_index[parent.name] if parent else -1 for parent in parents])
+        
+        # Rest pose of each bone relative to its parent, carried by the parent's evaluated pose
+        basis = rest_matrices[rows].copy()
+        has_parent = parent_rows >= 0
+        if has_parent.any():
+            parent_rest = rest_matrices[parent_rows[has_parent]]
+            parent_pose = pose_matrices[parent_pose_rows[has_parent]]
+            basis[has_parent] = parent_pose @ np.linalg.inv(parent_rest) @ basis[has_parent]
+        local = np.linalg.inv(basis) @ pose_matrices[[pose_index[name] for name in batched]]
+        
+        for name, matrix in zip(batched, local):
+            results[name] = mathutils.Matrix(matrix.tolist())
+    
+    transforms = {}
+    for name, matrix in results.items():
+        location, rotation, scale = matrix.decompose()
+        mode = armature_obj.pose.bones[name].rotation_mode
+        euler = rotation.to_euler(mode if mode in EULER_ROTATION_MODES else 'XYZ')
+        transforms[name] = (list(location), [euler.x, euler.y, euler.z], list(scale))
+    
+    return transforms
+
+#---------------------------------------
+# Shape Key Symmetry
+#---------------------------------------
+# Largest mismatch, relative to the delta size, for two shape keys to count as mirrors
+SHAPEKEY_MIRROR_THRESHOLD = 0.1
+
+# {mesh pointer: (signature, vertex mirror index array)}
+_vertex_mirror_cache = {}
+
+def get_vertex_mirror_map(mesh, tolerance=0.001):
+    """Return an int array mapping each vertex to its X-mirrored vertex (-1 when there is none).
+
+    Built once per mesh with a KD-tree and cached until the vertex positions change.
+    """
+    import mathutils.kdtree
+    import numpy as np
+    
+    count = len(mesh.vertices)
+    coords = np.empty(count * 3, dtype=np.float32)
+    mesh.vertices.foreach_get('co', coords)
+    signature = (count, hash(coords.tobytes()), tolerance)
+    key = mesh.as_pointer()
+    
+    cached = _vertex_mirror_cache.get(key)
+    if cached and cached[0] == signature:
+        return cached[1]
+    
+    coords = coords.reshape(count, 3)
+    tree = mathutils.kdtree.KDTree(count)
+    for index, co in enumerate(coords):
+        tree.insert(co, index)
+    tree.balance()
+    
+    flip = np.array((-1.0, 1.0, 1.0), dtype=np.float32)
+    mirror = np.full(count, -1, dtype=np.int64)
+    for index, co in enumerate(coords):
+        _, other, distance = tree.find(co * flip)
+        if other is not None and distance <= tolerance:
+            mirror[index] = other
+    
+    _vertex_mirror_cache[key] = (signature, mirror)
+    print(f"DEBUG: Built vertex mirror map for '{mesh.name}': {int((mirror >= 0).sum())}/{count} vertices")
+    return mirror
+
+def get_shapekey_deltas(obj):
+    """Return (names, deltas) with deltas a (keys, vertices, 3) array of offsets from each key's relative key."""
+    import numpy as np
+    
+    key_blocks = obj.data.shape_keys.key_blocks
+    count = len(obj.data.vertices)
+    positions = {}
+    for block in key_blocks:
+        co = np.empty(count * 3, dtype=np.float32)
+        block.data.foreach_get('co', co)
+        positions[block.name] = co.reshape(count, 3)
+    
+    names = [block.name for block in key_blocks if block.relative_key != block]
+    deltas = np.array([positions[name] - positions[key_blocks[name].relative_key.name] for name in names],
+                      dtype=np.float32).reshape(len(names), count, 3)
+    return names, deltas
+
+def find_topology_shapekey_pairs(obj, tolerance=0.001):
+    """Pair shape keys whose vertex deltas are X-mirror images of each other.
+
+    Each key's deltas are mirrored through the vertex mirror map and compared with every
+    other key in one matrix product. Pairs must choose each other and match within
+    SHAPEKEY_MIRROR_THRESHOLD; symmetric keys (their own best match) stay unpaired.
+    Returns {key: opposite key} for both directions.
+    """
+    import numpy as np
+    
+    mirror = get_vertex_mirror_map(obj.data, tolerance)
+    valid = mirror >= 0
+    if not valid.any():
+        return {}
+    
+    names, deltas = get_shapekey_deltas(obj)
+    if len(names) < 2:
+        return {}
+    
+    flip = np.array((-1.0, 1.0, 1.0), dtype=np.float32)
+    original = deltas[:, valid].reshape(len(names), -1)
+    mirrored = (deltas[:, mirror[valid]] * flip).reshape(len(names), -1)
+    
+    # |m_a - d_b|^2 for every pair of keys at once
+    sq_original = np.einsum('ij,ij->i', original, original)
+    sq_mirrored = np.einsum('ij,ij->i', mirrored, mirrored)
+    distances = sq_mirrored[:, None] + sq_original[None, :] - 2.0 * (mirrored @ original.T)
+    distances = np.maximum(distances, 0.0)
+    
+    best = distances.argmin(axis=1)
+    scale = np.maximum(sq_original, 1e-12)
+    pairs = {}
+    for a, b in enumerate(best):
+        if a == b or best[b] != a or sq_original[a] < 1e-12:
+            continue
+        if distances[a, b] / scale[a] > SHAPEKEY_MIRROR_THRESHOLD ** 2:
+            continue
+        pairs[names[a]] = names[b]
+    return pairs
+
+def get_shapekey_mirror_map(obj, mode='NAME', tolerance=0.001):
+    """Return {key: opposite key} for an object's shape keys by name, topology, or name then topology ('AUTO')."""
+    shape_keys = getattr(obj.data, 'shape_keys', None) if obj and obj.data else None
+    if not shape_keys:
+        return {}
+    
+    key_blocks = shape_keys.key_blocks
+    pairs = {}
+    
+    if mode in ('NAME', 'AUTO'):
+        for name, mirrored in get_mirrored_names(block.name for block in key_blocks).items():
+            if mirrored and mirrored in key_blocks:
+                pairs[name] = mirrored
+    
+    if mode in ('TOPOLOGY', 'AUTO'):
+        for name, mirrored in find_topology_shapekey_pairs(obj, tolerance).items():
+            if name not in pairs and mirrored not in pairs:
+                pairs[name] = mirrored
+    
+    return pairs
+
+#---------------------------------------
+# Source Limits
+#---------------------------------------
+LIMIT_CONSTRAINT_TYPES = {'LOC': 'LIMIT_LOCATION', 'ROT': 'LIMIT_ROTATION', 'SCALE': 'LIMIT_SCALE'}
+LOCK_FLAG_PROPERTIES = {'LOC': 'lock_location', 'ROT': 'lock_rotation', 'SCALE': 'lock_scale'}
+
+def clear_limit_constraint_axes(constraint):
+    """Disable every axis of a LIMIT_* constraint."""
+    for axis in ('x', 'y', 'z'):
+        if constraint.type == 'LIMIT_ROTATION':
+            setattr(constraint, f"use_limit_{axis}", False)
+        else:
+            setattr(constraint, f"use_min_{axis}", False)
+            setattr(constraint, f"use_max_{axis}", False)
+
+def set_limit_constraint_axis(constraint, index, min_val, max_val):
+    """Limit one axis of a LIMIT_* constraint to [min_val, max_val] (sorted; an infinite side stays open)."""
+    axis = ('x', 'y', 'z')[index]
+    if min_val > max_val:
+        min_val, max_val = max_val, min_val
+    if constraint.type == 'LIMIT_ROTATION':
+        setattr(constraint, f"use_limit_{axis}", True)
+    else:
+        setattr(constraint, f"use_min_{axis}", min_val != float('-inf'))
+        setattr(constraint, f"use_max_{axis}", max_val != float('inf'))
+    if min_val != float('-inf'):
+        setattr(constraint, f"min_{axis}", min_val)
+    if max_val != float('inf'):
+        setattr(constraint, f"max_{axis}", max_val)
+
+def ensure_limit_constraint(owner, name, transform, is_bone):
+    """Return owner's LIMIT_* constraint called name, updated in place if it exists, else a new one.
+
+    Reusing the constraint avoids the relation rebuild that remove + new triggers.
+    """
+    constraint_type = LIMIT_CONSTRAINT_TYPES[transform]
+    constraint = owner.constraints.get(name)
+    
+    if constraint and constraint.type != constraint_type:
+        owner.constraints.remove(constraint)
+        constraint = None
+    
+    if constraint is None:
+        constraint = owner.constraints.new(constraint_type)
+        constraint.name = name
+    else:
+        clear_limit_constraint_axes(constraint)
+    
+    if is_bone:
+        constraint.owner_space = 'LOCAL'
+    # Enable "Affect Transform"
+    constraint.use_transform_limit = True
+    return constraint
+
+def remove_constraint_if_present(owner, name):
+    """Remove a constraint by name, returning True if it existed."""
+    constraint = owner.constraints.get(name)
+    if constraint:
+        owner.constraints.remove(constraint)
+        return True
+    return False
+
+def apply_axis_locks(owner, transform, active_index):
+    """Lock every axis of a transform except active_index with lock flags (no evaluation cost)."""
+    if transform == 'ROT':
+        # Lock flags map to Euler axes only in an Euler rotation mode
+        if isinstance(owner, bpy.types.PoseBone):
+            ensure_euler_rotation(owner, True)
+        else:
+            ensure_object_euler_rotation(owner)
+    
+    flags = getattr(owner, LOCK_FLAG_PROPERTIES[transform])
+    for index in range(3):
+        flags[index] = index != active_index
+
+#---------------------------------------
+# EasyDriver Driver Discovery
+#---------------------------------------
+# bpy.data collections whose ID blocks can carry drivers
+DRIVER_ID_COLLECTIONS = (
+    'objects', 'meshes', 'armatures', 'shape_keys', 'materials', 'node_groups',
+    'curves', 'lattices', 'cameras', 'lights', 'worlds', 'scenes',
+)
+
+TRANSFORM_TYPE_CHANNELS = {
+    'LOC_X': ('LOC', 0), 'LOC_Y': ('LOC', 1), 'LOC_Z': ('LOC', 2),
+    'ROT_X': ('ROT', 0), 'ROT_Y': ('ROT', 1), 'ROT_Z': ('ROT', 2),
+    'SCALE_X': ('SCALE', 0), 'SCALE_Y': ('SCALE', 1), 'SCALE_Z': ('SCALE', 2),
+}
+
+def iter_easydriver_drivers():
+    """Yield (id_block, fcurve, mapping) for every driver in the file created by EasyDriver."""
+    for collection_name in DRIVER_ID_COLLECTIONS:
+        for id_block in getattr(bpy.data, collection_name, ()):
+            animation_data = getattr(id_block, 'animation_data', None)
+            if not animation_data:
+                continue
+            for fcurve in animation_data.drivers:
+                mapping = get_easydriver_mapping(fcurve)
+                if mapping:
+                    yield id_block, fcurve, mapping
+
+def get_easydriver_mapping(fcurve):
+    """Return the parsed mapping of a driver created by createDriver, or None for any other driver."""
+    driver = fcurve.driver
+    if driver.type != 'SCRIPTED' or len(driver.variables) != 1 or driver.variables[0].name != 'drv':
+        return None
+    return parse_mapping_expression(driver.expression)
+
+def get_driver_source_channel(fcurve):
+    """Return (owner, is_bone, transform, index) for the transform channel an EasyDriver driver reads, or None."""
+    variable = fcurve.driver.variables[0]
+    target = variable.targets[0]
+    source_id = target.id
+    if source_id is None:
+        return None
+    
+    if variable.type == 'TRANSFORMS':
+        channel = TRANSFORM_TYPE_CHANNELS.get(target.transform_type)
+        if not channel:
+            return None
+        if target.bone_target and source_id.type == 'ARMATURE':
+            owner = source_id.pose.bones.get(target.bone_target)
+            return (owner, True) + channel if owner else None
+        return (source_id, False) + channel
+    
+    if variable.type == 'SINGLE_PROP':
+        match = re.match(r"^(location|rotation_euler|scale)\[(\d)\]$", target.data_path)
+        if match and isinstance(source_id, bpy.types.Object):
+            transform = {'location': 'LOC', 'rotation_euler': 'ROT', 'scale': 'SCALE'}[match.group(1)]
+            return source_id, False, transform, int(match.group(2))
+    
+    return None
+
+def collect_file_source_limits():
+    """Collect the input range of every source channel read by EasyDriver drivers in the file.
+
+    Returns {owner key: {'owner', 'is_bone', 'channels': {(transform, index): (min, max)}}}, where
+    each channel range is the union of the ranges of all drivers reading it.
+    """
+    limits = {}
+    for _, fcurve, mapping in iter_easydriver_drivers():
+        channel = get_driver_source_channel(fcurve)
+        if not channel:
+            continue
+        owner, is_bone, transform, index = channel
+        add_source_limit(limits, owner, is_bone, transform, index, mapping['from_min'], mapping['from_max'])
+    return limits
+
+def add_source_limit(limits, owner, is_bone, transform, index, min_val, max_val):
+    """Merge one channel range into a limits dict as built by collect_file_source_limits."""
+    key = (owner.id_data.name, owner.name) if is_bone else (owner.name,)
+    entry = limits.setdefault(key, {'owner': owner, 'is_bone': is_bone, 'channels': {}})
+    low, high = min(min_val, max_val), max(min_val, max_val)
+    if (transform, index) in entry['channels']:
+        old_low, old_high = entry['channels'][(transform, index)]
+        low, high = min(low, old_low), max(high, old_high)
+    entry['channels'][(transform, index)] = (low, high)
+
+def get_source_owner(source):
+    """Return the pose bone or object a source dict from get_driver_source reads."""
+    if source['kind'] == 'bone':
+        return bpy.data.objects[source['armature_name']].pose.bones[source['owner']]
+    return bpy.data.objects[source['owner']]
+
+def get_source_owner_limits(source):
+    """Build a limits dict (see collect_file_source_limits) for a source from get_driver_source."""
+    owner = get_source_owner(source)
+    transform = {'location': 'LOC', 'rotation_euler': 'ROT', 'scale': 'SCALE'}[source['property']]
+    
+    limits = {}
+    add_source_limit(limits, owner, source['kind'] == 'bone', transform, source['axis'],
+                     source['from_min'], source['from_max'])
+    return limits
+
+def get_merged_limit_name(transform):
+    """Name of the single EasyDriver limit constraint for a transform type."""
+    return f"Limit_{transform}"
+
+def apply_source_limits(limits):
+    """Write each owner's channel ranges into one LIMIT_* constraint per transform type.
+
+    Existing constraints are updated in place, and the per-axis 'Limit_LOC_X' style constraints
+    the single-source tool creates are folded in. Returns (created, updated, removed) counts.
+    """
+    created = updated = removed = 0
+    
+    for entry in limits.values():
+        owner = entry['owner']
+        by_transform = {}
+        for (transform, index), value_range in entry['channels'].items():
+            by_transform.setdefault(transform, {})[index] = value_range
+        
+        for transform, axes in by_transform.items():
+            name = get_merged_limit_name(transform)
+            existed = owner.constraints.get(name) is not None
+            constraint = ensure_limit_constraint(owner, name, transform, entry['is_bone'])
+            for index, (low, high) in axes.items():
+                set_limit_constraint_axis(constraint, index, low, high)
+                if remove_constraint_if_present(owner, f"Limit_{transform}_{'XYZ'[index]}"):
+                    removed += 1
+            if existed:
+                updated += 1
+            else:
+                created += 1
+    
+    return created, updated, removed
+
+#---------------------------------------
+# Limit Constraint Consolidation
+#---------------------------------------
+# Limit_LOC_X (Lock Recorded), OneAxis_ROT_Y (Lock to One Axis), Limit_SCALE (merged)
+EASYDRIVER_LIMIT_PATTERN = re.compile(r"^(?:Limit|OneAxis)_(LOC|ROT|SCALE)(?:_[XYZ])?$")
+
+def get_limit_constraint_axes(constraint):
+    """Return {index: (min, max)} for the axes a LIMIT_* constraint actually limits."""
+    axes = {}
+    for index, axis in enumerate(('x', 'y', 'z')):
+        if constraint.type == 'LIMIT_ROTATION':
+            enabled = getattr(constraint, f"use_limit_{axis}")
+        else:
+            # A one-sided limit is kept as an open range
+            use_min = getattr(constraint, f"use_min_{axis}")
+            use_max = getattr(constraint, f"use_max_{axis}")
+            enabled = use_min or use_max
+            if enabled and not (use_min and use_max):
+                low = getattr(constraint, f"min_{axis}") if use_min else float('-inf')
+                high = getattr(constraint, f"max_{axis}") if use_max else float('inf')
+                axes[index] = (low, high)
+                continue
+        if enabled:
+            axes[index] = (getattr(constraint, f"min_{axis}"), getattr(constraint, f"max_{axis}"))
+    return axes
+
+def get_easydriver_limit_constraints(owner):
+    """Return [(constraint, transform)] for owner's EasyDriver LIMIT_* constraints, in stack order."""
+    found = []
+    for constraint in owner.constraints:
+        match = EASYDRIVER_LIMIT_PATTERN.match(constraint.name)
+        if match and constraint.type == LIMIT_CONSTRAINT_TYPES[match.group(1)]:
+            found.append((constraint, match.group(1)))
+    return found
+
+def combine_limit_ranges(ranges):
+    """Combine stacked ranges the way the stack evaluates them: their intersection, or the last one if disjoint."""
+    low, high = ranges[0]
+    for next_low, next_high in ranges[1:]:
+        new_low, new_high = max(low, next_low), min(high, next_high)
+        if new_low > new_high:
+            new_low, new_high = next_low, next_high
+        low, high = new_low, new_high
+    return low, high
+
+def consolidate_limit_constraints(owner, is_bone):
+    """Collapse owner's EasyDriver limit constraints into at most one per transform type.
+
+    Returns the number of constraints removed.
+    """
+    by_transform = {}
+    for constraint, transform in get_easydriver_limit_constraints(owner):
+        if constraint.mute or constraint.influence <= 0.0:
+            continue
+        by_transform.setdefault(transform, []).append(constraint)
+    
+    removed = 0
+    for transform, constraints in by_transform.items():
+        name = get_merged_limit_name(transform)
+        if len(constraints) == 1 and constraints[0].name == name:
+            continue
+        
+        axis_ranges = {}
+        for constraint in constraints:
+            for index, value_range in get_limit_constraint_axes(constraint).items():
+                axis_ranges.setdefault(index, []).append(value_range)
+        combined = {index: combine_limit_ranges(ranges) for index, ranges in axis_ranges.items()}
+        
+        # Keep one of the active constraints being merged; a muted or zero-influence
+        # constraint that already has the merged name is left alone
+        keep = next((constraint for constraint in constraints if constraint.name == name), constraints[0])
+        for constraint in constraints:
+            if constraint != keep:
+                owner.constraints.remove(constraint)
+                removed += 1
+        if keep.name != name and name not in owner.constraints:
+            keep.name = name
+        
+        clear_limit_constraint_axes(keep)
+        if is_bone:
+            keep.owner_space = 'LOCAL'
+        keep.use_transform_limit = True
+        for index, (low, high) in combined.items():
+            set_limit_constraint_axis(keep, index, low, high)
+    
+    return removed
+
+def audit_limit_constraints(owner):
+    """Return messages for EasyDriver limit constraints that can be removed or replaced by lock flags."""
+    findings = []
+    for constraint, transform in get_easydriver_limit_constraints(owner):
+        axes = get_limit_constraint_axes(constraint)
+        if constraint.mute or constraint.influence <= 0.0:
+            findings.append(f"{owner.name}: '{constraint.name}' is disabled and can be removed")
+            continue
+        if not axes:
+            findings.append(f"{owner.name}: '{constraint.name}' limits no axis and can be removed")
+            continue
+        
+        flags = getattr(owner, LOCK_FLAG_PROPERTIES[transform])
+        frozen = [index for index, (low, high) in axes.items() if low == high]
+        locked = [index for index in frozen if flags[index]]
+        if locked and len(locked) == len(axes):
+            findings.append(f"{owner.name}: '{constraint.name}' only repeats lock flags and can be removed")
+        elif locked:
+            axis_names = ", ".join('XYZ'[index] for index in locked)
+            findings.append(f"{owner.name}: '{constraint.name}' axes {axis_names} repeat lock flags")
+        elif frozen:
+            axis_names = ", ".join('XYZ'[index] for index in frozen)
+            findings.append(f"{owner.name}: '{constraint.name}' axes {axis_names} are frozen and could use lock flags")
+    return findings
+
+#---------------------------------------
+# Clamp Cost Probe
+#---------------------------------------
+CLAMP_MODES = ('DRIVER', 'CONSTRAINT', 'BOTH')
+
+def time_frame_steps(scene, frame_count=24, repeats=2):
+    """Time scene.frame_set over frame_count frames and return the average milliseconds per frame."""
+    start_frame = scene.frame_start
+    end_frame = max(start_frame, min(scene.frame_end, start_frame + frame_count - 1))
+    frames = list(range(start_frame, end_frame + 1))
+    
+    # Warm up caches and relations before measuring
+    scene.frame_set(frames[-1])
+    start_time = time.perf_counter()
+    for _ in range(repeats):
+        for frame in frames:
+            scene.frame_set(frame)
+    return (time.perf_counter() - start_time) * 1000.0 / (len(frames) * repeats)
+
+def probe_clamp_costs(scene, frame_count=24):
+    """Measure the per-frame cost of every clamp mode on the file's EasyDriver drivers.
+
+    Each mode is set up temporarily: driver expressions are rewritten with or without the
+    input clamp, object-source variables are switched to read the constrained transform
+    where the mode relies on the constraint, EasyDriver limit constraints are muted or
+    enabled, and a constraint is added where a source has none. Everything is restored
+    afterwards. Returns
+    {mode: {'ms_per_frame', 'constraints', 'simple_drivers', 'python_drivers'}}.
+    """
+    drivers = list(iter_easydriver_drivers())
+    limits = collect_file_source_limits()
+    
+    original_expressions = [(fcurve, fcurve.driver.expression) for _, fcurve, _ in drivers]
+    
+    # Object sources read through SINGLE_PROP bypass the constraint, so CONSTRAINT mode
+    # switches them to TRANSFORMS just like real creation does
+    object_sources = []
+    for _, fcurve, _ in drivers:
+        channel = get_driver_source_channel(fcurve)
+        if not channel or channel[1]:
+            continue
+        owner, _, transform, index = channel
+        source_config = {'type': 'object', 'object': owner, 'property': AXIS_PROPERTIES[transform], 'index': index}
+        object_sources.append((fcurve, source_config, fcurve.driver.variables[0].type == 'TRANSFORMS'))
+    variables_changed = False
+    original_mutes = []
+    temporary = []
+    original_frame = scene.frame_current
+    results = {}
+    
+    try:
+        # Make sure every source can be limited by a constraint
+        for entry in limits.values():
+            owner = entry['owner']
+            existing = {transform for _, transform in get_easydriver_limit_constraints(owner)}
+            for transform, index in entry['channels']:
+                if transform in existing:
+                    continue
+                existing.add(transform)
+                constraint = ensure_limit_constraint(owner, get_merged_limit_name(transform), transform, entry['is_bone'])
+                for (other_transform, other_index), (low, high) in entry['channels'].items():
+                    if other_transform == transform:
+                        set_limit_constraint_axis(constraint, other_index, low, high)
+                temporary.append((owner, constraint.name))
+        
+        constraints = []
+        for entry in limits.values():
+            constraints.extend(constraint for constraint, _ in get_easydriver_limit_constraints(entry['owner']))
+        original_mutes = [(constraint, constraint.mute) for constraint in constraints]
+        
+        for mode in CLAMP_MODES:
+            clamp = mode in ('DRIVER', 'BOTH')
+            for _, fcurve, mapping in drivers:
+                fcurve.driver.expression = create_mapping_expression(
+                    mapping['from_min'], mapping['from_max'], mapping['to_min'], mapping['to_max'], clamp)
+            for fcurve, source_config, _ in object_sources:
+                configure_driver(fcurve, source_config, read_constrained=not clamp)
+                variables_changed = True
+            for constraint in constraints:
+                constraint.mute = mode == 'DRIVER'
+            bpy.context.view_layer.update()
+            
+            simple = sum(1 for _, fcurve, _ in drivers if fcurve.driver.is_simple_expression)
+            results[mode] = {
+                'ms_per_frame': time_frame_steps(scene, frame_count),
+                'constraints': 0 if mode == 'DRIVER' else len(constraints),
+                'simple_drivers': simple,
+                'python_drivers': len(drivers) - simple,
+            }
+    finally:
+        for fcurve, expression in original_expressions:
+            fcurve.driver.expression = expression
+        if variables_changed:
+            for fcurve, source_config, read_constrained in object_sources:
+                configure_driver(fcurve, source_config, read_constrained=read_constrained)
+        for constraint, mute in original_mutes:
+            constraint.mute = mute
+        for owner, name in temporary:
+            remove_constraint_if_present(owner, name)
+        scene.frame_set(original_frame)
+    
+    return results
+
+#---------------------------------------
+# Driver Optimizer
+#---------------------------------------
+# Single-variable driver expressions built from +, -, * and / by constants, min, max, abs and
+# clamp are piecewise linear. They are held as (xs, ys, left_slope, right_slope): the function
+# passes through (xs[i], ys[i]), is linear between them and continues with the given slopes.
+PIECEWISE_CONSTANTS = {'pi': math.pi}
+
+# Evaluated by the Python fallback when checking a rewrite against the original expression
+PIECEWISE_NAMESPACE = {
+    'min': min, 'max': max, 'abs': abs, 'pi': math.pi,
+    'radians': math.radians, 'degrees': math.degrees,
+    'clamp': lambda value, low=0.0, high=1.0: max(low, min(high, value)),
+    'lerp': lambda start, end, factor: start + (end - start) * factor,
+}
+
+# Drivers with more breakpoints than this become curve drivers instead of min/max expressions
+CURVE_DRIVER_MIN_BREAKPOINTS = 3
+
+def piecewise_constant(value):
+    return ([0.0], [float(value)], 0.0, 0.0)
+
+def piecewise_is_constant(f):
+    xs, ys, left_slope, right_slope = f
+    return left_slope == 0.0 and right_slope == 0.0 and all(y == ys[0] for y in ys)
+
+def evaluate_piecewise(f, x):
+    """Evaluate a piecewise linear function at x."""
+    xs, ys, left_slope, right_slope = f
+    if x <= xs[0]:
+        return ys[0] + left_slope * (x - xs[0])
+    if x >= xs[-1]:
+        return ys[-1] + right_slope * (x - xs[-1])
+    
+    low, high = 0, len(xs) - 1
+    while high - low > 1:
+        middle = (low + high) // 2
+        if xs[middle] <= x:
+            low = middle
+        else:
+            high = middle
+    t = (x - xs[low]) / (xs[high] - xs[low])
+    return ys[low] + (ys[high] - ys[low]) * t
+
+def simplify_piecewise(f, tolerance=1e-9):
+    """Drop points that lie on the line through their neighbours (the end slopes count as neighbours)."""
+    xs, ys, left_slope, right_slope = f
+    points = list(zip(xs, ys))
+    kept = []
+    for i, (x, y) in enumerate(points):
+        slope_in = left_slope if i == 0 else (y - points[i - 1][1]) / (x - points[i - 1][0])
+        slope_out = right_slope if i == len(points) - 1 else (points[i + 1][1] - y) / (points[i + 1][0] - x)
+        if abs(slope_in - slope_out) > tolerance * max(1.0, abs(slope_in), abs(slope_out)):
+            kept.append((x, y))
+    
+    if not kept:
+        # Straight line, anchored at its first point
+        return ([xs[0]], [ys[0]], left_slope, left_slope)
+    return ([x for x, _ in kept], [y for _, y in kept], left_slope, right_slope)
+
+def combine_piecewise(f, g, operation, crossings=False):
+    """Combine two piecewise linear functions point by point.
+
+    operation must keep the result linear between breakpoints: + and - always do, and min or
+    max do once the points where f and g cross are added (crossings=True).
+    """
+    xs = sorted(set(f[0]) | set(g[0]))
+    
+    if crossings:
+        def difference(x):
+            return evaluate_piecewise(f, x) - evaluate_piecewise(g, x)
+        
+        extra = []
+        # Crossings between breakpoints
+        for x0, x1 in zip(xs, xs[1:]):
+            d0, d1 = difference(x0), difference(x1)
+            if d0 * d1 < 0:
+                extra.append(x0 + (x1 - x0) * d0 / (d0 - d1))
+        # Crossings on the outer rays
+        left_delta = f[2] - g[2]
+        if left_delta:
+            x = xs[0] - difference(xs[0]) / left_delta
+            if x < xs[0]:
+                extra.append(x)
+        right_delta = f[3] - g[3]
+        if right_delta:
+            x = xs[-1] - difference(xs[-1]) / right_delta
+            if x > xs[-1]:
+                extra.append(x)
+        xs = sorted(set(xs) | set(extra))
+    
+    def combined(x):
+        return operation(evaluate_piecewise(f, x), evaluate_piecewise(g, x))
+    
+    ys = [combined(x) for x in xs]
+    # No breakpoints lie outside xs, so one unit step measures each end slope
+    left_slope = ys[0] - combined(xs[0] - 1.0)
+    right_slope = combined(xs[-1] + 1.0) - ys[-1]
+    return simplify_piecewise((xs, ys, left_slope, right_slope))
+
+def scale_piecewise(f, factor, offset=0.0):
+    xs, ys, left_slope, right_slope = f
+    return simplify_piecewise((list(xs), [y * factor + offset for y in ys], left_slope * factor, right_slope * factor))
+
+def piecewise_from_expression(expression, variable):
+    """Parse a driver expression of one variable into a piecewise linear function, or None."""
+    import ast
+    import operator
+    
+    try:
+        tree = ast.parse(expression.strip(), mode='eval')
+    except SyntaxError:
+        return None
+    
+    def fold(function, args, crossings):
+        result = args[0]
+        for arg in args[1:]:
+            result = combine_piecewise(result, arg, function, crossings)
+        return result
+    
+    def convert(node):
+        if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)) and not isinstance(node.value, bool):
+            return piecewise_constant(node.value)
+        
+        if isinstance(node, ast.Name):
+            if node.id == variable:
+                return ([0.0], [0.0], 1.0, 1.0)
+            if node.id in PIECEWISE_CONSTANTS:
+                return piecewise_constant(PIECEWISE_CONSTANTS[node.id])
+            return None
+        
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.USub, ast.UAdd)):
+            operand = convert(node.operand)
+            if operand is None:
+                return None
+            return scale_piecewise(operand, -1.0 if isinstance(node.op, ast.USub) else 1.0)
+        
+        if isinstance(node, ast.BinOp):
+            left, right = convert(node.left), convert(node.right)
+            if left is None or right is None:
+                return None
+            if isinstance(node.op, ast.Add):
+                return combine_piecewise(left, right, operator.add)
+            if isinstance(node.op, ast.Sub):
+                return combine_piecewise(left, right, operator.sub)
+            if isinstance(node.op, ast.Mult):
+                if piecewise_is_constant(right):
+                    return scale_piecewise(left, right[1][0])
+                if piecewise_is_constant(left):
+                    return scale_piecewise(right, left[1][0])
+                return None
+            if isinstance(node.op, ast.Div):
+                if piecewise_is_constant(right) and right[1][0] != 0.0:
+                    return scale_piecewise(left, 1.0 / right[1][0])
+                return None
+            return None
+        
+        if isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and not node.keywords:
+            name = node.func.id
+            args = [convert(arg) for arg in node.args]
+            if any(arg is None for arg in args):
+                return None
+            
+            if name in ('min', 'max') and len(args) >= 2:
+                return fold(min if name == 'min' else max, args, True)
+            if name == 'abs' and len(args) == 1:
+                return combine_piecewise(args[0], scale_piecewise(args[0], -1.0), max, True)
+            if name == 'clamp' and 1 <= len(args) <= 3:
+                low = args[1] if len(args) > 1 else piecewise_constant(0.0)
+                high = args[2] if len(args) > 2 else piecewise_constant(1.0)
+                return combine_piecewise(combine_piecewise(args[0], low, max, True), high, min, True)
+            if name in ('radians', 'degrees') and len(args) == 1:
+                return scale_piecewise(args[0], math.radians(1.0) if name == 'radians' else math.degrees(1.0))
+            if name == 'lerp' and len(args) == 3:
+                start, end, factor = args
+                span = combine_piecewise(end, start, operator.sub)
+                if piecewise_is_constant(factor):
+                    product = scale_piecewise(span, factor[1][0])
+                elif piecewise_is_constant(span):
+                    product = scale_piecewise(factor, span[1][0])
+                else:
+                    return None
+                return combine_piecewise(start, product, operator.add)
+        
+        return None
+    
+    return convert(tree.body)
+
+def format_driver_number(value):
+    text = f"{value:.10g}"
+    return f"({text})" if value < 0 else text
+
+def piecewise_to_expression(f, variable):
+    """Write a piecewise linear function as a min/max expression Blender evaluates without Python."""
+    xs, ys, left_slope, right_slope = f
+    number = format_driver_number
+    
+    if len(xs) == 1 and left_slope == right_slope:
+        if left_slope == 0.0:
+            return number(ys[0])
+        intercept = ys[0] - left_slope * xs[0]
+        return f"{number(left_slope)} * {variable} + {number(intercept)}" if intercept else f"{number(left_slope)} * {variable}"
+    
+    terms = [number(ys[0])] if ys[0] else []
+    if left_slope:
+        terms.append(f"{number(left_slope)} * (min({variable}, {number(xs[0])}) - {number(xs[0])})")
+    for (x0, y0), (x1, y1) in zip(zip(xs, ys), zip(xs[1:], ys[1:])):
+        if y1 != y0:
+            terms.append(f"{number((y1 - y0) / (x1 - x0))} * (min(max({variable}, {number(x0)}), {number(x1)}) - {number(x0)})")
+    if right_slope:
+        terms.append(f"{number(right_slope)} * (max({variable}, {number(xs[-1])}) - {number(xs[-1])})")
+    return " + ".join(terms)
+
+def piecewise_matches_expression(f, expression, variable, rewritten=None):
+    """Check f (and an optional rewritten expression) against the original expression at probe points."""
+    xs = f[0]
+    probes = set(xs)
+    probes.update((x0 + x1) * 0.5 for x0, x1 in zip(xs, xs[1:]))
+    for offset in (0.001, 1.0, 10.0, 1000.0):
+        probes.update((xs[0] - offset, xs[-1] + offset))
+    
+    try:
+        original = compile(expression, '<driver>', 'eval')
+        candidate = compile(rewritten, '<driver>', 'eval') if rewritten else None
+        for x in probes:
+            namespace = dict(PIECEWISE_NAMESPACE, **{variable: x})
+            expected = float(eval(original, {'__builtins__': {}}, namespace))
+            values = [evaluate_piecewise(f, x)]
+            if candidate:
+                values.append(float(eval(candidate, {'__builtins__': {}}, namespace)))
+            for value in values:
+                if abs(value - expected) > 1e-6 * max(1.0, abs(expected)):
+                    return False
+    except Exception:
+        return False
+    return True
+
+def fcurve_is_identity(fcurve):
+    """True when a driver fcurve passes the driver value through unchanged."""
+    if len(fcurve.keyframe_points):
+        return False
+    for modifier in fcurve.modifiers:
+        if modifier.mute:
+            continue
+        if (modifier.type != 'GENERATOR' or modifier.mode != 'POLYNOMIAL' or modifier.poly_order != 1
+                or modifier.use_additive or modifier.use_restricted_range or modifier.use_influence
+                or tuple(modifier.coefficients) != (0.0, 1.0)):
+            return False
+    return True
+
+def iter_all_drivers():
+    """Yield (id_block, fcurve) for every driver in the file."""
+    for collection_name in DRIVER_ID_COLLECTIONS:
+        for id_block in getattr(bpy.data, collection_name, ()):
+            animation_data = getattr(id_block, 'animation_data', None)
+            if animation_data:
+                for fcurve in animation_data.drivers:
+                    yield id_block, fcurve
+
+def analyze_driver(fcurve, use_curves=True):
+    """Work out whether a scripted driver can run without Python.
+
+    Returns a dict with 'status' ('OPTIMIZE', 'FAST' or 'SKIP'), 'reason', and for 'OPTIMIZE'
+    the 'form' ('EXPRESSION' or 'CURVE'), the piecewise 'function' and the new 'expression'.
+    """
+    driver = fcurve.driver
+    if driver.type != 'SCRIPTED':
+        return {'status': 'FAST', 'reason': f"{driver.type.lower()} driver"}
+    if driver.is_simple_expression:
+        return {'status': 'FAST', 'reason': "already a simple expression"}
+    if driver.use_self:
+        return {'status': 'SKIP', 'reason': "uses self"}
+    if len(driver.variables) != 1:
+        return {'status': 'SKIP', 'reason': f"{len(driver.variables)} variables"}
+    
+    variable = driver.variables[0].name
+    function = piecewise_from_expression(driver.expression, variable)
+    if function is None:
+        return {'status': 'SKIP', 'reason': "not a linear/clamp/min/max/abs expression"}
+    
+    expression = piecewise_to_expression(function, variable)
+    if not piecewise_matches_expression(function, driver.expression, variable, expression):
+        return {'status': 'SKIP', 'reason': "rewrite does not match the original"}
+    
+    # Keyframes or modifiers on the fcurve remap the expression's output, so those keep an expression
+    form = 'EXPRESSION'
+    if use_curves and len(function[0]) >= CURVE_DRIVER_MIN_BREAKPOINTS and fcurve_is_identity(fcurve):
+        form = 'CURVE'
+    
+    return {'status': 'OPTIMIZE', 'reason': "", 'form': form, 'function': function, 'expression': expression}
+
+def convert_to_curve_driver(fcurve, function):
+    """Turn a driver into an Averaged Value driver whose linear keyframes hold the function."""
+    xs, ys, left_slope, right_slope = function
+    points = [(xs[0] - 1.0, ys[0] - left_slope)] + list(zip(xs, ys)) + [(xs[-1] + 1.0, ys[-1] + right_slope)]
+    
+    for modifier in list(fcurve.modifiers):
+        fcurve.modifiers.remove(modifier)
+    
+    fcurve.driver.type = 'AVERAGE'
+    keyframe_points = fcurve.keyframe_points
+    keyframe_points.add(len(points))
+    keyframe_points.foreach_set('co', [value for point in points for value in point])
+    for keyframe in keyframe_points:
+        keyframe.interpolation = 'LINEAR'
+    # Linear extrapolation carries the end slopes, which are flat for clamped drivers
+    fcurve.extrapolation = 'LINEAR'
+    fcurve.update()
+
+def optimize_drivers(apply=True, use_curves=True):
+    """Analyze every driver in the file and rewrite the Python ones that have a fast equivalent.
+
+    Returns a list of {'id', 'data_path', 'index', 'status', 'reason', 'before', 'after', 'form'}.
+    """
+    entries = []
+    for id_block, fcurve in iter_all_drivers():
+        analysis = analyze_driver(fcurve, use_curves)
+        entry = {
+            'id': f"{type(id_block).__name__}:{id_block.name}",
+            'data_path': fcurve.data_path,
+            'index': fcurve.array_index,
+            'status': analysis['status'],
+            'reason': analysis['reason'],
+            'before': fcurve.driver.expression if fcurve.driver.type == 'SCRIPTED' else fcurve.driver.type,
+            'after': None,
+            'form': analysis.get('form'),
+        }
+        entries.append(entry)
+        if analysis['status'] != 'OPTIMIZE':
+            continue
+        
+        if analysis['form'] == 'CURVE':
+            entry['after'] = f"curve driver, {len(analysis['function'][0]) + 2} linear keys"
+            if apply:
+                convert_to_curve_driver(fcurve, analysis['function'])
+        else:
+            entry['after'] = analysis['expression']
+            if apply:
+                fcurve.driver.expression = analysis['expression']
+                if not fcurve.driver.is_simple_expression:
+                    fcurve.driver.expression = entry['before']
+                    entry.update(status='SKIP', reason="Blender rejected the simple expression", after=None, form=None)
+    
+    return entries
+
+#---------------------------------------
+# Driver Profiler
+#---------------------------------------
+PROFILE_GROUPINGS = ('source', 'target', 'kind')
+
+def get_driver_kind(driver):
+    """Classify a driver by how Blender evaluates it: 'PYTHON', 'SIMPLE' or the driver type (e.g. 'AVERAGE')."""
+    if driver.type == 'SCRIPTED':
+        return 'SIMPLE' if driver.is_simple_expression else 'PYTHON'
+    return driver.type
+
+def describe_driver_source(fcurve):
+    """Name what a driver reads: the source channel for EasyDriver drivers, else its variables' targets."""
+    if get_easydriver_mapping(fcurve):
+        channel = get_driver_source_channel(fcurve)
+        if channel:
+            owner, is_bone, transform, index = channel
+            owner_name = f"{owner.id_data.name}:{owner.name}" if is_bone else owner.name
+            return f"{owner_name} {transform} {'XYZ'[index]}"
+    
+    names = []
+    for variable in fcurve.driver.variables:
+        for target in variable.targets:
+            if target.id:
+                name = f"{target.id.name}:{target.bone_target}" if getattr(target, 'bone_target', '') else target.id.name
+                if name not in names:
+                    names.append(name)
+    return ", ".join(names) or "(none)"
+
+def collect_profile_drivers(easydriver_only=False):
+    """List the unmuted drivers to profile as dicts describing each one."""
+    drivers = []
+    for id_block, fcurve in iter_all_drivers():
+        if fcurve.mute:
+            continue
+        is_easydriver = get_easydriver_mapping(fcurve) is not None
+        if easydriver_only and not is_easydriver:
+            continue
+        drivers.append({
+            'fcurve': fcurve,
+            'id': f"{type(id_block).__name__}:{id_block.name}",
+            'data_path': fcurve.data_path,
+            'index': fcurve.array_index,
+            'source': describe_driver_source(fcurve),
+            'target': f"{type(id_block).__name__}:{id_block.name}",
+            'kind': get_driver_kind(fcurve.driver),
+            'easydriver': is_easydriver,
+            'ms': 0.0,
+        })
+    return drivers
+
+def time_with_muted(scene, fcurves, frame_count, repeats):
+    """Time frame steps with the given driver fcurves muted, unmuting them again afterwards."""
+    for fcurve in fcurves:
+        fcurve.mute = True
+    try:
+        bpy.context.view_layer.update()
+        return time_frame_steps(scene, frame_count, repeats)
+    finally:
+        for fcurve in fcurves:
+            fcurve.mute = False
+
+def profile_drivers(scene, frame_count=24, repeats=2, min_cost_ms=0.01, max_depth=8, easydriver_only=False):
+    """Measure what drivers cost per frame and attribute it to sources, targets and driver kinds.
+
+    The cost of a group is the frame time saved by muting it. Groups are bisected until they cost
+    less than min_cost_ms, hold one driver or reach max_depth; what remains is shared evenly.
+    Returns a JSON-serializable dict with the baseline timings, per-group totals and per-driver costs.
+    """
+    drivers = collect_profile_drivers(easydriver_only)
+    original_frame = scene.frame_current
+    if not drivers:
+        return None
+    
+    # Neighbouring drivers share a kind and source, so bisection tends to split along them
+    drivers.sort(key=lambda entry: (entry['kind'], entry['source'], entry['target']))
+    start_time = time.perf_counter()
+    
+    try:
+        unmuted_ms = time_with_muted(scene, [], frame_count, repeats)
+        all_muted_ms = time_with_muted(scene, [entry['fcurve'] for entry in drivers], frame_count, repeats)
+        easydriver_fcurves = [entry['fcurve'] for entry in drivers if entry['easydriver']]
+        easydriver_muted_ms = time_with_muted(scene, easydriver_fcurves, frame_count, repeats) if easydriver_fcurves else unmuted_ms
+        
+        def group_cost(entries):
+            muted_ms = time_with_muted(scene, [entry['fcurve'] for entry in entries], frame_count, repeats)
+            return max(0.0, unmuted_ms - muted_ms)
+        
+        def bisect(entries, cost, depth):
+            if len(entries) == 1 or cost < min_cost_ms or depth >= max_depth:
+                for entry in entries:
+                    entry['ms'] = cost / len(entries)
+                return
+            middle = len(entries) // 2
+            for half in (entries[:middle], entries[middle:]):
+                bisect(half, group_cost(half), depth + 1)
+        
+        bisect(drivers, max(0.0, unmuted_ms - all_muted_ms), 0)
+        
+        # Group totals are measured directly rather than summed from the bisection estimates
+        groups = {}
+        for grouping in PROFILE_GROUPINGS:
+            members = {}
+            for entry in drivers:
+                members.setdefault(entry[grouping], []).append(entry)
+            groups[grouping] = [
+                {'name': name, 'count': len(entries), 'ms': group_cost(entries)}
+                for name, entries in members.items()
+            ]
+    finally:
+        bpy.context.view_layer.update()
+        scene.frame_set(original_frame)
+    
+    return {
+        'frames': frame_count,
+        'repeats': repeats,
+        'elapsed_s': time.perf_counter() - start_time,
+        'ms_unmuted': unmuted_ms,
+        'ms_all_muted': all_muted_ms,
+        'ms_easydriver_muted': easydriver_muted_ms,
+        'groups': groups,
+        'drivers': [{key: value for key, value in entry.items() if key != 'fcurve'} for entry in drivers],
+    }
+
+def get_profile_rows(profile, grouping='driver', sort='COST'):
+    """Return (name, count, ms) rows of a stored profile for one grouping, sorted by COST, NAME or COUNT."""
+    if grouping == 'driver':
+        rows = [(f"{entry['target']} {entry['data_path']}[{entry['index']}] ({entry['kind']})", 1, entry['ms'])
+                for entry in profile.get('drivers', [])]
+    else:
+        rows = [(group['name'], group['count'], group['ms']) for group in profile.get('groups', {}).get(grouping, [])]
+    
+    if sort == 'NAME':
+        return sorted(rows, key=lambda row: row[0].lower())
+    if sort == 'COUNT':
+        return sorted(rows, key=lambda row: (-row[1], -row[2]))
+    return sorted(rows, key=lambda row: -row[2])
+
+#---------------------------------------
+# Driver Dependency Graph
+#---------------------------------------
+# Nodes are driver owners as Blender's depsgraph sees them: (armature, bone) for pose bones,
+# (object,) for objects, and ('ID type:name', data_path) leaves for anything a source can't read.
+DRIVER_FANOUT_THRESHOLD = 8
+
+OBJECT_TRANSFORM_PATH_PATTERNS = (
+    re.compile(r'^bpy\.data\.objects\["([^"]+)"\]\.(location|rotation_euler|scale)\[(\d)\]$'),
+    re.compile(r'^([^\[\]"]+)\.(location|rotation_euler|scale)\[(\d)\]$'),
+)
+
+def format_graph_node(node):
+    return ":".join(node)
+
+def get_channel_label(node, prop, index):
+    transform = {'location': 'LOC', 'rotation_euler': 'ROT', 'scale': 'SCALE'}.get(prop)
+    channel = f"{transform} {'XYZ'[index]}" if transform and 0 <= index <= 2 else f"{prop}[{index}]"
+    return f"{format_graph_node(node)} {channel}"
+
+def get_driver_target_node(id_block, fcurve):
+    """Return (node, channel label) for what a driver writes."""
+    if isinstance(id_block, bpy.types.Object):
+        match = re.match(r'^pose\.bones\["(.+)"\]\.([a-z_]+)$', fcurve.data_path)
+        if match:
+            node = (id_block.name, match.group(1))
+            return node, get_channel_label(node, match.group(2), fcurve.array_index)
+        if fcurve.data_path in ('location', 'rotation_euler', 'scale'):
+            node = (id_block.name,)
+            return node, get_channel_label(node, fcurve.data_path, fcurve.array_index)
+    
+    node = (f"{type(id_block).__name__}:{id_block.name}", fcurve.data_path)
+    return node, f"{format_graph_node(node)}[{fcurve.array_index}]"
+
+def get_job_target_node(job):
+    """Return (node, channel label) for what a driver job from build_driver_jobs would write."""
+    if job['kind'] == 'bone':
+        node = (job['armature'], job['bone'])
+        return node, get_channel_label(node, job['property'], job['axis'])
+    if job['kind'] == 'shapekey':
+        node = (f"Key:{job['object']}", f'key_blocks["{job["shapekey"]}"].value')
+        return node, format_graph_node(node)
+    
+    for pattern in OBJECT_TRANSFORM_PATH_PATTERNS:
+        match = pattern.match(job['to_path'])
+        if match:
+            node = (match.group(1),)
+            return node, get_channel_label(node, match.group(2), int(match.group(3)))
+    node = ("Path", job['to_path'])
+    return node, job['to_path']
+
+def get_source_node(source):
+    """Return (node, channel label) for a source dict from get_driver_source."""
+    node = (source['armature_name'], source['owner']) if source['kind'] == 'bone' else (source['owner'],)
+    return node, get_channel_label(node, source['property'], source['axis'])
+
+def collect_driver_edges():
+    """Return one edge dict per EasyDriver driver: source/target node and channel labels."""
+    hubs = collect_hub_drivers()
+    edges = []
+    for id_block, fcurve, _ in iter_easydriver_drivers():
+        channel = get_driver_source_channel(fcurve)
+        hub_key = None if channel else get_hub_reader_key(fcurve)
+        if hub_key in hubs:
+            # Hub readers depend on the hub's source owner; fan-out is counted per hub
+            channel = hubs[hub_key]['channel']
+        elif not channel:
+            continue
+        
+        owner, is_bone, transform, index = channel
+        source_node = (owner.id_data.name, owner.name) if is_bone else (owner.name,)
+        source_channel = f"{format_graph_node(source_node)} {transform} {'XYZ'[index]}"
+        target_node, target_channel = get_driver_target_node(id_block, fcurve)
+        edges.append({
+            'source': source_node,
+            'source_channel': f"{source_channel} (hub)" if hub_key else source_channel,
+            'target': target_node,
+            'target_channel': target_channel,
+            'hub': hub_key is not None,
+        })
+    return edges
+
+def plan_driver_edges(source, jobs):
+    """Edges the given source and jobs would add when run through run_driver_jobs."""
+    source_node, source_channel = get_source_node(source)
+    edges = []
+    for job in jobs:
+        target_node, target_channel = get_job_target_node(job)
+        edges.append({'source': source_node, 'source_channel': source_channel,
+                      'target': target_node, 'target_channel': target_channel})
+    return edges
+
+def merge_planned_edges(edges, planned):
+    """Replace the existing drivers on planned target channels (createDriver removes them) and add the planned edges."""
+    replaced = {edge['target_channel'] for edge in planned}
+    return [edge for edge in edges if edge['target_channel'] not in replaced] + list(planned)
+
+def build_driver_graph(edges):
+    """Turn edges into {node: set of nodes it drives}, including nodes with no outgoing edges."""
+    graph = {}
+    for edge in edges:
+        graph.setdefault(edge['source'], set()).add(edge['target'])
+        graph.setdefault(edge['target'], set())
+    return graph
+
+def find_driver_cycles(graph):
+    """Return the strongly connected groups of nodes that form cycles (Tarjan, iterative)."""
+    index_of, lowlink, on_stack = {}, {}, set()
+    stack, cycles = [], []
+    counter = 0
+    
+    for root in graph:
+        if root in index_of:
+            continue
+        work = [(root, iter(sorted(graph[root])))]
+        index_of[root] = lowlink[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack.add(root)
+        
+        while work:
+            node, successors = work[-1]
+            advanced = False
+            for successor in successors:
+                if successor not in index_of:
+                    index_of[successor] = lowlink[successor] = counter
+                    counter += 1
+                    stack.append(successor)
+                    on_stack.add(successor)
+                    work.append((successor, iter(sorted(graph[successor]))))
+                    advanced = True
+                    break
+                if successor in on_stack:
+                    lowlink[node] = min(lowlink[node], index_of[successor])
+            if advanced:
+                continue
+            
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                lowlink[parent] = min(lowlink[parent], lowlink[node])
+            if lowlink[node] == index_of[node]:
+                component = []
+                while True:
+                    member = stack.pop()
+                    on_stack.discard(member)
+                    component.append(member)
+                    if member == node:
+                        break
+                if len(component) > 1 or node in graph[node]:
+                    cycles.append(sorted(component))
+    
+    return cycles
+
+def compute_chain_depths(graph, cycles=()):
+    """Return {node: longest chain of drivers starting at it}; nodes on or feeding a cycle are left out."""
+    cyclic = {node for cycle in cycles for node in cycle}
+    depths = {}
+    
+    def depth(node, visiting):
+        if node in depths:
+            return depths[node]
+        if node in cyclic or node in visiting:
+            return None
+        visiting.add(node)
+        result = 0
+        for successor in graph[node]:
+            successor_depth = depth(successor, visiting)
+            if successor_depth is None:
+                result = None
+                break
+            result = max(result, successor_depth + 1)
+        visiting.discard(node)
+        depths[node] = result
+        return result
+    
+    for node in graph:
+        depth(node, set())
+    return {node: value for node, value in depths.items() if value is not None}
+
+def analyze_driver_graph(edges, fanout_threshold=DRIVER_FANOUT_THRESHOLD):
+    """Report cycles, chain depth and per-source fan-out for a list of driver edges.
+
+    Fan-out counts the drivers reading each source channel: each one evaluates its own copy of
+    the same variable, so sources at or above fanout_threshold are hub candidates.
+    """
+    graph = build_driver_graph(edges)
+    cycles = find_driver_cycles(graph)
+    depths = compute_chain_depths(graph, cycles)
+    
+    fanout = {}
+    for edge in edges:
+        fanout.setdefault(edge['source_channel'], (edge['source'], edge.get('hub', False), []))[2].append(edge['target_channel'])
+    
+    sources = []
+    for channel, (node, is_hub, targets) in fanout.items():
+        sources.append({
+            'channel': channel,
+            'fanout': len(targets),
+            'depth': depths.get(node),
+            'hub_candidate': not is_hub and len(targets) >= fanout_threshold,
+        })
+    sources.sort(key=lambda entry: (-entry['fanout'], entry['channel']))
+    
+    return {
+        'drivers': len(edges),
+        'nodes': len(graph),
+        'cycles': [[format_graph_node(node) for node in cycle] for cycle in cycles],
+        'max_depth': max(depths.values(), default=0),
+        'sources': sources,
+    }
+
+def check_planned_cycles(plans):
+    """Return the cycles that creating drivers for [(source, jobs), ...] would introduce (existing cycles excluded)."""
+    edges = collect_driver_edges()
+    existing = {tuple(cycle) for cycle in find_driver_cycles(build_driver_graph(edges))}
+    planned_edges = [edge for source, jobs in plans for edge in plan_driver_edges(source, jobs)]
+    planned = find_driver_cycles(build_driver_graph(merge_planned_edges(edges, planned_edges)))
+    return [[format_graph_node(node) for node in cycle] for cycle in planned if tuple(cycle) not in existing]
+
+#---------------------------------------
+# Hub Properties
+#---------------------------------------
+# A hub is a 0-1 custom property on the source owner. One driver clamps and normalizes the
+# source channel into it, and every target reads the hub with a plain linear expression.
+# Hubs are keyed on the source range and clamp too, so setups reading the same channel over
+# different ranges (one slider driving +X and -X sets) each get their own hub.
+HUB_PROPERTY_PREFIX = "easydriver_hub"
+
+def get_hub_channel_name(source):
+    """Hub name of the source channel without the range key (the name hubs had before it)."""
+    transform = {'location': 'LOC', 'rotation_euler': 'ROT', 'scale': 'SCALE'}[source['property']]
+    return f"{HUB_PROPERTY_PREFIX}_{transform}_{'XYZ'[source['axis']]}"
+
+def get_hub_property_name(source, clamp=True):
+    mapping_key = f"{float(source['from_min'])!r}|{float(source['from_max'])!r}|{bool(clamp)}"
+    return f"{get_hub_channel_name(source)}_{zlib.crc32(mapping_key.encode()):08x}"
+
+def get_hub_data_path(source, name):
+    """Return (object, data path) of the hub property called name on the source owner."""
+    if source['kind'] == 'bone':
+        return bpy.data.objects[source['armature_name']], f'pose.bones["{source["owner"]}"]["{name}"]'
+    return bpy.data.objects[source['owner']], f'["{name}"]'
+
+def get_hub_path(source, clamp=True):
+    """Return (object, data path) of a source's hub property, as drivers address it."""
+    return get_hub_data_path(source, get_hub_property_name(source, clamp))
+
+def ensure_hub_property(source, clamp=True):
+    """Create the hub property on the source owner if needed and return its name."""
+    owner = get_source_owner(source)
+    name = get_hub_property_name(source, clamp)
+    if name not in owner:
+        owner[name] = 0.0
+    try:
+        owner.id_properties_ui(name).update(
+            min=0.0, max=1.0, soft_min=0.0, soft_max=1.0,
+            description=f"EasyDriver hub: {source['from_path']} from {source['from_min']} to {source['from_max']} normalized to 0-1"
+        )
+    except (AttributeError, TypeError) as e:
+        print(f"Could not set hub property range: {e}")
+    return name
+
+def create_hub_driver(source, clamp=True):
+    """Drive the source's hub property with the source channel mapped to 0-1. Returns the fcurve or None."""
+    ensure_hub_property(source, clamp)
+    hub_object, hub_path = get_hub_path(source, clamp)
+    
+    source_config = parse_source_path(source['from_path'], source['armature_name'])
+    if not source_config:
+        return None
+    
+    remove_existing_driver(hub_object, hub_path, -1)
+    fcurve = add_new_driver(hub_object, hub_path, -1)
+    if not fcurve or not configure_driver(fcurve, source_config, read_constrained=not clamp):
+        return None
+    fcurve.driver.expression = create_mapping_expression(source['from_min'], source['from_max'], 0.0, 1.0, clamp)
+    return fcurve
+
+def create_hub_target_driver(hub_object, hub_path, job):
+    """Drive one job's target from a hub property with an unclamped linear expression. Returns True on success."""
+    target_block, target_path, index = parse_target_path(job['to_path'])
+    if not target_block:
+        return False
+    
+    remove_existing_driver(target_block, target_path, index)
+    fcurve = add_new_driver(target_block, target_path, index)
+    if not fcurve:
+        return False
+    
+    driver = fcurve.driver
+    driver.type = 'SCRIPTED'
+    while len(driver.variables) > 0:
+        driver.variables.remove(driver.variables[0])
+    variable = driver.variables.new()
+    variable.name = "drv"
+    variable.type = 'SINGLE_PROP'
+    variable.targets[0].id = hub_object
+    variable.targets[0].data_path = hub_path
+    
+    # Same toMax buffer as createDriver, so the mapping reads back identically
+    driver.expression = create_mapping_expression(0.0, 1.0, job['to_min'], job['to_max'] + 0.0001, False)
+    return True
+
+def remove_unused_hubs(source, clamp=True):
+    """Remove the source channel's other hubs (older ranges, or unkeyed legacy names) that no driver reads.
+
+    A new range gets a new hub, so without this the old hub driver keeps evaluating every
+    frame with no readers. Returns the names of the removed properties.
+    """
+    owner = get_source_owner(source)
+    hub_channel = get_hub_channel_name(source)
+    keep = get_hub_property_name(source, clamp)
+    readers = get_hub_reader_keys()
+    
+    removed = []
+    for name in list(owner.keys()):
+        if name == keep or not (name == hub_channel or name.startswith(hub_channel + "_")):
+            continue
+        hub_object, hub_path = get_hub_data_path(source, name)
+        if (hub_object.name, hub_path) in readers:
+            continue
+        remove_existing_driver(hub_object, hub_path, -1)
+        del owner[name]
+        removed.append(name)
+    if removed:
+        print(f"✓ Removed unused hubs on {owner.name}: {', '.join(removed)}")
+    return removed
+
+def run_hub_driver_jobs(source, jobs, clamp=True):
+    """Create one hub driver for the source and a hub-reading driver per job. Returns the number of target drivers created."""
+    if not create_hub_driver(source, clamp):
+        print(f"ERROR: Could not create hub driver for {source['from_path']}")
+        return 0
+    
+    hub_object, hub_path = get_hub_path(source, clamp)
+    created = 0
+    for job in jobs:
+        try:
+            if create_hub_target_driver(hub_object, hub_path, job):
+                created += 1
+        except Exception as e:
+            print(f"Error creating hub driver for {job['to_path']}: {e}")
+    
+    # Only now have the targets moved off the hub they read before
+    remove_unused_hubs(source, clamp)
+    return created
+
+def collect_hub_drivers():
+    """Map (object name, hub data path) to the source channel and mapping of every hub driver."""
+    hubs = {}
+    for id_block, fcurve, mapping in iter_easydriver_drivers():
+        if HUB_PROPERTY_PREFIX not in fcurve.data_path:
+            continue
+        channel = get_driver_source_channel(fcurve)
+        if channel:
+            hubs[(id_block.name, fcurve.data_path)] = {'channel': channel, 'mapping': mapping, 'fcurve': fcurve}
+    return hubs
+
+def get_hub_reader_key(fcurve):
+    """Return the (object name, hub data path) a hub-reading driver reads, or None."""
+    variable = fcurve.driver.variables[0] if len(fcurve.driver.variables) == 1 else None
+    if not variable or variable.type != 'SINGLE_PROP':
+        return None
+    target = variable.targets[0]
+    if target.id is None or HUB_PROPERTY_PREFIX not in target.data_path:
+        return None
+    return target.id.name, target.data_path
+
+def get_hub_reader_keys(active_only=False):
+    """Return the set of (object name, hub data path) read by EasyDriver drivers, skipping muted ones if active_only."""
+    keys = set()
+    for _, fcurve, _ in iter_easydriver_drivers():
+        if active_only and fcurve.mute:
+            continue
+        key = get_hub_reader_key(fcurve)
+        if key:
+            keys.add(key)
+    return keys
+
+#---------------------------------------
+# Driver Baking
+#---------------------------------------
+def get_bake_ids(context, scope):
+    """Return the set of ID names whose drivers are baked: selected objects with their data and shape keys, or None for all."""
+    if scope != 'SELECTED':
+        return None
+    ids = set()
+    for obj in context.selected_objects:
+        ids.add(('Object', obj.name))
+        if obj.data:
+            ids.add((type(obj.data).__name__, obj.data.name))
+            shape_keys = getattr(obj.data, 'shape_keys', None)
+            if shape_keys:
+                ids.add(('Key', shape_keys.name))
+    return ids
+
+def collect_bake_jobs(ids=None):
+    """List the EasyDriver drivers to bake, resolving hub readers to their hub's source.
+
+    Returns dicts with the driver's id_block and fcurve, the source channel tuple from
+    get_driver_source_channel, the mappings to apply in order, whether the source is read
+    after constraints ('constrained') and the hub it reads ('hub_key', or None).
+    """
+    hubs = collect_hub_drivers()
+    jobs = []
+    for id_block, fcurve, mapping in iter_easydriver_drivers():
+        if ids is not None and (type(id_block).__name__, id_block.name) not in ids:
+            continue
+        if HUB_PROPERTY_PREFIX in fcurve.data_path:
+            continue
+        
+        hub_key = get_hub_reader_key(fcurve)
+        hub = hubs.get(hub_key)
+        channel = hub['channel'] if hub else get_driver_source_channel(fcurve)
+        if not channel:
+            continue
+        mappings = [hub['mapping'], mapping] if hub else [mapping]
+        source_fcurve = hub['fcurve'] if hub else fcurve
+        jobs.append({'id_block': id_block, 'fcurve': fcurve, 'channel': channel, 'mappings': mappings,
+                     'constrained': source_fcurve.driver.variables[0].type == 'TRANSFORMS',
+                     'hub_key': hub_key if hub else None})
+    return jobs
+
+def sample_bake_sources(scene, owners, frames, constrained=()):
+    """Sample the 9 transform channels of every owner over frames.
+
+    Owners whose channels are just their own F-curves are evaluated with NumPy; the rest
+    share a single frame_set pass. Keys in constrained are object owners read after their
+    constraints (CONSTRAINT-mode drivers), so any active constraint sends them to the scene
+    pass. Returns ({owner key: (n, 9) array}, fcurve count, scene count).
+    """
+    import numpy as np
+    
+    samples = {}
+    scene_owners = []
+    for key, owner in owners.items():
+        reads_constrained = key in constrained
+        if can_sample_from_fcurves(owner) and not (reads_constrained and has_active_constraints(owner)):
+            samples[key] = np.asarray(make_fcurve_channel_sampler(owner)(frames), dtype=float)
+        else:
+            scene_owners.append((key, owner, reads_constrained))
+    
+    if scene_owners:
+        readers = [(key, owner, get_channel_reader(owner, reads_constrained)) for key, owner, reads_constrained in scene_owners]
+        
+        rows = {key: [] for key, _, _ in scene_owners}
+        original_frame = scene.frame_current
+        try:
+            for frame in frames:
+                scene.frame_set(frame)
+                for key, owner, read in readers:
+                    rows[key].append(read(owner))
+        finally:
+            scene.frame_set(original_frame)
+        for key, values in rows.items():
+            samples[key] = np.asarray(values, dtype=float)
+    
+    return samples, len(owners) - len(scene_owners), len(scene_owners)
+
+def decimate_keys(frames, values, tolerance):
+    """Ramer-Douglas-Peucker over one channel: the indices of the keys to keep.
+
+    Error is measured along the value axis, which is what linear keyframe interpolation gets
+    wrong, so the kept keys reproduce every sample within tolerance. Segments are split
+    iteratively and each split is one vectorized NumPy pass over the segment.
+    """
+    import numpy as np
+    
+    count = len(values)
+    if count < 3 or tolerance <= 0.0:
+        return np.arange(count)
+    
+    frames = np.asarray(frames, dtype=float)
+    values = np.asarray(values, dtype=float)
+    
+    # Flat channels (e.g. a clamped mapping that never leaves its limit) need no search
+    if values.max() - values.min() <= tolerance:
+        return np.array([0, count - 1])
+    
+    keep = np.zeros(count, dtype=bool)
+    keep[0] = keep[-1] = True
+    stack = [(0, count - 1)]
+    while stack:
+        start, end = stack.pop()
+        if end - start < 2:
+            continue
+        span = slice(start + 1, end)
+        t = (frames[span] - frames[start]) / (frames[end] - frames[start])
+        error = np.abs(values[span] - (values[start] + t * (values[end] - values[start])))
+        worst = int(error.argmax())
+        if error[worst] > tolerance:
+            split = start + 1 + worst
+            keep[split] = True
+            stack.append((start, split))
+            stack.append((split, end))
+    
+    return np.flatnonzero(keep)
+
+def decimate_channels(frames, channels, tolerance):
+    """Decimate many baked channels sampled at the same frames.
+
+    Returns (list of kept index arrays, stats) where stats holds 'dense_keys', 'keys',
+    'ratio' (dense / kept) and 'max_error' (largest deviation of the linear keys from the samples).
+    """
+    import numpy as np
+    
+    frames = np.asarray(frames, dtype=float)
+    kept = []
+    max_error = 0.0
+    for values in channels:
+        keep = decimate_keys(frames, values, tolerance)
+        if len(keep) < len(values):
+            error = np.abs(np.interp(frames, frames[keep], values[keep]) - values).max()
+            max_error = max(max_error, float(error))
+        kept.append(keep)
+    
+    dense = len(frames) * len(channels)
+    keys = sum(len(keep) for keep in kept)
+    return kept, {'dense_keys': dense, 'keys': keys, 'ratio': dense / keys if keys else 1.0, 'max_error': max_error}
+
+def write_baked_fcurve(id_block, data_path, index, frames, values):
+    """Replace id_block's action F-curve for data_path[index] with linear keys at frames/values. Returns the key count."""
+    import numpy as np
+    
+    animation_data = id_block.animation_data or id_block.animation_data_create()
+    action = animation_data.action
+    if action is None:
+        action = bpy.data.actions.new(f"{id_block.name}_Baked")
+        animation_data.action = action
+    
+    existing = action.fcurves.find(data_path, index=index)
+    if existing:
+        action.fcurves.remove(existing)
+    fcurve = action.fcurves.new(data_path, index=index)
+    
+    count = len(frames)
+    co = np.empty(count * 2, dtype=np.float32)
+    co[0::2] = frames
+    co[1::2] = values
+    
+    keyframe_points = fcurve.keyframe_points
+    keyframe_points.add(count)
+    keyframe_points.foreach_set('co', co)
+    keyframe_points.foreach_set('handle_left', co)
+    keyframe_points.foreach_set('handle_right', co)
+    keyframe_points.foreach_set('interpolation', [KEYFRAME_INTERPOLATION_LINEAR] * count)
+    fcurve.update()
+    return count
+
+def release_baked_hubs(hub_keys, driver_action):
+    """Mute or remove the hub drivers in hub_keys that no unmuted EasyDriver driver reads any more.
+
+    REMOVE also deletes the hub property. Returns the number of hubs handled.
+    """
+    readers = get_hub_reader_keys(active_only=True)
+    handled = 0
+    for object_name, hub_path in hub_keys:
+        hub_object = bpy.data.objects.get(object_name)
+        if hub_object is None or (object_name, hub_path) in readers:
+            continue
+        if driver_action == 'MUTE':
+            fcurve = hub_object.animation_data.drivers.find(hub_path) if hub_object.animation_data else None
+            if fcurve:
+                fcurve.mute = True
+        else:
+            remove_existing_driver(hub_object, hub_path, -1)
+            # pose.bones["bone"]["name"] or ["name"]: the owner path and the property name
+            owner_path, name = hub_path[:hub_path.rindex('["')], hub_path[hub_path.rindex('["') + 2:-2]
+            owner = hub_object.path_resolve(owner_path) if owner_path else hub_object
+            if name in owner:
+                del owner[name]
+        handled += 1
+    return handled
+
+def bake_easydriver_drivers(scene, frame_start, frame_end, ids=None, tolerance=0.0, driver_action='MUTE'):
+    """Bake EasyDriver drivers to keyframes over a frame range.
+
+    Sources are sampled once per owner and pushed through the driver mappings with NumPy.
+    All channels are then decimated within tolerance (see decimate_channels), keys are written
+    in bulk, and the drivers are muted ('MUTE'), removed ('REMOVE') or left alone ('KEEP').
+    Hub drivers left with no active reader get the same treatment. Returns a report dict.
+    """
+    import numpy as np
+    
+    start_time = time.perf_counter()
+    jobs = collect_bake_jobs(ids)
+    report = {'drivers': len(jobs), 'keys': 0, 'dense_keys': 0, 'ratio': 1.0, 'max_error': 0.0,
+              'fcurve_sources': 0, 'scene_sources': 0, 'hubs': 0}
+    if not jobs:
+        return report
+    
+    frames = np.arange(frame_start, frame_end + 1, dtype=float)
+    
+    owners = {}
+    constrained = set()
+    for job in jobs:
+        owner, is_bone = job['channel'][0], job['channel'][1]
+        # An object read both raw and post-constraint is sampled once per read
+        job['owner_key'] = (owner.id_data.name, owner.name) if is_bone else (owner.name, job['constrained'])
+        owners[job['owner_key']] = owner
+        if not is_bone and job['constrained']:
+            constrained.add(job['owner_key'])
+    
+    samples, report['fcurve_sources'], report['scene_sources'] = sample_bake_sources(scene, owners, list(frames), constrained)
+    
+    channels = []
+    for job in jobs:
+        _, _, transform, index = job['channel']
+        column = ('LOC', 'ROT', 'SCALE').index(transform) * 3 + index
+        values = samples[job['owner_key']][:, column]
+        for mapping in job['mappings']:
+            values = apply_mapping_array(values, mapping)
+        
+        # Keyframes or modifiers on the driver curve remap its output
+        fcurve = job['fcurve']
+        if not fcurve_is_identity(fcurve):
+            values = np.array([fcurve.evaluate(value) for value in values])
+        channels.append(values)
+    
+    # Decimate every channel before anything is written
+    kept, stats = decimate_channels(frames, channels, tolerance)
+    report.update(stats)
+    
+    for job, values, keep in zip(jobs, channels, kept):
+        fcurve = job['fcurve']
+        write_baked_fcurve(job['id_block'], fcurve.data_path, fcurve.array_index, frames[keep], values[keep])
+    
+    for job in jobs:
+        if driver_action == 'MUTE':
+            job['fcurve'].mute = True
+        elif driver_action == 'REMOVE':
+            data_path, index = job['fcurve'].data_path, job['fcurve'].array_index
+            try:
+                job['id_block'].driver_remove(data_path, index)
+            except TypeError:
+                # Drivers on non-array properties are removed without an index
+                job['id_block'].driver_remove(data_path)
+    
+    # A hub driver keeps evaluating every frame once its readers are baked
+    if driver_action in ('MUTE', 'REMOVE'):
+        report['hubs'] = release_baked_hubs({job['hub_key'] for job in jobs if job['hub_key']}, driver_action)
+    
+    bpy.context.view_layer.update()
+    report['elapsed_ms'] = (time.perf_counter() - start_time) * 1000.0
+    return report
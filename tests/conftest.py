@@ -0,0 +1,7 @@
+"""Put the add-on folder on sys.path so tests import core directly, without Blender."""
+import os
+import sys
+
+ADDON_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ADDON_DIR not in sys.path:
+    sys.path.insert(0, ADDON_DIR)
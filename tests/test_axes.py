@@ -0,0 +1,24 @@
+import pytest
+
+from core import parse_axis_info, parse_channel, channel_name
+
+@pytest.mark.parametrize("axis_string, expected", [
+    ("LOC X", {'transform': 'LOC', 'axis': 'X', 'index': 0}),
+    ("ROT Y", {'transform': 'ROT', 'axis': 'Y', 'index': 1}),
+    ("SCALE Z", {'transform': 'SCALE', 'axis': 'Z', 'index': 2}),
+])
+def test_parse_axis_info(axis_string, expected):
+    assert parse_axis_info(axis_string) == expected
+
+@pytest.mark.parametrize("axis_string", [None, "", "LOC", "LOC W", "LOC X Y"])
+def test_parse_axis_info_rejects(axis_string):
+    assert parse_axis_info(axis_string) is None
+
+def test_parse_channel():
+    assert parse_channel("ROT Z") == ('rotation_euler', 2)
+    assert parse_channel("FOO X") is None
+    assert parse_channel(None) is None
+
+@pytest.mark.parametrize("channel", ["LOC X", "ROT Y", "SCALE Z"])
+def test_channel_name_round_trip(channel):
+    assert channel_name(*parse_channel(channel)) == channel
@@ -0,0 +1,30 @@
+from core import detect_significant_changes, build_detected_changes
+
+REST = {'location': [0.0, 0.0, 0.0], 'rotation': [0.0, 0.0, 0.0], 'scale': [1.0, 1.0, 1.0]}
+
+def pose(location=(0.0, 0.0, 0.0), rotation=(0.0, 0.0, 0.0), scale=(1.0, 1.0, 1.0)):
+    return {'location': list(location), 'rotation': list(rotation), 'scale': list(scale)}
+
+def test_no_changes():
+    assert detect_significant_changes(REST, pose()) == []
+
+def test_changes_in_channel_order():
+    changes = detect_significant_changes(REST, pose(location=(0.0, 0.5, 0.0), rotation=(0.3, 0.0, 0.0), scale=(1.0, 1.0, 2.0)))
+    assert changes == [
+        ('location', 1, 0.0, 0.5),
+        ('rotation_euler', 0, 0.0, 0.3),
+        ('scale', 2, 1.0, 2.0),
+    ]
+
+def test_thresholds():
+    # Just below each default threshold
+    assert detect_significant_changes(REST, pose(location=(0.0009, 0, 0), rotation=(0.059, 0, 0), scale=(1.009, 1, 1))) == []
+    changes = detect_significant_changes(REST, pose(location=(0.0009, 0, 0)), threshold_loc=0.0001)
+    assert changes == [('location', 0, 0.0, 0.0009)]
+
+def test_decreasing_values():
+    assert detect_significant_changes(pose(location=(1.0, 0, 0)), REST) == [('location', 0, 1.0, 0.0)]
+
+def test_build_detected_changes():
+    assert build_detected_changes(REST, pose(rotation=(0.0, 0.0, -0.5))) == [{
+        'type': 'rotation_euler', 'axis': 2, 'display': "ROT Z", 'min_val': 0.0, 'max_val': -0.5}]
@@ -0,0 +1,44 @@
+import pytest
+
+from core import create_mapping_expression, parse_mapping_expression, apply_mapping
+
+RANGES = [
+    (0.0, 1.0, 0.0, 1.0),
+    (0.0, 0.05, 0.0, 0.4),
+    (1.0, -1.0, 0.0, 2.0),
+    (-0.25, 0.75, 1.0, -1.0),
+    (0.0, 1e-05, 2.5e-07, 3.0),
+]
+
+@pytest.mark.parametrize("clamp", [True, False])
+@pytest.mark.parametrize("from_min, from_max, to_min, to_max", RANGES)
+def test_round_trip(from_min, from_max, to_min, to_max, clamp):
+    expression = create_mapping_expression(from_min, from_max, to_min, to_max, clamp)
+    mapping = parse_mapping_expression(expression)
+    assert mapping == {
+        'from_min': from_min, 'from_max': from_max,
+        'to_min': to_min, 'to_max': to_max,
+        'clamped': clamp,
+    }
+
+@pytest.mark.parametrize("clamp", [True, False])
+@pytest.mark.parametrize("from_min, from_max, to_min, to_max", RANGES)
+def test_mapping_matches_expression(from_min, from_max, to_min, to_max, clamp):
+    expression = create_mapping_expression(from_min, from_max, to_min, to_max, clamp)
+    mapping = parse_mapping_expression(expression)
+    low, high = min(from_min, from_max), max(from_min, from_max)
+    for value in (low - 1.0, low, (low + high) / 2.0, high, high + 1.0):
+        expected = eval(expression, {'max': max, 'min': min, 'drv': value})
+        assert apply_mapping(value, mapping) == pytest.approx(expected)
+
+def test_clamp_limits_output():
+    mapping = parse_mapping_expression(create_mapping_expression(0.0, 1.0, 0.0, 2.0))
+    assert apply_mapping(5.0, mapping) == pytest.approx(2.0)
+    assert apply_mapping(-5.0, mapping) == pytest.approx(0.0)
+
+def test_empty_source_range():
+    assert create_mapping_expression(1.0, 1.0, 0.0, 1.0) is None
+
+@pytest.mark.parametrize("expression", ["", "drv", "drv * 2", "(0.0 + ((var - (0.0)) * (1.0 - (0.0)) / (1.0 - (0.0))))"])
+def test_parse_rejects_other_expressions(expression):
+    assert parse_mapping_expression(expression) is None
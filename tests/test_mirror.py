@@ -0,0 +1,30 @@
+import pytest
+
+from core import get_mirrored_name, get_mirrored_names
+
+@pytest.mark.parametrize("name, expected", [
+    ("hand.L", "hand.R"),
+    ("hand.R", "hand.L"),
+    ("arm_Left", "arm_Right"),
+    ("L_eye", "R_eye"),
+    ("Left.thumb", "Right.thumb"),
+    ("brow_l", "brow_r"),
+    ("foot-lf", "foot-rt"),
+    ("cheek(L)", "cheek(R)"),
+])
+def test_mirrored_name(name, expected):
+    assert get_mirrored_name(name) == expected
+
+@pytest.mark.parametrize("name", ["hand.L", "arm_Left", "L_eye", "brow_l", "cheek(L)"])
+def test_mirroring_twice_returns_the_name(name):
+    assert get_mirrored_name(get_mirrored_name(name)) == name
+
+@pytest.mark.parametrize("name", ["", "spine", "neck_01"])
+def test_unsided_names(name):
+    assert get_mirrored_name(name) is None
+
+def test_suffix_wins_over_prefix():
+    assert get_mirrored_name("L_arm.R") == "L_arm.L"
+
+def test_mirrored_names():
+    assert get_mirrored_names(["hand.L", "spine"]) == {"hand.L": "hand.R", "spine": None}
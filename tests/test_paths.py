@@ -0,0 +1,70 @@
+import pytest
+
+from core import TARGET_PATH_PATTERNS, match_target_path, match_transform_channel, match_source_path, extract_array_index
+
+# One path per supported form, with the handler it must reach
+PATH_FORMS = [
+    ('colorramp_long', 'bpy.data.materials["Mat"].node_tree.nodes["Color Ramp"].color_ramp.elements[1].position',
+     ('Mat', 'Color Ramp', '1', 'position')),
+    ('material_node_long', 'bpy.data.materials["Mat"].node_tree.nodes["Principled BSDF"].inputs[2].default_value',
+     ('Mat', 'Principled BSDF', '2')),
+    ('constraint_long', 'bpy.data.objects["Ctrl"].constraints["Copy Location"].influence',
+     ('Ctrl', 'Copy Location', 'influence')),
+    ('shapekey_long', 'bpy.data.objects["Face"].data.shape_keys.key_blocks["smile.L"].value',
+     ('Face', 'smile.L')),
+    ('bone_long', 'bpy.data.objects["Rig"].pose.bones["arm.L"].rotation_euler[0]',
+     ('Rig', 'arm.L', 'rotation_euler', '0')),
+    ('object_custom_prop_long', 'bpy.data.objects["Ctrl"]["switch"]',
+     ('Ctrl', 'switch')),
+    ('camera_long', 'bpy.data.cameras["Cam"].lens', ('Cam', 'lens')),
+    ('light_long', 'bpy.data.lights["Lamp"].energy', ('Lamp', 'energy')),
+    ('material_long', 'bpy.data.materials["Mat"].diffuse_color[0]', ('Mat', 'diffuse_color[0]')),
+    ('armature_long', 'bpy.data.armatures["Rig"].display_type', ('Rig', 'display_type')),
+    ('object_long', 'bpy.data.objects["Ctrl"].location[2]', ('Ctrl', 'location[2]')),
+    ('shapekey_short', 'Face.data.shape_keys.key_blocks["smile.R"].value', ('Face', 'smile.R')),
+    ('bone_short', 'Rig.pose.bones["arm.R"].location[1]', ('Rig', 'arm.R', 'location', '1')),
+    ('constraint_short', 'Ctrl.constraints["Copy Location"].influence', ('Ctrl', 'Copy Location', 'influence')),
+    ('material_node_short', 'Mat.node_tree.nodes["Principled BSDF"].inputs[0].default_value',
+     ('Mat', 'Principled BSDF', '0')),
+    ('custom_prop_short', 'Ctrl["switch"]', ('Ctrl', 'switch')),
+    ('general_short', 'Ctrl.scale[1]', ('Ctrl', 'scale[1]')),
+]
+
+def test_every_form_is_covered():
+    assert sorted(form for form, _, _ in PATH_FORMS) == sorted(handler for _, handler, _ in TARGET_PATH_PATTERNS)
+
+@pytest.mark.parametrize("handler_name, path, groups", PATH_FORMS, ids=[form for form, _, _ in PATH_FORMS])
+def test_match_target_path(handler_name, path, groups):
+    matched = match_target_path(path)
+    assert matched is not None
+    assert matched[0] == handler_name
+    assert matched[1] == groups
+
+def test_long_paths_skip_short_patterns():
+    # Not a known bpy.data collection, so only a short pattern could match it
+    assert match_target_path('bpy.data.worlds["World"].color') is None
+
+def test_unsupported_path():
+    assert match_target_path('no_dot_here') is None
+
+@pytest.mark.parametrize("path, expected", [
+    ('Rig.pose.bones["arm.L"].location[0]', ('location', 0)),
+    ('bpy.data.objects["Rig"].pose.bones["arm.L"].rotation_euler[2]', ('rotation_euler', 2)),
+    ('bpy.data.objects["Ctrl"].scale[1]', ('scale', 1)),
+    ('Ctrl.location[2]', ('location', 2)),
+    ('Rig.pose.bones["arm.L"]["prop"]', None),
+    ('Face.data.shape_keys.key_blocks["smile.L"].value', None),
+])
+def test_match_transform_channel(path, expected):
+    assert match_transform_channel(path) == expected
+
+def test_match_source_path():
+    assert match_source_path('Rig.pose.bones["jaw"].location[2]') == {
+        'type': 'bone', 'armature_path': 'Rig', 'bone_name': 'jaw', 'property': 'location', 'index': 2}
+    assert match_source_path('Empty.rotation_euler[0]') == {
+        'type': 'object', 'object_name': 'Empty', 'property': 'rotation_euler', 'index': 0}
+    assert match_source_path('Empty.location') is None
+
+def test_extract_array_index():
+    assert extract_array_index('nodes["n"].color[2]') == ('nodes["n"].color', 2)
+    assert extract_array_index('lens') == ('lens', -1)
@@ -1,7 +1,9 @@
 import bpy
 from .core_functions import (
-    get_to_bones_data, get_shapekey_list_data, get_path_list_data, auto_detect_path_type
+    get_to_bones_data, get_shapekey_list_data, get_path_list_data, auto_detect_path_type,
+    list_pose_snapshots, POSE_RESTORE_PROP, get_profile_rows
 )
+import json
 
 #---------------------------------------
 # Version compatibility helpers
@@ -77,6 +79,9 @@ class BONEMINMAX_PT_main_panel(bpy.types.Panel):
         
         # ACTIONS PANEL
         self.draw_actions_panel(layout, props, context)
+        
+        # PROFILER PANEL
+        self.draw_profiler_panel(layout, props)
 
     #---------------------------------------
     # Panels
@@ -114,6 +119,9 @@ class BONEMINMAX_PT_main_panel(bpy.types.Panel):
         # Content
         col = box.column()
         
+        # Channel values or evaluated (visual) pose when recording bones
+        col.row(align=True).prop(props, "recording_mode", expand=True)
+        
         # Record buttons (no source type selection needed)
         row = col.row(align=True)
         row.scale_y = 1.2
@@ -123,9 +131,12 @@ class BONEMINMAX_PT_main_panel(bpy.types.Panel):
                     icon=icons['socket_on'] if has_min else icons['socket_off'])
         row.operator("anim.record_from_max", text="Record Max", 
                     icon=icons['socket_on'] if has_max else icons['socket_off'])
-        
+
+        # Derive MIN/MAX from an existing animation
+        col.operator("anim.record_from_action", text="Record From Action", icon='ACTION')
+
         col.separator(factor=0.5)
-        
+
         # Status display - show appropriate info based on what's recorded
         if props.from_bone or props.from_object:
             info = col.box()
@@ -265,7 +276,7 @@ class BONEMINMAX_PT_main_panel(bpy.types.Panel):
         
         # Target-specific UI
         if props.target_type == 'CUSTOM_POSE':
-            self.draw_pose_targets(col, props)
+            self.draw_pose_targets(col, props, context)
         elif props.target_type == 'SHAPEKEY_LIST':
             self.draw_shapekey_targets(col, props)
         elif props.target_type == 'PATH_LIST':
@@ -296,6 +307,14 @@ class BONEMINMAX_PT_main_panel(bpy.types.Panel):
         create_row = col.row()
         create_row.enabled = bool(can_create)
         create_row.operator("anim.create_drivers", text="Create Drivers", icon=icons['plus'])
+        create_row.operator("anim.create_drivers_mirrored", text="", icon='MOD_MIRROR')
+        
+        clamp_row = col.row(align=True)
+        clamp_row.scale_y = 1.0
+        clamp_row.prop(props, "clamp_mode", expand=True)
+        clamp_row.operator("anim.clamp_cost_report", text="", icon='TIME')
+        clamp_row.operator("anim.optimize_drivers", text="", icon='MODIFIER')
+        col.prop(props, "use_hub_property", icon='OUTLINER_DATA_EMPTY')
         
         # Constraint buttons section - side by side
         col.separator(factor=0.5)
@@ -309,16 +328,71 @@ class BONEMINMAX_PT_main_panel(bpy.types.Panel):
         # Limit All Transforms button  
         constraint_row.operator("object.limit_source_transforms", text="Lock Recorded", icon=icons['constraint'])
         
+        lock_row = col.row(align=True)
+        lock_row.scale_y = 1.0
+        lock_row.enabled = bool(source_ready)
+        lock_row.prop(props, "one_axis_lock_method", text="")
+        
+        # Limit every EasyDriver source in the file in one pass
+        batch_row = col.row(align=True)
+        batch_row.operator("object.limit_sources_batch", text="Limit All Sources", icon=icons['constraint']).scope = 'FILE'
+        batch_row.operator("object.consolidate_limits", text="Consolidate", icon='FILTER').scope = 'FILE'
+        
+        # Portable setup specs
+        spec_row = col.row(align=True)
+        spec_row.operator("anim.export_driver_spec", text="Export Spec", icon='EXPORT')
+        spec_row.operator("anim.import_driver_spec", text="Import Spec", icon='IMPORT')
+        col.operator("anim.apply_driver_preset", text="Apply To Characters", icon='COMMUNITY')
+        
         col.separator(factor=0.5)
         
         # Remove button
-        col.operator("anim.remove_drivers", text="Remove Drivers", icon=icons['remove'])
+        remove_row = col.row(align=True)
+        remove_row.operator("anim.remove_drivers", text="Remove Drivers", icon=icons['remove'])
+        remove_row.operator("anim.bake_drivers", text="Bake", icon='ACTION')
 
     #---------------------------------------
     # UI elements
     #---------------------------------------
 
 
+    def draw_profiler_panel(self, layout, props):
+        """Draw the driver profiler and its results table."""
+        box = layout.box()
+        header = box.row()
+        header.prop(props, "show_profiler", icon='TRIA_DOWN' if props.show_profiler else 'TRIA_RIGHT', emboss=False)
+        header.operator("anim.driver_graph_report", text="", icon='NODETREE')
+        header.operator("anim.profile_drivers", text="", icon='TIME')
+        if not props.show_profiler:
+            return
+        
+        try:
+            profile = json.loads(props.profile_data or "{}")
+        except ValueError:
+            profile = {}
+        if not profile:
+            box.label(text="Run the profiler to see driver costs", icon='INFO')
+            return
+        
+        driver_ms = profile['ms_unmuted'] - profile['ms_all_muted']
+        easydriver_ms = profile['ms_unmuted'] - profile['ms_easydriver_muted']
+        col = box.column(align=True)
+        col.label(text=f"Frame: {profile['ms_unmuted']:.3f} ms, drivers: {driver_ms:.3f} ms")
+        col.label(text=f"EasyDriver drivers: {easydriver_ms:.3f} ms ({len(profile['drivers'])} drivers profiled)")
+        
+        row = box.row(align=True)
+        row.prop(props, "profile_group", text="")
+        row.prop(props, "profile_sort", text="")
+        row.prop(props, "profile_rows", text="")
+        
+        table = box.column(align=True)
+        for name, count, ms in get_profile_rows(profile, props.profile_group, props.profile_sort)[:props.profile_rows]:
+            split = table.split(factor=0.7)
+            split.label(text=name if props.profile_group == 'driver' else f"{name} ({count})")
+            split.label(text=f"{ms:.3f} ms")
+        
+        box.operator("anim.export_driver_profile", text="Export JSON", icon='EXPORT')
+    
     def draw_path_targets(self, layout, props, context):
         """Draw custom path target controls."""
         icons = get_version_compatible_icons()
@@ -429,7 +503,7 @@ class BONEMINMAX_PT_main_panel(bpy.types.Panel):
 
 
 
-    def draw_pose_targets(self, layout, props):
+    def draw_pose_targets(self, layout, props, context):
         """Draw pose target controls."""
         icons = get_version_compatible_icons()
         
@@ -454,6 +528,8 @@ class BONEMINMAX_PT_main_panel(bpy.types.Panel):
         row.operator("pose.record_to_max_pose", text="Record Max Pose", 
                     icon=icons['socket_on'] if has_max else icons['socket_off'])
         
+        self.draw_pose_snapshots(layout, props, context)
+        
         # Target list
         to_data = get_to_bones_data(props)
         if to_data:
@@ -461,6 +537,8 @@ class BONEMINMAX_PT_main_panel(bpy.types.Panel):
             
             list_box = layout.box()
             list_box.label(text="Bones:", icon='OUTLINER_DATA_ARMATURE')
+            # Used to pair bones by position when names have no left/right pattern
+            list_box.prop(props, "mirror_tolerance")
             
             for bone_name, bone_data in to_data.items():
                 if bone_data.get('has_min') and bone_data.get('has_max'):
@@ -481,6 +559,37 @@ class BONEMINMAX_PT_main_panel(bpy.types.Panel):
                     op = row.operator("pose.remove_pose_bone", text="", icon='X')
                     op.bone_name = bone_name
 
+    def draw_pose_snapshots(self, layout, props, context):
+        """Draw the pose snapshot library for the active armature."""
+        icons = get_version_compatible_icons()
+        obj = context.object
+        if not obj or obj.type != 'ARMATURE':
+            return
+        
+        snapshot_box = layout.box()
+        snapshot_box.label(text="Pose Snapshots:", icon='OUTLINER_OB_GROUP_INSTANCE')
+        
+        row = snapshot_box.row(align=True)
+        row.prop(props, "snapshot_name", text="")
+        row.operator("pose.snapshot_capture", text="", icon=icons['plus'])
+        
+        if not list_pose_snapshots(obj):
+            return
+        
+        row = snapshot_box.row(align=True)
+        row.prop(props, "snapshot_active", text="")
+        row.operator("pose.snapshot_delete", text="", icon=icons['trash'])
+        
+        row = snapshot_box.row(align=True)
+        row.prop(props, "snapshot_blend", slider=True)
+        row.operator("pose.snapshot_apply", text="Apply")
+        if POSE_RESTORE_PROP in obj:
+            row.operator("pose.snapshot_restore", text="", icon='LOOP_BACK')
+        
+        row = snapshot_box.row(align=True)
+        row.operator("pose.snapshot_to_targets", text="Use as Min").slot = 'MIN'
+        row.operator("pose.snapshot_to_targets", text="Use as Max").slot = 'MAX'
+
     def draw_shapekey_targets(self, layout, props):
         """Draw shapekey target controls."""
         icons = get_version_compatible_icons()
@@ -528,6 +637,11 @@ class BONEMINMAX_PT_main_panel(bpy.types.Panel):
             
             list_box = layout.box()
             list_box.label(text="Shape Keys:", icon='SHAPEKEY_DATA')
+            # How Mirror Targets finds the opposite shape keys
+            row = list_box.row(align=True)
+            row.prop(props, "shapekey_mirror_mode", expand=True)
+            if props.shapekey_mirror_mode != 'NAME':
+                list_box.prop(props, "mirror_tolerance")
             
             for key, sk_data in shapekey_data.items():
                 row = list_box.row()